@@ -0,0 +1,22 @@
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.compute_time_range import compute_time_range
+from Codebase.Dashboard.SupportMethods.parse_special_value import parse_special_value
+from Codebase.DataManager.file_catalog import get_file_catalog
+
+
+def compute_data_time_range(dtype, special, df):
+    """
+    Full extent of a role's data for the date-range sync, in compute_time_range's format.
+
+    Taken from the catalog's per-file start/end times rather than from `df`, which only holds the
+    rows loaded for the picked window (plus padding); syncing to that would drift with every sync.
+    Falls back to the frame's own range if none of the role's files has a recorded range yet.
+    """
+    instance_id, _ = parse_special_value(special)
+    extent = get_file_catalog().time_extent(dtype, instance_id)
+    if extent is None:
+        return compute_time_range(df)
+    start, end = extent
+    return {
+        "min": start.strftime("%Y-%m-%d"),
+        "max": end.strftime("%Y-%m-%d")
+    }
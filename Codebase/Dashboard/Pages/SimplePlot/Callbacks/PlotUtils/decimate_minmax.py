@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+# Assumed drawable width of the plot. Each pixel column keeps its min and max sample,
+# so a trace never carries more than 2 * DEFAULT_PLOT_WIDTH_PX points to the browser.
+DEFAULT_PLOT_WIDTH_PX = 1600
+
+
+def decimate_minmax(df, x_col, y_col, x_range=None, pixel_width=DEFAULT_PLOT_WIDTH_PX):
+    """
+    Return the (x, y) arrays of one trace, reduced to the min and max sample per pixel column.
+
+    Args:
+        df (pd.DataFrame): Frame sorted by x_col.
+        x_col (str): Datetime column.
+        y_col (str): Value column; NaN rows are dropped.
+        x_range (tuple, optional): (start, end) of the visible window. Only samples inside it
+                                   are considered, so zooming in re-decimates at a finer scale.
+        pixel_width (int): Number of pixel columns (buckets) across the window.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: x and y in time order. Windows holding no more than
+        2 * pixel_width samples are returned at raw resolution.
+    """
+    sub = df[[x_col, y_col]].dropna()
+    x = sub[x_col].to_numpy()
+    y = sub[y_col].to_numpy()
+
+    if x_range is not None:
+        lo = np.searchsorted(x, pd.Timestamp(x_range[0]).to_datetime64(), side="left")
+        hi = np.searchsorted(x, pd.Timestamp(x_range[1]).to_datetime64(), side="right")
+        x, y = x[lo:hi], y[lo:hi]
+
+    if len(x) <= 2 * pixel_width:
+        return x, y
+
+    ticks = x.astype("datetime64[ns]").astype(np.int64)
+    span = max(ticks[-1] - ticks[0], 1)
+    buckets = ((ticks - ticks[0]) / span * pixel_width).astype(np.int64)
+    np.clip(buckets, 0, pixel_width - 1, out=buckets)
+
+    # Sort by (bucket, value): the first row of each bucket is its min, the last its max
+    order = np.lexsort((y, buckets))
+    sorted_buckets = buckets[order]
+    starts = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+    ends = np.r_[starts[1:], len(order)] - 1
+
+    keep = np.unique(np.concatenate([order[starts], order[ends]]))
+    return x[keep], y[keep]
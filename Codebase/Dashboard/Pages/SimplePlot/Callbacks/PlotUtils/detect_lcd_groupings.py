@@ -1,28 +1,23 @@
-import pandas as pd
-
 from functools import reduce
 
-from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.extract_df import extract_df
 
+def detect_lcd_groupings(prepared):
+    """
+    Args:
+        prepared (dict): Output of prepare_role_series().
 
-def detect_lcd_groupings(roles, loader):
+    Returns:
+        tuple[dict, int | None]: Base sampling interval (seconds) per role, and the least common
+        multiple of those intervals (None if no role has one).
+    """
     base_by_role = {}
     detected_intervals = []
 
-    for role, (dtype, col, special) in roles.items():
-        dfs = extract_df(loader, dtype, col, special, role_label=role)
-        if not dfs:
-            continue
-        df = pd.concat(dfs).dropna()
-        df["datetime"] = pd.to_datetime(df["datetime"], errors="coerce").dt.tz_localize(None)
-        df = df.sort_values("datetime")
-        if len(df) >= 2:
-            diffs = df["datetime"].diff().dt.total_seconds().dropna()
-            diffs = diffs[diffs > 0.1]
-            if not diffs.empty:
-                sec = int(round(diffs.min()))
-                base_by_role[role] = sec
-                detected_intervals.append(sec)
+    for role, series in prepared.items():
+        sec = series["base"]
+        if sec:
+            base_by_role[role] = sec
+            detected_intervals.append(sec)
 
     def compute_lcd(values):
         def gcd_pair(x, y): return x if y == 0 else gcd_pair(y, x % y)
@@ -30,4 +25,4 @@ def detect_lcd_groupings(roles, loader):
         return reduce(lcm_pair, values)
 
     lcd = compute_lcd(detected_intervals) if detected_intervals else None
-    return base_by_role, lcd
\ No newline at end of file
+    return base_by_role, lcd
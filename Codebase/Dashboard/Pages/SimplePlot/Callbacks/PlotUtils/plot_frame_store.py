@@ -0,0 +1,37 @@
+import threading
+import uuid
+from collections import OrderedDict
+
+# Number of recent plots whose full-resolution frame is kept for zoom re-decimation.
+MAX_STORED_PLOTS = 16
+
+_frames = OrderedDict()
+_lock = threading.Lock()
+
+
+def store_plot_frame(df, trace_columns) -> str:
+    """
+    Keep the full-resolution frame behind a rendered plot on the server.
+
+    Args:
+        df (pd.DataFrame): The plotted frame, sorted by "datetime".
+        trace_columns (list[str]): Value column of each trace, in figure trace order.
+
+    Returns:
+        str: Token to put in the browser-side store instead of the data itself.
+    """
+    token = uuid.uuid4().hex
+    with _lock:
+        _frames[token] = (df, trace_columns)
+        while len(_frames) > MAX_STORED_PLOTS:
+            _frames.popitem(last=False)
+    return token
+
+
+def get_plot_frame(token):
+    """Return (df, trace_columns) for a token, or None if it expired."""
+    with _lock:
+        entry = _frames.get(token)
+        if entry is not None:
+            _frames.move_to_end(token)
+        return entry
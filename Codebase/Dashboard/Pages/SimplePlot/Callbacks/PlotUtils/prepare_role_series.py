@@ -0,0 +1,48 @@
+from Codebase.Dashboard.SupportMethods.parse_special_value import parse_special_value
+from Codebase.DataManager.compact_series_store import CompactSeries
+
+
+def prepare_role_series(loader, roles):
+    """
+    Build each role's series once per request from the loader's compact store. Grouping detection,
+    filtering, resampling and range computation all work from this result instead of re-extracting
+    the data.
+
+    Series in loader.series are already concatenated and sorted, so a role backed by a single
+    special key is handed out as a zero-copy view; only roles spanning several special keys
+    are merged.
+
+    Args:
+        loader: DataLoader with the roles' data in loader.series (see restore_loader).
+        roles (dict): {"y1": (data_type, column, special), ...}
+
+    Returns:
+        dict: {"y1": {"df": pd.DataFrame(datetime, "y1::<col>::<instance>"), "base": int | None}, ...}
+              "datetime" is naive UTC. "base" is the smallest spacing between samples in whole seconds.
+              Roles without data are left out.
+    """
+    prepared = {}
+
+    for role, (dtype, col, special) in roles.items():
+        if not dtype or not col:
+            continue
+        if dtype in ["tvws", "soil"] and not special:
+            continue
+
+        special_instance_id, _ = parse_special_value(special)
+        instance_filter = None
+        if dtype in ["tvws", "soil"]:
+            instance_filter = lambda instance_key: str(special_instance_id) in str(instance_key)
+
+        found = loader.series.find(dtype, col, instance_filter)
+        found = {key: series for key, series in found.items() if len(series)}
+        if not found:
+            continue
+
+        instance_key = sorted(found)[0][0]
+        series = CompactSeries.merge(found[key] for key in sorted(found))
+        label = f"{role}::{col}::{instance_key or 'unknown'}"
+
+        prepared[role] = {"df": series.to_frame(label), "base": series.base_interval()}
+
+    return prepared
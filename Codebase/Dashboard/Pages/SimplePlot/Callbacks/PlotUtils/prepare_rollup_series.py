@@ -0,0 +1,59 @@
+from Codebase.Dashboard.SupportMethods.loaded_data_cache import get_loaded_data_cache
+from Codebase.Dashboard.SupportMethods.parse_special_value import parse_special_value
+from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
+from Codebase.DataManager.Rollups.load_rollup_series import load_rollup_series
+from Codebase.DataManager.Rollups.select_rollup_tier import select_rollup_tier
+from Codebase.DataManager.data_loader import DataLoader
+from Codebase.DataManager.file_catalog import get_file_catalog
+
+# Transforms that commute with a bucket mean, so they can be applied after aggregation
+ROLLUP_SAFE_TRANSFORMS = {None, "", "none", "c_to_f", "f_to_c"}
+
+
+def can_use_rollup(grouping, role_filter, transform_type) -> bool:
+    """True if a role's grouped series can come from the rollup tiers without changing its values."""
+    if role_filter and role_filter != "None":
+        return False  # Outlier filters work on raw rows
+    if (transform_type or "").lower() not in ROLLUP_SAFE_TRANSFORMS:
+        return False
+    return select_rollup_tier(grouping) is not None
+
+
+def prepare_rollup_series(role, dtype, col, special, grouping, start=None, end=None):
+    """
+    Build a role's already-grouped series from the rollup tiers, in the shape returned by
+    prepare_role_series, without loading raw rows. With a window, only files overlapping it
+    are combined; buckets outside it are trimmed by the caller's date filter.
+
+    Returns:
+        dict | None: {"df": pd.DataFrame(datetime, "<role>::<col>::<instance key>"), "base": int | None},
+                     or None if no file has rollups for the column.
+    """
+    instance_id, _ = parse_special_value(special)
+    if dtype in ["tvws", "soil"] and instance_id is None:
+        return None
+
+    column = normalize_header(col)
+    catalog = get_file_catalog()
+    paths = catalog.find(dtype, instance_id, start, end)
+    if not paths:
+        return None
+
+    # Combined buckets are reused across callbacks until a source file changes. Like restore_loader,
+    # the fingerprint covers every file of the instance and the window stays in the key only.
+    cache = get_loaded_data_cache()
+    key = ("rollup", dtype.lower(), instance_id, column, grouping, start, end)
+    source_paths = catalog.find(dtype, instance_id)
+    cached = cache.get(key, source_paths)
+    if cached is None:
+        loaded = load_rollup_series(paths, column, grouping)
+        if loaded is None:
+            return None
+        rollup, base = loaded
+        cached = [(None, rollup, {"base": base})]
+        cache.put(key, source_paths, cached)
+    _, rollup, meta = cached[0]
+
+    label = f"{role}::{col}::{DataLoader.storage_key(dtype, instance_id)}"
+    df = rollup[["datetime", "mean"]].rename(columns={"mean": label})
+    return {"df": df, "base": meta["base"]}
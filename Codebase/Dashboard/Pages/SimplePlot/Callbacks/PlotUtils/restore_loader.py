@@ -1,19 +1,35 @@
-import pandas as pd
+from Codebase.Dashboard.SupportMethods.loaded_data_cache import get_loaded_data_cache
+from Codebase.Dashboard.SupportMethods.loader_from_store import loader_from_store
 from Codebase.Dashboard.SupportMethods.parse_special_value import parse_special_value
-from functools import reduce
 
-from Codebase.DataManager.data_loader import DataLoader
+from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
 
 
-def restore_loader(loader_state, roles):
-    loader = DataLoader.from_cached_state(
-        dropdown_blacklist=loader_state.get("dropdown_blacklist", []),
-        data_types_available=loader_state.get("data_types_available", []),
-        column_list_by_type=loader_state.get("column_list_by_type", {}),
-        all_csv_files=loader_state.get("all_csv_files", [])
-    )
+def restore_loader(loader_state, roles, start=None, end=None):
+    """
+    Restore the session's DataLoader from the loader-store payload and load every role's column into loader.series.
+
+    If a window is given, only files overlapping it are read and only rows inside it are kept.
+    """
+    loader = loader_from_store(loader_state)
+    cache = get_loaded_data_cache()
     for role_type, role_col, role_special in roles:
         if role_type and role_col:
             instance_id, _ = parse_special_value(role_special)
-            loader.load_data(csv_category=role_type, instance_id=instance_id, set_of_columns={role_col})
-    return loader
\ No newline at end of file
+
+            # Frames already loaded by an earlier callback are reused until a source file changes,
+            # so edits to titles, labels or groupings don't re-read any data.
+            # The window is only part of the key: the fingerprint covers every file of the instance,
+            # because the windowed file list grows as record_time_range fills in file ranges.
+            key = (role_type.lower(), instance_id, normalize_header(role_col), start, end)
+            paths = loader.catalog.find(role_type, instance_id)
+            series = cache.get(key, paths)
+            if series is None:
+                frames = loader.load_frames(csv_category=role_type, instance_id=instance_id, set_of_columns={role_col},
+                                            start=start, end=end)
+                # Only the compact arrays are kept; the per-file frames are released right here
+                series = loader.compact_frames(role_type, instance_id, frames)
+                cache.put(key, paths, series)
+
+            loader.series.update(series)
+    return loader
@@ -2,7 +2,7 @@ from dash import Input, Output, State
 from dash.exceptions import PreventUpdate
 
 from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
-from Codebase.DataManager.data_loader import DataLoader
+from Codebase.Dashboard.SupportMethods.loader_from_store import loader_from_store
 
 def make_conditional_dropdown_callback(app, dropdown_id, special_id, conditional_id):
     @app.callback(
@@ -18,12 +18,7 @@ def make_conditional_dropdown_callback(app, dropdown_id, special_id, conditional
             raise PreventUpdate
 
         try:
-            loader = DataLoader.from_cached_state(
-                dropdown_blacklist=loader_state.get("dropdown_blacklist", []),
-                data_types_available=loader_state.get("data_types_available", []),
-                column_list_by_type=loader_state.get("column_list_by_type", {}),
-                all_csv_files=loader_state.get("all_csv_files", [])
-            )
+            loader = loader_from_store(loader_state)
         except Exception as e:
             print(f"[ERROR] Failed to rebuild loader: {e}")
             return [], None
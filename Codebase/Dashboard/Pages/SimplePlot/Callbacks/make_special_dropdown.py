@@ -1,8 +1,4 @@
-from pathlib import Path
-
-from Codebase.DataManager.data_loader import DataLoader
-from Codebase.DataManager.Processing.DataMGMT.extract_all_soil_depths import extract_all_soil_depths
-from Codebase.DataManager.Processing.DataMGMT.extract_all_tvws_specials import extract_all_tvws_specials
+from Codebase.DataManager.file_catalog import get_file_catalog
 
 from dash import Input, Output, State
 from dash.exceptions import PreventUpdate
@@ -23,23 +19,8 @@ def make_special_dropdown(app, dropdown_id, special_id):
         if not loader_state:
             raise PreventUpdate
 
-        loader = DataLoader.from_cached_state(
-            dropdown_blacklist=loader_state.get("dropdown_blacklist", []),
-            data_types_available=loader_state.get("data_types_available", []),
-            column_list_by_type=loader_state.get("column_list_by_type", {}),
-            all_csv_files=loader_state.get("all_csv_files", [])
-        )
-
-        all_paths = [Path(p) for p in loader.all_csv_files]
-        filtered = [p for p in all_paths if data_type in p.name.lower()]
-
-        # Extract (instance, special) pairs
-        if data_type == "soil":
-            result = extract_all_soil_depths(filtered)
-        elif data_type == "tvws":
-            result = extract_all_tvws_specials(filtered)
-        else:
-            result = []
+        # (instance, special) pairs were captured from each file's preamble when it was catalogued
+        result = get_file_catalog().special_values(data_type)
 
         # Convert into dropdown options
         options = [
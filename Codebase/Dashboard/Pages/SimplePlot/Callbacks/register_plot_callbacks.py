@@ -6,6 +6,7 @@ from Codebase.Dashboard.Pages.SimplePlot.Callbacks.make_conditional_dropdown_cal
     make_conditional_dropdown_callback
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.populate_inital_dropdowns import populate_inital_dropdowns
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.register_plot_figure_callback import register_plot_figure_callback
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.register_plot_zoom_callback import register_plot_zoom_callback
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.register_plot_init_loader import register_plot_init_loader
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.make_special_dropdown import make_special_dropdown
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.register_sync_date_range import register_sync_date_range
@@ -32,6 +33,7 @@ def register_plot_callbacks(app):
     make_conditional_dropdown_callback(app, "dropdown-3", "dropdown-special-3", "conditional-3")
 
     register_plot_figure_callback(app)
+    register_plot_zoom_callback(app)
 
 '''
     @app.callback(
@@ -1,19 +1,20 @@
 from dash import Input, Output, State, dcc, ctx, no_update
 from dash.exceptions import PreventUpdate
 from Codebase.Dashboard.Pages.SimplePlot.Formating.format_timeseries_figure import format_timeseries_figure
+from Codebase.Dashboard.SupportMethods.align_series import align_series
 from Codebase.Dashboard.SupportMethods.parse_special_value import parse_special_value
-from Codebase.DataManager.data_loader import DataLoader
 import pandas as pd
-from functools import reduce
 
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.restore_loader import restore_loader
-from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.extract_df import extract_df
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.prepare_role_series import prepare_role_series
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.prepare_rollup_series import can_use_rollup, prepare_rollup_series
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.resample_grouping import resample_grouping
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.detect_lcd_groupings import detect_lcd_groupings
-from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.compute_time_range import compute_time_range
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.compute_data_time_range import compute_data_time_range
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.apply_outlier_filter import apply_outlier_filter
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.compute_shared_y_axis_ranges import compute_shared_yaxis_ranges
 from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.apply_extra_transform import apply_extra_transform
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.plot_frame_store import store_plot_frame
 
 
 def register_plot_figure_callback(app):
@@ -78,13 +79,39 @@ def register_plot_figure_callback(app):
         if not any([(y1_type and y1_col), (y2_type and y2_col), (y3_type and y3_col)]):
             raise PreventUpdate
 
+        transforms = {"y1": y1_extra, "y2": y2_extra, "y3": y3_extra}
+
+        # Push the picked date range down into the loader so files and rows outside it are never
+        # read. The end is padded by a day (the coarsest grouping) so the last bucket stays complete.
+        load_start, load_end = None, None
+        if start_date and end_date:
+            load_start = pd.to_datetime(start_date)
+            load_end = pd.to_datetime(end_date) + pd.Timedelta(days=1)
+
+        # Coarse groupings are served from the pre-aggregated rollup tiers; only the remaining
+        # roles need their raw rows. LCD sync needs every role's raw spacing, so it skips rollups.
+        rolled_up = {}
+        if triggered_id != "lcd-sync-button":
+            for role, (dtype, col, special) in roles.items():
+                if dtype and col and can_use_rollup(time_groupings[role], filters[role], transforms[role]):
+                    series = prepare_rollup_series(role, dtype, col, special, time_groupings[role],
+                                                   load_start, load_end)
+                    if series is not None:
+                        rolled_up[role] = series
+        raw_roles = {role: spec for role, spec in roles.items() if role not in rolled_up}
+
         try:
-            loader = restore_loader(loader_state, list(roles.values()))
+            loader = restore_loader(loader_state, list(raw_roles.values()), load_start, load_end)
         except Exception as e:
             return f"[ERROR] Failed to restore loader: {e}", no_update, no_update, no_update, no_update
 
+        # Extract, concatenate and sort every role's series once; everything below reuses it
+        prepared = prepare_role_series(loader, raw_roles)
+        prepared.update(rolled_up)
+        prepared = {role: prepared[role] for role in roles if role in prepared}
+
         if triggered_id == "lcd-sync-button":
-            base_by_role, lcd = detect_lcd_groupings(roles, loader)
+            base_by_role, lcd = detect_lcd_groupings(prepared)
             grouping_map = {
                 1: "1S", 5: "5S", 10: "10S", 30: "30S",
                 60: "1min", 300: "5min", 900: "15min",
@@ -93,65 +120,41 @@ def register_plot_figure_callback(app):
             closest_grouping = next((v for k, v in grouping_map.items() if lcd and lcd <= k), "raw")
             for role in base_by_role:
                 time_groupings[role] = closest_grouping
+
+        for role, series in prepared.items():
+            if series["base"]:
                 grouping_metadata[role] = {
-                    "base": f"{base_by_role[role]}s",
-                    "blocked": closest_grouping
+                    "base": f"{series['base']}s",
+                    "blocked": time_groupings[role]
                 }
 
-        for role, (dtype, col, special) in roles.items():
-            dfs = extract_df(loader, dtype, col, special, role_label=role)
-            if not dfs:
-                continue
-            df = pd.concat(dfs)
-            df["datetime"] = pd.to_datetime(df["datetime"], errors="coerce").dt.tz_localize(None)
-            df = df.dropna(subset=["datetime"]).sort_values("datetime")
-
-            if len(df) >= 2:
-                diffs = df["datetime"].diff().dt.total_seconds().dropna()
-                diffs = diffs[diffs > 0.1]
-                if not diffs.empty:
-                    base = int(round(diffs.min()))
-                    grouping_metadata[role] = {
-                        "base": f"{base}s",
-                        "blocked": time_groupings[role]
-                    }
-
-        df_final = None
+        role_frames = []
         timestamp_ranges = []
 
-        for role, (dtype, col, special) in roles.items():
-            if not dtype or not col:
-                continue
-
-            dfs = extract_df(loader, dtype, col, special, role_label=role)
-            if not dfs:
-                continue
-
-            df = pd.concat(dfs)
-            df["datetime"] = pd.to_datetime(df["datetime"], errors="coerce").dt.tz_localize(None)
-            df = df.dropna(subset=["datetime"])
+        for role, series in prepared.items():
+            df = series["df"]
 
             # ✅ Apply filters and transforms in correct order
             df = apply_outlier_filter(df, filters[role])
-            transform_type = {"y1": y1_extra, "y2": y2_extra, "y3": y3_extra}[role]
+            transform_type = transforms[role]
             print(f"[DEBUG] Transform type for {role}: {transform_type}")
             if transform_type and transform_type.lower() != "none":
-                df = apply_extra_transform(df, transform_type)
+                df = apply_extra_transform(df.copy(), transform_type)
 
-            df = resample_grouping(df, time_groupings[role])
-            trange = compute_time_range(df)
+            if role not in rolled_up:  # Rollup series arrive already grouped
+                df = resample_grouping(df, time_groupings[role])
+            # The sync button needs each role's whole extent, not the window loaded for this plot
+            trange = compute_data_time_range(roles[role][0], roles[role][2], df)
             if trange:
                 timestamp_ranges.append(trange)
 
-            if df_final is None:
-                df_final = df
-            else:
-                df_final = pd.merge(df_final, df, how="outer", on="datetime")
+            role_frames.append(df)
 
+        # Union of all role timestamps in one pass, already sorted
+        df_final = align_series(role_frames)
         if df_final is None or df_final.empty:
             return "[WARN] No data found for plotting.", no_update, no_update, no_update, no_update
 
-        df_final = df_final.sort_values("datetime")
         if start_date and end_date:
             start_dt = pd.to_datetime(start_date)
             end_dt = pd.to_datetime(end_date)
@@ -162,23 +165,31 @@ def register_plot_figure_callback(app):
 
         shared_ranges = compute_shared_yaxis_ranges(df_final, linked_axes)
 
+        y1_plot_col = next((col for col in df_final.columns if col.startswith("y1::")), None)
+        y2_plot_col = next((col for col in df_final.columns if col.startswith("y2::")), None)
+        y3_plot_col = next((col for col in df_final.columns if col.startswith("y3::")), None)
+
         fig = format_timeseries_figure(
             df_final,
-            y1_col=next((col for col in df_final.columns if col.startswith("y1::")), None),
-            y2_col=next((col for col in df_final.columns if col.startswith("y2::")), None),
-            y3_col=next((col for col in df_final.columns if col.startswith("y3::")), None),
+            y1_col=y1_plot_col,
+            y2_col=y2_plot_col,
+            y3_col=y3_plot_col,
             x_col="datetime",
             plot_title=plot_title or "Time Series Data",
             y1_label=y1_label or "Y1 Axis",
             y2_label=y2_label or "Y2 Axis",
             y3_label=y3_label or "Y3 Axis",
             grouping_info=grouping_metadata,
-            shared_ranges=shared_ranges
+            shared_ranges=shared_ranges,
+            ui_revision=repr((sorted(roles.items()), start_date, end_date))
         )
 
+        # Keep the full-resolution frame server-side so zooming can re-decimate it
+        plot_token = store_plot_frame(df_final, [col for col in (y1_plot_col, y2_plot_col, y3_plot_col) if col])
+
         return (
-            dcc.Graph(figure=fig),
-            {"ranges": timestamp_ranges},
+            dcc.Graph(id="timeseries-graph", figure=fig),
+            {"ranges": timestamp_ranges, "plot_token": plot_token},
             time_groupings["y1"],
             time_groupings["y2"],
             time_groupings["y3"]
@@ -1,6 +1,7 @@
 from dash import Input, Output
 
 from Codebase.Dashboard.SupportMethods.load_dropdown_blacklist import load_dropdown_blacklist
+from Codebase.Dashboard.SupportMethods.loader_session_store import get_loader_session_store
 from Codebase.DataManager.data_loader import DataLoader
 
 def register_plot_init_loader(app):
@@ -13,9 +14,6 @@ def register_plot_init_loader(app):
         dropdown_blacklist = load_dropdown_blacklist()
         loader = DataLoader(dropdown_blacklist)
 
-        return {
-            "dropdown_blacklist": sorted(dropdown_blacklist),
-            "data_types_available": sorted(loader.data_types_available),
-            "column_list_by_type": loader.column_list_by_type,
-            "all_csv_files": [str(path) for path in loader.all_csv_files]
-        }
\ No newline at end of file
+        # Only a session token, the catalog version and the type list travel to the browser;
+        # the rest of the loader state stays on the server.
+        return get_loader_session_store().create(loader, dropdown_blacklist)
\ No newline at end of file
@@ -0,0 +1,39 @@
+from dash import Input, Output, State, Patch
+from dash.exceptions import PreventUpdate
+
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.decimate_minmax import decimate_minmax
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.plot_frame_store import get_plot_frame
+
+
+def register_plot_zoom_callback(app):
+    @app.callback(
+        Output("timeseries-graph", "figure"),
+        Input("timeseries-graph", "relayoutData"),
+        State("plot-data-store", "data"),
+        prevent_initial_call=True
+    )
+    def redecimate_on_zoom(relayout_data, plot_data):
+        if not relayout_data or not plot_data or not plot_data.get("plot_token"):
+            raise PreventUpdate
+
+        if "xaxis.range[0]" in relayout_data and "xaxis.range[1]" in relayout_data:
+            x_range = (relayout_data["xaxis.range[0]"], relayout_data["xaxis.range[1]"])
+        elif "xaxis.range" in relayout_data:
+            x_range = tuple(relayout_data["xaxis.range"])
+        elif relayout_data.get("xaxis.autorange"):
+            x_range = None
+        else:
+            raise PreventUpdate  # y-only zoom, legend clicks, etc.
+
+        stored = get_plot_frame(plot_data["plot_token"])
+        if stored is None:
+            raise PreventUpdate
+        df, trace_columns = stored
+
+        # Only the trace points change; the layout (and the user's zoom) is left untouched
+        patched = Patch()
+        for i, col in enumerate(trace_columns):
+            x, y = decimate_minmax(df, "datetime", col, x_range=x_range)
+            patched["data"][i]["x"] = x
+            patched["data"][i]["y"] = y
+        return patched
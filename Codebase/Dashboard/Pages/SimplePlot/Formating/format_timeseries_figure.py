@@ -1,5 +1,7 @@
 import plotly.graph_objs as go
 
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.decimate_minmax import decimate_minmax
+
 def format_timeseries_figure(
     df,
     y1_col=None,
@@ -11,10 +13,19 @@ def format_timeseries_figure(
     y2_label="Y2 Axis",
     y3_label="Y3 Axis",
     grouping_info=None,
-    shared_ranges=None
+    shared_ranges=None,
+    decimate=True,
+    ui_revision="timeseries"
 ):
     fig = go.Figure()
 
+    # Each trace ships at most two points (min/max) per pixel column; zooming re-decimates
+    # server-side from the full-resolution frame (see register_plot_zoom_callback).
+    def trace_xy(col):
+        if decimate:
+            return decimate_minmax(df, x_col, col)
+        return df[x_col], df[col]
+
     # def build_legend_label(label, role):
     #     if grouping_info and role in grouping_info:
     #         base = grouping_info[role].get("base", "—")
@@ -26,24 +37,27 @@ def format_timeseries_figure(
         return label  # stripped label (no blocking text)
 
     if y1_col and y1_col in df.columns:
+        x, y = trace_xy(y1_col)
         fig.add_trace(go.Scatter(
-            x=df[x_col], y=df[y1_col],
+            x=x, y=y,
             name=plain_label(y1_label),  # can also just pass name="" to hide
             yaxis="y1", mode="markers",
             showlegend=False  # hides legend entry
         ))
 
     if y2_col and y2_col in df.columns:
+        x, y = trace_xy(y2_col)
         fig.add_trace(go.Scatter(
-            x=df[x_col], y=df[y2_col],
+            x=x, y=y,
             name=plain_label(y2_label),
             yaxis="y2", mode="markers",
             showlegend=False
         ))
 
     if y3_col and y3_col in df.columns:
+        x, y = trace_xy(y3_col)
         fig.add_trace(go.Scatter(
-            x=df[x_col], y=df[y3_col],
+            x=x, y=y,
             name=plain_label(y3_label),
             yaxis="y3", mode="markers",
             showlegend=False
@@ -81,6 +95,9 @@ def format_timeseries_figure(
         font=dict(size=24),
         margin=dict(t=100, b=80, l=80, r=140),
         height=600,
+        # Keeps the user's zoom while zoom re-decimation patches the traces; callers change it with the
+        # selected series or date range so a new selection opens unzoomed.
+        uirevision=ui_revision,
     )
 
     if y2_col and y2_col in df.columns:
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+
+def _time_keys(df, time_col):
+    return pd.to_datetime(df[time_col]).to_numpy(dtype="datetime64[ns]").view("int64")
+
+
+def _snap_to_anchor(keys, anchor, tolerance_ns):
+    # Move each timestamp onto its nearest anchor timestamp when one lies within the tolerance
+    idx = np.searchsorted(anchor, keys)
+    left = anchor[np.maximum(idx - 1, 0)]
+    right = anchor[np.minimum(idx, len(anchor) - 1)]
+    nearest = np.where(np.abs(keys - left) <= np.abs(right - keys), left, right)
+    return np.where(np.abs(nearest - keys) <= tolerance_ns, nearest, keys)
+
+
+def _occurrences(keys: np.ndarray) -> np.ndarray:
+    # 0 for the first row with a given timestamp in this frame, 1 for the second, ...
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.empty(len(keys), dtype=bool)
+    starts[:1] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=starts[1:])
+    run_start = np.maximum.accumulate(np.where(starts, np.arange(len(keys)), 0))
+    occurrences = np.empty(len(keys), dtype=np.int64)
+    occurrences[order] = np.arange(len(keys)) - run_start
+    return occurrences
+
+
+def _empty_column(values: np.ndarray, length: int) -> np.ndarray:
+    if values.dtype.kind == "f":
+        return np.full(length, np.nan, dtype=values.dtype)
+    if values.dtype.kind in "iub":
+        return np.full(length, np.nan, dtype="float64")
+    return np.full(length, None, dtype=object)
+
+
+def align_series(frames, tolerance=None, time_col: str = "datetime") -> pd.DataFrame:
+    """
+    Align N time series on the union of their timestamps in a single pass.
+
+    Replaces chained pd.merge(how="outer") joins: every frame's timestamps are merged into one
+    sorted union index (a stable sort over already-sorted runs, so close to linear in the total
+    row count) and each value column is scattered into place once. Frames on differing sampling
+    grids share rows wherever their timestamps match, so rows never multiply.
+
+    A timestamp repeated within a frame is kept, not collapsed: the k-th row with a given timestamp
+    in each frame lands on the same output row, so a time with at most n rows in any one frame
+    gets n rows (pd.merge would give the product of the counts).
+
+    Frames sharing a value column name (e.g. one frame per CSV of the same series) fill the same
+    output column instead of producing _x/_y copies; where they overlap the later frame wins.
+
+    Args:
+        frames (list[pd.DataFrame]): Frames with `time_col` plus value columns, ideally sorted by time.
+        tolerance (str | pd.Timedelta | None): If set, timestamps of the second and later frames
+            snap to the nearest timestamp of the first frame within this distance (as merge_asof
+            with direction="nearest" would), so slightly offset loggers share rows.
+        time_col (str): Name of the timestamp column.
+
+    Returns:
+        pd.DataFrame | None: time_col followed by every value column, sorted by time and in the
+        first frame's timezone; None if no frame has rows.
+    """
+    frames = [df for df in frames if df is not None and not df.empty]
+    if not frames:
+        return None
+
+    keys = [_time_keys(df, time_col) for df in frames]
+
+    if tolerance is not None:
+        anchor = np.unique(keys[0])
+        tolerance_ns = pd.Timedelta(tolerance).value
+        keys = [keys[0]] + [_snap_to_anchor(k, anchor, tolerance_ns) for k in keys[1:]]
+
+    all_keys = np.concatenate(keys)
+    all_occurrences = np.concatenate([_occurrences(k) for k in keys])
+    # Sorted by timestamp, then occurrence; stable, so equal pairs keep frame order
+    order = np.lexsort((all_occurrences, all_keys))
+    sorted_keys = all_keys[order]
+    sorted_occurrences = all_occurrences[order]
+    is_new = np.empty(len(sorted_keys), dtype=bool)
+    is_new[0] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=is_new[1:])
+    is_new[1:] |= sorted_occurrences[1:] != sorted_occurrences[:-1]
+    union = sorted_keys[is_new]
+
+    # Row of the union index for every input row, in input order
+    positions = np.empty(len(all_keys), dtype=np.int64)
+    positions[order] = np.cumsum(is_new) - 1
+
+    columns = {}
+    offset = 0
+    for df, k in zip(frames, keys):
+        rows = positions[offset:offset + len(k)]
+        offset += len(k)
+        for col in df.columns:
+            if col == time_col:
+                continue
+            values = df[col].to_numpy()
+            if col not in columns:
+                columns[col] = _empty_column(values, len(union))
+            columns[col][rows] = values
+
+    union_times = pd.DatetimeIndex(union.view("datetime64[ns]"))
+    tz = getattr(pd.to_datetime(frames[0][time_col]).dt, "tz", None)
+    if tz is not None:
+        union_times = union_times.tz_localize("UTC").tz_convert(tz)
+
+    result = pd.DataFrame(columns)
+    result.insert(0, time_col, union_times)
+    return result
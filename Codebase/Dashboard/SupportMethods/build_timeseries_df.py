@@ -1,4 +1,4 @@
-from pandas import concat
+from Codebase.Dashboard.SupportMethods.align_series import align_series
 
 def build_timeseries_df(loader, selected_settings: list):
     """
@@ -22,8 +22,5 @@ def build_timeseries_df(loader, selected_settings: list):
     if not dfs:
         return None
 
-    merged_df = dfs[0]
-    for df in dfs[1:]:
-        merged_df = merged_df.merge(df, on="datetime", how="outer")
-
-    return merged_df
+    # One aligned frame; files of the same series share a column
+    return align_series(dfs)
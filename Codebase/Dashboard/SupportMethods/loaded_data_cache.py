@@ -0,0 +1,93 @@
+import os
+import threading
+from collections import OrderedDict
+
+# Upper bound on the DataFrame memory held by the cache before least-recently-used entries are evicted.
+DEFAULT_MEMORY_BUDGET_BYTES = 1024 * 1024 * 1024  # 1 GiB
+
+
+def _files_fingerprint(paths) -> tuple:
+    # (path, mtime, size) of every source file; any change invalidates the cached entry
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprint.append((str(path), None, None))
+    return tuple(fingerprint)
+
+
+def _value_size(value) -> int:
+    # Compact series stores report their own size; frame lists are measured per DataFrame
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return int(sum(df.memory_usage(deep=True).sum() for _, df, _ in value))
+
+
+class LoadedDataCache:
+    """
+    Process-wide, thread-safe LRU cache of data loaded for the dashboard.
+
+    Entries are keyed by (category, instance_id, column, window) and hold the CompactSeriesStore
+    built from DataLoader.load_frames() (or, for rollups, a list of (path, frame, metadata)
+    tuples). Each entry remembers the (path, mtime, size) of its source files (every file of the
+    category/instance, not just those overlapping the window) and is dropped as soon as any of them changes. When the total frame memory exceeds the
+    budget, the least recently used entries are evicted.
+    """
+
+    def __init__(self, memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES):
+        self.memory_budget_bytes = memory_budget_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, paths):
+        """Return the cached value for key, or None if missing or any source file changed."""
+        fingerprint = _files_fingerprint(paths)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["fingerprint"] != fingerprint:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry["value"]
+
+    def put(self, key, paths, value) -> None:
+        size = _value_size(value)
+        fingerprint = _files_fingerprint(paths)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.memory_budget_bytes:
+                return  # Larger than the whole budget; serve it uncached
+            self._entries[key] = {"fingerprint": fingerprint, "value": value, "size": size}
+            self._total_bytes += size
+            while self._total_bytes > self.memory_budget_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _drop(self, key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry["size"]
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_loaded_data_cache() -> LoadedDataCache:
+    """Return the dashboard's shared LoadedDataCache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LoadedDataCache()
+        return _cache
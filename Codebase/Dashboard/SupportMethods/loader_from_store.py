@@ -0,0 +1,16 @@
+from Codebase.Dashboard.SupportMethods.loader_session_store import get_loader_session_store
+
+
+def loader_from_store(loader_state):
+    """
+    Return the DataLoader behind a loader-store payload.
+
+    Unknown sessions (the server restarted, or another worker created it) get a new loader, which
+    reuses the persisted file catalog and header index, registered under the same token so later
+    callbacks restore it instead of rebuilding it again.
+    """
+    store = get_loader_session_store()
+    loader = store.restore(loader_state)
+    if loader is None:
+        loader, _ = store.rebuild(loader_state)
+    return loader
@@ -0,0 +1,96 @@
+import threading
+import uuid
+from collections import OrderedDict
+
+from Codebase.Dashboard.SupportMethods.load_dropdown_blacklist import load_dropdown_blacklist
+from Codebase.DataManager.data_loader import DataLoader
+from Codebase.DataManager.file_catalog import get_file_catalog
+
+# Loader states kept per browser session; the least recently used are dropped beyond this.
+MAX_SESSIONS = 256
+
+
+class LoaderSessionStore:
+    """
+    Server-side home of the loader state the dashboard used to ship through the "loader-store" dcc.Store.
+
+    The browser only holds a small payload ({"session", "catalog_version", "data_types_available"});
+    the blacklist and column lists stay here, and the file list comes from the shared file catalog.
+    """
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, loader: DataLoader, dropdown_blacklist, token: str = None) -> dict:
+        """
+        Register a freshly built loader and return the payload to put in loader-store.
+        A new token is issued unless `token` is given (re-registering a session this process lost).
+        """
+        token = token or uuid.uuid4().hex
+        with self._lock:
+            self._sessions[token] = {
+                "dropdown_blacklist": sorted(dropdown_blacklist),
+                "data_types_available": sorted(loader.data_types_available),
+                "column_list_by_type": loader.column_list_by_type,
+            }
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return {
+            "session": token,
+            "catalog_version": loader.catalog.version,
+            "data_types_available": sorted(loader.data_types_available),
+        }
+
+    def has(self, loader_state) -> bool:
+        """True if the payload's session is registered in this process."""
+        with self._lock:
+            return (loader_state or {}).get("session") in self._sessions
+
+    def rebuild(self, loader_state) -> tuple:
+        """
+        Build a new DataLoader for a session this process doesn't know (the server restarted, or
+        another worker created it) and register it under the payload's token, so every later
+        callback from that page finds it again instead of rebuilding.
+
+        Returns:
+            tuple[DataLoader, dict]: The loader and the refreshed loader-store payload.
+        """
+        dropdown_blacklist = load_dropdown_blacklist()
+        loader = DataLoader(dropdown_blacklist)
+        loader.blacklist = sorted(dropdown_blacklist)
+        payload = self.create(loader, dropdown_blacklist, token=(loader_state or {}).get("session"))
+        return loader, payload
+
+    def restore(self, loader_state):
+        """
+        Rebuild the DataLoader for a loader-store payload, or return None if the session is unknown
+        (e.g. the server restarted since the page was loaded).
+        """
+        token = (loader_state or {}).get("session")
+        with self._lock:
+            state = self._sessions.get(token)
+            if state is None:
+                return None
+            self._sessions.move_to_end(token)
+
+        return DataLoader.from_cached_state(
+            dropdown_blacklist=state["dropdown_blacklist"],
+            data_types_available=state["data_types_available"],
+            column_list_by_type=state["column_list_by_type"],
+            all_csv_files=get_file_catalog().paths(),
+        )
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_loader_session_store() -> LoaderSessionStore:
+    """Return the dashboard's shared LoaderSessionStore."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LoaderSessionStore()
+        return _store
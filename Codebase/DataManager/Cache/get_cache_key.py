@@ -0,0 +1,28 @@
+import hashlib
+import os
+from pathlib import Path
+
+# Bump when the layout of cached frames changes so old entries are ignored.
+CACHE_VERSION = 3
+
+
+def get_path_hash(csv_path) -> str:
+    """Stable hash of the resolved CSV path, shared by every cache entry of that file."""
+    resolved = str(Path(csv_path).resolve())
+    return hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:16]
+
+
+def get_cache_key(csv_path) -> str:
+    """
+    Build a content-addressed cache key for a CSV file.
+
+    The key combines the resolved path with the file's mtime and size, so any edit
+    (or a replaced file) produces a new key and the stale entry is never read.
+
+    Returns:
+        str: "<path hash>-<stamp hash>", e.g. "3f2a9c0d1e4b5a6f-7c8d9e0f1a2b3c4d"
+    """
+    stat = os.stat(csv_path)
+    stamp = f"{CACHE_VERSION}|{stat.st_mtime_ns}|{stat.st_size}"
+    stamp_hash = hashlib.sha1(stamp.encode("utf-8")).hexdigest()[:16]
+    return f"{get_path_hash(csv_path)}-{stamp_hash}"
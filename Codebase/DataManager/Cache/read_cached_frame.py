@@ -0,0 +1,50 @@
+import pandas as pd
+
+from Codebase.DataManager.Cache.get_cache_key import get_cache_key
+from Codebase.DataManager.Cache.read_cached_metadata import read_cached_metadata
+from Codebase.Pathing.get_cache_folder import get_cache_folder
+
+
+def read_cached_frame(csv_path, columns=None, start=None, end=None):
+    """
+    Read a previously parsed CSV from the columnar cache.
+
+    Args:
+        csv_path: Path to the source CSV file.
+        columns (list[str], optional): Normalized column names to read. "datetime" is always
+                                       included. Columns the file does not have are ignored.
+                                       If None, every cached column is read.
+        start, end (pd.Timestamp, optional): UTC window; only rows inside it are read. The
+                                       filter is applied by the Parquet reader, which skips
+                                       row groups that lie outside it.
+
+    Returns:
+        tuple[pd.DataFrame, dict] | None: (frame, metadata) on a cache hit, None on a miss.
+        A requested column that exists in the CSV but was not stored in the cache is a miss,
+        so the caller re-parses the file with the wider column set.
+    """
+    metadata = read_cached_metadata(csv_path)
+    if metadata is None:
+        return None
+
+    stored = set(metadata.get("stored_columns", []))
+    read_cols = None
+    if columns is not None:
+        in_file = set(metadata.get("columns", []))
+        wanted = [col for col in columns if col != "datetime" and col in in_file]
+        if any(col not in stored for col in wanted):
+            return None
+        read_cols = ["datetime"] + wanted
+
+    try:
+        frame_path = get_cache_folder() / "Frames" / f"{get_cache_key(csv_path)}.parquet"
+        filters = []
+        if start is not None:
+            filters.append(("datetime", ">=", start))
+        if end is not None:
+            filters.append(("datetime", "<=", end))
+        df = pd.read_parquet(frame_path, columns=read_cols, filters=filters or None)
+        return df, metadata
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable cache entry for {csv_path}: {e}")
+        return None
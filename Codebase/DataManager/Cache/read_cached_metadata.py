@@ -0,0 +1,29 @@
+import json
+
+from Codebase.DataManager.Cache.get_cache_key import get_cache_key
+from Codebase.Pathing.get_cache_folder import get_cache_folder
+
+
+def read_cached_metadata(csv_path):
+    """
+    Return the metadata stored next to a cached frame, or None if the CSV has no valid cache entry.
+
+    Besides what the loader recorded at parse time ("columns", "special_value", "depth", ...),
+    the metadata lists the "stored_columns" actually present in the cached frame.
+    """
+    cache_folder = get_cache_folder() / "Frames"
+    try:
+        key = get_cache_key(csv_path)
+    except OSError:
+        return None
+
+    meta_path = cache_folder / f"{key}.json"
+    if not meta_path.exists() or not (cache_folder / f"{key}.parquet").exists():
+        return None
+
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable cache metadata for {csv_path}: {e}")
+        return None
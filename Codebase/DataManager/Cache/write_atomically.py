@@ -0,0 +1,23 @@
+import os
+import threading
+from pathlib import Path
+
+# Suffix of in-progress writes; stale-entry cleanup leaves these to the writer that owns them
+TEMP_SUFFIX = ".tmp"
+
+
+def write_atomically(path, write) -> None:
+    """
+    Call write(temp_path) and move the finished file onto `path` with os.replace.
+
+    The temp file sits next to `path` and is named per process and thread, so concurrent writers
+    (a dashboard request and the background rollup builder) never share one, and readers only ever
+    see a missing or a complete file. The temp file is removed if write() fails.
+    """
+    path = Path(path)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}{TEMP_SUFFIX}")
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
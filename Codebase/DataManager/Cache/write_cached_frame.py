@@ -0,0 +1,59 @@
+import json
+
+import pandas as pd
+
+from Codebase.DataManager.Cache.get_cache_key import get_cache_key, get_path_hash
+from Codebase.DataManager.Cache.write_atomically import TEMP_SUFFIX, write_atomically
+from Codebase.Pathing.get_cache_folder import get_cache_folder
+
+
+def _to_typed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # Mixed object columns (left behind by low_memory=False) can't be stored in a typed
+    # columnar file. Keep them numeric when every value converts, otherwise as strings.
+    typed = df.copy()
+    for col in typed.columns:
+        if col == "datetime" or typed[col].dtype != object:
+            continue
+        numeric = pd.to_numeric(typed[col], errors="coerce")
+        if numeric.notna().sum() == typed[col].notna().sum():
+            typed[col] = numeric
+        else:
+            typed[col] = typed[col].astype("string")
+    return typed
+
+
+def write_cached_frame(csv_path, df: pd.DataFrame, metadata: dict) -> None:
+    """
+    Store a parsed CSV frame (with a UTC "datetime" column) in the columnar cache.
+
+    Older entries for the same path are removed, so the cache holds at most one
+    entry per source file. Failures are reported and otherwise ignored; the cache
+    is only an accelerator.
+    """
+    cache_folder = get_cache_folder() / "Frames"
+    try:
+        cache_folder.mkdir(parents=True, exist_ok=True)
+        key = get_cache_key(csv_path)
+
+        for stale in cache_folder.glob(f"{get_path_hash(csv_path)}-*"):
+            if not stale.name.startswith(key) and not stale.name.endswith(TEMP_SUFFIX):
+                stale.unlink(missing_ok=True)
+
+        typed = _to_typed_columns(df)
+        typed["datetime"] = pd.to_datetime(typed["datetime"], utc=True)
+
+        metadata = dict(metadata)
+        metadata["source"] = str(csv_path)
+        metadata["stored_columns"] = [col for col in typed.columns if col != "datetime"]
+
+        def write_metadata(path):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(metadata, f)
+
+        # The background rollup builder may write the same entry as a request thread; each file is
+        # written under a private name and swapped in whole. The frame goes first, since readers
+        # treat the metadata as the marker of a complete entry.
+        write_atomically(cache_folder / f"{key}.parquet", lambda path: typed.to_parquet(path, index=False))
+        write_atomically(cache_folder / f"{key}.json", write_metadata)
+    except Exception as e:
+        print(f"[WARN] Could not cache {csv_path}: {e}")
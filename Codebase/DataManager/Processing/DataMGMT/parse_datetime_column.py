@@ -1,38 +1,125 @@
-from Codebase.DataManager.Processing.Header.detect_header_row import detect_header_row
+import re
+from pathlib import Path
+
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 
-def parse_datetime_column(csv_path: str, df: pd.DataFrame) -> pd.Series:
-    header_row_idx, header_cols = detect_header_row(csv_path)
+# Known timestamp layouts, tried in order on a small sample before the whole column is parsed.
+# "combined" is "<Date (Year-Mon-Day)> <Time (Hour-Min-Sec)>" as written by the Soil and TVWS loggers.
+DATETIME_FORMATS = {
+    "combined": [
+        "%Y-%m-%d %H-%M-%S",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y/%m/%d %H-%M-%S",
+        "%Y/%m/%d %H:%M:%S",
+    ],
+    "simple date": [
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%d %H:%M",
+        "%Y/%m/%d %H:%M:%S",
+        "%Y/%m/%d %H:%M",
+        "%m/%d/%Y %H:%M:%S",
+        "%m/%d/%Y %H:%M",
+        "%m/%d/%Y %I:%M %p",
+        "%m/%d/%Y %I:%M:%S %p",
+    ],
+}
+
+SNIFF_SAMPLE_SIZE = 50
+# Share of the sample a format must parse to be accepted; a stray bad line shouldn't
+# push the whole file onto the slow inferred path.
+SNIFF_MIN_VALID = 0.9
+
+# Format picked for each (file family, column kind), e.g. ("tvwsdata", "combined") -> "%Y-%m-%d %H-%M-%S".
+# Files of one family share a layout, so the sample is only tested once per process.
+_format_cache = {}
+
+
+def _file_family(csv_path) -> str:
+    # "TVWSData_0_2025-06-06.csv" -> "tvwsdata", "AmbientWeather_2025.csv" -> "ambientweather"
+    name = Path(str(csv_path)).name.lower()
+    match = re.match(r"[a-z]+", name)
+    return match.group(0) if match else name
+
+
+def _sniff_format(values: pd.Series, candidates):
+    sample = values.dropna().head(SNIFF_SAMPLE_SIZE)
+    if sample.empty:
+        return None
+
+    for fmt in candidates:
+        parsed = pd.to_datetime(sample, format=fmt, errors="coerce")
+        if parsed.notna().mean() >= SNIFF_MIN_VALID:
+            return fmt
+
+    guessed = guess_datetime_format(str(sample.iloc[0]))
+    if guessed and pd.to_datetime(sample, format=guessed, errors="coerce").notna().mean() >= SNIFF_MIN_VALID:
+        return guessed
+    return None
 
-    # Drop rows above the actual header
-    df = df.iloc[header_row_idx:].reset_index(drop=True)
-    df.columns = header_cols
 
+def _parse_with_format(values: pd.Series, family: str, kind: str, candidates) -> pd.Series:
+    cache_key = (family, kind)
+    fmt = _format_cache.get(cache_key)
+    if fmt is None:
+        fmt = _sniff_format(values, candidates)
+        if fmt is not None:
+            _format_cache[cache_key] = fmt
+
+    if fmt is None:
+        return pd.to_datetime(values, format="mixed", errors="coerce", utc=True)
+
+    parsed = pd.to_datetime(values, format=fmt, errors="coerce", utc=True)
+
+    # Rows that don't follow the family format (hand-edited lines, a logger firmware change)
+    # still get the slow inferred parse, but only those rows.
+    failed = parsed.isna() & values.notna() & (values != "")
+    if failed.any():
+        parsed[failed] = pd.to_datetime(values[failed], format="mixed", errors="coerce", utc=True)
+    return parsed
+
+
+def parse_datetime_column(csv_path: str, df: pd.DataFrame) -> pd.Series:
+    """
+    Build a UTC datetime series for a frame read with its header row already applied.
+
+    Columns are parsed with an explicit format from DATETIME_FORMATS, sniffed once per file
+    family on a small sample. csv_path names the family and is used in log messages; the
+    returned series shares df's index.
+    """
+    family = _file_family(csv_path)
     cols = [col.strip().lower() for col in df.columns]
 
     # Combined date + time (used for Soil & TVWS)
     if "date (year-mon-day)" in cols and "time (hour-min-sec)" in cols:
         date_col = df.columns[cols.index("date (year-mon-day)")]
         time_col = df.columns[cols.index("time (hour-min-sec)")]
-        combined = (
-            df[date_col].astype(str).str.strip() + " " +
-            df[time_col].astype(str).str.strip().str.replace("-", ":", regex=False)
-        )
-        parsed = pd.to_datetime(combined, errors="coerce", utc=True)
+        combined = df[date_col].astype(str).str.strip() + " " + df[time_col].astype(str).str.strip()
+        parsed = _parse_with_format(combined, family, "combined", DATETIME_FORMATS["combined"])
         print(f"[DEBUG] Parsed combined datetime in {csv_path}: {parsed.notna().sum()} rows valid")
         return parsed
 
     # Simple date fallback
     elif "simple date" in cols:
         col = df.columns[cols.index("simple date")]
-        parsed = pd.to_datetime(df[col], errors="coerce", utc=True)
+        values = df[col].astype(str).str.strip()
+        parsed = _parse_with_format(values, family, "simple date", DATETIME_FORMATS["simple date"])
         print(f"[DEBUG] Parsed simple datetime in {csv_path}: {parsed.notna().sum()} rows valid")
         return parsed
 
-    # Generic fallback — try each column
+    # Generic fallback — test a sample of each text column, then parse only the winner
     for col in df.columns:
+        if not (pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col])):
+            continue
         try:
-            parsed = pd.to_datetime(df[col], errors="coerce", utc=True)
+            sample = df[col].dropna().head(SNIFF_SAMPLE_SIZE)
+            if sample.empty:
+                continue
+            sample_parsed = pd.to_datetime(sample, errors="coerce", utc=True)
+            if sample_parsed.notna().sum() <= 0.8 * len(sample):
+                continue
+
+            parsed = _parse_with_format(df[col], family, f"generic::{col}", [])
             if parsed.notna().sum() > 0.8 * len(parsed):
                 print(f"[DEBUG] Parsed fallback datetime in {csv_path}: {parsed.notna().sum()} rows valid")
                 return parsed
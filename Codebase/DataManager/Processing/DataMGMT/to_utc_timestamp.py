@@ -0,0 +1,12 @@
+import pandas as pd
+
+
+def to_utc_timestamp(value):
+    """
+    Convert a window bound (str, datetime or pd.Timestamp) to a UTC pd.Timestamp.
+    Naive values are taken to be UTC already, matching the loader's "datetime" columns. None stays None.
+    """
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
@@ -0,0 +1,85 @@
+import pandas as pd
+
+from Codebase.DataManager.Processing.DataMGMT.parse_datetime_column import parse_datetime_column
+from Codebase.DataManager.Processing.DataMGMT.to_utc_timestamp import to_utc_timestamp
+from Codebase.DataManager.Processing.FileIO.scan_csv_preamble import (
+    DATETIME_SOURCE_COLUMNS,
+    keeps_full_precision,
+    resolve_projection,
+    scan_csv_preamble,
+)
+from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def iter_csv_file(full_path, columns, start=None, end=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Stream one CSV in chunks of `chunksize` rows, keeping only rows inside [start, end].
+
+    Each chunk gets a UTC "datetime" column (parsed like parse_csv_file) and the requested
+    columns as float32 where they are numeric sensor values. Logger files are written in time order, so
+    reading stops at the first chunk that starts after `end`.
+
+    Args:
+        full_path (Path): CSV file to read.
+        columns (set[str]): Normalized column names wanted.
+        start, end: Optional window bounds (anything pd.Timestamp accepts; naive values are UTC).
+        chunksize (int): Rows parsed per chunk.
+
+    Yields:
+        tuple[pd.DataFrame, dict]: Frame with "datetime" plus the requested columns the file has,
+        and the file metadata ({"header_row", "preamble", "special_value", "depth"}).
+    """
+    start, end = to_utc_timestamp(start), to_utc_timestamp(end)
+    requested = {normalize_header(col) for col in columns}
+
+    with open(full_path, "r", encoding="utf-8") as f:
+        preamble = scan_csv_preamble(f)
+        usecols, dtype = None, None
+        if preamble["header_line"]:
+            usecols, dtype = resolve_projection(preamble["header_line"], requested)
+        # Value columns are downcast per chunk instead, so one odd value can't abort the stream midway
+        dtype = {label: kind for label, kind in (dtype or {}).items() if kind is str} or None
+
+        metadata = {
+            "header_row": preamble["header_row"],
+            "preamble": preamble["metadata"],
+            "special_value": preamble["special_value"],
+            "depth": None,
+        }
+
+        f.seek(preamble["header_pos"])
+        reader = pd.read_csv(f, header=0, usecols=usecols, dtype=dtype, chunksize=chunksize)
+        for chunk in reader:
+            chunk.columns = [normalize_header(col) for col in chunk.columns]
+            datetimes = parse_datetime_column(str(full_path), chunk)
+
+            valid = datetimes.notna()
+            if end is not None and valid.any() and datetimes[valid].min() > end:
+                break
+            if start is not None:
+                valid &= datetimes >= start
+            if end is not None:
+                valid &= datetimes <= end
+            if not valid.any():
+                continue
+
+            matching = [col for col in chunk.columns if col in requested and col not in DATETIME_SOURCE_COLUMNS]
+            if not matching:
+                print(f"[WARN] Skipping {full_path.name}: No requested columns found.")
+                return
+
+            if "depth" in chunk.columns and metadata["depth"] is None:
+                depth_vals = chunk["depth"].dropna().unique()
+                if len(depth_vals) == 1:
+                    metadata["depth"] = normalize_header(str(depth_vals[0]))
+                elif len(depth_vals) > 1:
+                    metadata["depth"] = "mixed-depth"
+
+            out = chunk.loc[valid, matching].reset_index(drop=True)
+            for col in matching:
+                if pd.api.types.is_float_dtype(out[col]) and not keeps_full_precision(col):
+                    out[col] = out[col].astype("float32")
+            out.insert(0, "datetime", datetimes[valid].reset_index(drop=True))
+            yield out, metadata
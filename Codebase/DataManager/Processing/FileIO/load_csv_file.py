@@ -0,0 +1,55 @@
+from Codebase.DataManager.Cache.read_cached_frame import read_cached_frame
+from Codebase.DataManager.Cache.read_cached_metadata import read_cached_metadata
+from Codebase.DataManager.Cache.write_cached_frame import write_cached_frame
+from Codebase.DataManager.Processing.FileIO.parse_csv_file import parse_csv_file
+
+
+def load_csv_file(full_path, requested, use_cache=True, start=None, end=None):
+    """
+    Load the requested columns of one CSV, from the frame cache when possible.
+
+    Kept at module level (not a DataLoader method) so it can be shipped to worker processes.
+
+    Args:
+        full_path (Path): CSV file to load.
+        requested (set[str]): Normalized column names wanted by the caller.
+        use_cache (bool): Read from / write to the Parquet frame cache.
+        start, end (pd.Timestamp, optional): UTC window; rows outside it are dropped while
+                                             reading (cache hit) or right after parsing.
+
+    Returns:
+        tuple[pd.DataFrame | None, dict]: A frame with "datetime" plus the requested columns
+        the file has (None if the file has none of them, no valid datetime or no rows in the window),
+        and the file metadata. The metadata's "start"/"end" always describe the whole file.
+    """
+    cached = read_cached_frame(full_path, sorted(requested), start, end) if use_cache else None
+    if cached is not None:
+        df, file_metadata = cached
+    else:
+        # Only parse the requested columns, plus whatever the cache already held for this
+        # file so the rewritten entry keeps serving earlier requests.
+        columns_to_read = set(requested)
+        previous = read_cached_metadata(full_path) if use_cache else None
+        if previous:
+            columns_to_read |= set(previous.get("stored_columns", []))
+
+        df, file_metadata = parse_csv_file(full_path, columns_to_read)
+        if df is None:
+            return None, file_metadata
+        if use_cache:
+            write_cached_frame(full_path, df, file_metadata)
+        if start is not None:
+            df = df[df["datetime"] >= start]
+        if end is not None:
+            df = df[df["datetime"] <= end]
+
+    # Match requested columns
+    matching = [col for col in df.columns if col in requested and col != "datetime"]
+    if not matching:
+        print(f"[WARN] Skipping {full_path.name}: No requested columns found.")
+        return None, file_metadata
+
+    if df.empty:
+        return None, file_metadata
+
+    return df[["datetime"] + matching], file_metadata
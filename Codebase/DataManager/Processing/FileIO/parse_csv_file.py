@@ -0,0 +1,51 @@
+import pandas as pd
+
+from Codebase.DataManager.Processing.DataMGMT.parse_datetime_column import parse_datetime_column
+from Codebase.DataManager.Processing.FileIO.read_csv_file import read_csv_file
+from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
+
+
+def parse_csv_file(full_path, columns=None):
+    """
+    Parse one CSV into a frame with normalized headers and a UTC "datetime" column.
+    If `columns` is given, only those columns (and the date/time sources) are read.
+
+    Returns:
+        tuple[pd.DataFrame | None, dict]: The parsed frame (None if no valid datetime was found)
+        and the file metadata stored alongside it in the cache:
+        {"columns": [...], "header_row": int, "preamble": dict,
+         "special_value": str | None, "depth": str | None,
+         "start": str, "end": str}  # ISO min/max timestamp of the whole file
+    """
+    file = full_path.name
+
+    # Header detection, preamble metadata and the data body come from one open of the file
+    parsed = read_csv_file(full_path, columns=columns)
+    df = parsed["df"]
+    # print(f"[DEBUG] Detected header row at line {parsed['header_row']} in {file}")
+
+    # Parse datetime
+    datetime_series = parse_datetime_column(str(full_path), df)
+    if datetime_series.isna().all():
+        print(f"[WARN] No valid datetime found in {file}. Skipping.")
+        return None, {}
+
+    depth = None
+    if "depth" in df.columns:
+        depth_vals = df["depth"].dropna().unique()
+        if len(depth_vals) == 1:
+            depth = normalize_header(str(depth_vals[0]))
+        elif len(depth_vals) > 1:
+            depth = "mixed-depth"
+
+    metadata = {
+        "columns": [normalize_header(col) for col in parsed["columns"]],
+        "header_row": parsed["header_row"],
+        "preamble": parsed["metadata"],
+        "special_value": parsed["special_value"],
+        "depth": depth,
+        "start": datetime_series.min().isoformat(),
+        "end": datetime_series.max().isoformat(),
+    }
+    full_df = pd.concat([datetime_series.rename("datetime"), df.drop(columns=["datetime"], errors="ignore")], axis=1)
+    return full_df, metadata
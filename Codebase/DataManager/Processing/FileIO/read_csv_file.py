@@ -0,0 +1,64 @@
+import pandas as pd
+
+from Codebase.DataManager.Processing.FileIO.scan_csv_preamble import resolve_projection, scan_csv_preamble
+from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
+
+
+def read_csv_file(filepath, columns=None, max_scan_lines=10, **read_csv_kwargs):
+    """
+    Read a field-station CSV (preamble, header and data body) through a single open file handle.
+
+    The preamble is scanned line by line by scan_csv_preamble(), then the handle is rewound
+    to the start of the header line and handed straight to pd.read_csv, so the file is opened
+    once instead of once per processing step.
+
+    When `columns` is given, only those columns (plus the date/time and depth columns) are
+    parsed, with requested sensor values read directly as float32. Frequency, counter and ID
+    columns keep pandas' int64/float64 inference, as do columns that turn out not to be numeric.
+
+    Args:
+        filepath: Path to the CSV file.
+        columns (set[str], optional): Normalized column names to read. None reads every column.
+        max_scan_lines (int): Number of leading lines searched for the header row.
+        **read_csv_kwargs: Extra keyword arguments forwarded to pd.read_csv.
+
+    Returns:
+        dict: {
+            "header_row": int,          # line index of the header (same as detect_header_row)
+            "columns": list[str],       # raw header names (quotes stripped)
+            "metadata": dict,           # "key,value" pairs from the first two lines
+            "special_value": str|None,  # TVWS "SpecialValue" from the first two lines
+            "df": pd.DataFrame,         # data body with normalized column names
+        }
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        preamble = scan_csv_preamble(f, max_scan_lines)
+        header_pos = preamble["header_pos"]
+
+        read_csv_kwargs.setdefault("low_memory", False)
+        dtype = None
+        if columns is not None and preamble["header_line"]:
+            usecols, dtype = resolve_projection(preamble["header_line"], {normalize_header(c) for c in columns})
+            if usecols is not None:
+                read_csv_kwargs["usecols"] = usecols
+
+        f.seek(header_pos)
+        try:
+            df = pd.read_csv(f, header=0, dtype=dtype, **read_csv_kwargs)
+        except ValueError:
+            # A requested column holds non-numeric values; let pandas infer and downcast below
+            f.seek(header_pos)
+            df = pd.read_csv(f, header=0, **read_csv_kwargs)
+            for label, kind in (dtype or {}).items():
+                if kind == "float32" and label in df.columns and pd.api.types.is_float_dtype(df[label]):
+                    df[label] = df[label].astype("float32")
+
+    df.columns = [normalize_header(col) for col in df.columns]
+
+    return {
+        "header_row": preamble["header_row"],
+        "columns": preamble["columns"],
+        "metadata": preamble["metadata"],
+        "special_value": preamble["special_value"],
+        "df": df,
+    }
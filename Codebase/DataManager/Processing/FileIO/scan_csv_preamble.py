@@ -0,0 +1,124 @@
+import csv
+import re
+
+from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
+
+# Columns that are always read when a projection is requested: the datetime sources used by
+# parse_datetime_column() and the soil "depth" column used for the special subkey.
+ALWAYS_READ_COLUMNS = {"date (year-mon-day)", "time (hour-min-sec)", "simple date", "depth"}
+DATETIME_SOURCE_COLUMNS = {"date (year-mon-day)", "time (hour-min-sec)", "simple date"}
+# Frequencies (Hz in the hundreds of MHz), counters and identifiers need more than float32's 24-bit
+# mantissa, so these columns are left to pandas' int64/float64 inference.
+FULL_PRECISION_SUBSTRINGS = ("frequency", "count")
+FULL_PRECISION_WORDS = {"id", "instance", "index"}
+
+
+def _is_header_line(cols):
+    lower = [normalize_header(c) for c in cols]
+    return any("date" in col for col in lower) and (
+        any("time" in col for col in lower)
+        or any(any(keyword in col for keyword in ("soil", "moisture", "temperature")) for col in lower)
+    )
+
+
+def _split_line(line):
+    return [c.strip().replace('"', '') for c in line.strip().split(',')]
+
+
+def keeps_full_precision(column):
+    """True for normalized column names that must not be downcast to float32."""
+    words = re.split(r"[^a-z0-9]+", column)
+    return any(part in column for part in FULL_PRECISION_SUBSTRINGS) or bool(FULL_PRECISION_WORDS.intersection(words))
+
+
+def resolve_projection(header_line, columns):
+    """
+    Map normalized column names onto pd.read_csv arguments for one header line.
+
+    Returns:
+        tuple[list[int] | None, dict | None]: usecols positions and a dtype map (requested sensor
+        values as float32, date/time sources as str; frequency, counter and ID columns are left
+        out so pandas keeps them at full precision); (None, None) when the file has no known
+        date/time column, since the generic datetime fallback then needs every column.
+    """
+    # Labels exactly as pandas will see them (csv quoting removed, whitespace kept)
+    labels = next(csv.reader([header_line.rstrip("\r\n")]), [])
+    normalized = [normalize_header(label) for label in labels]
+
+    if not DATETIME_SOURCE_COLUMNS.intersection(normalized):
+        return None, None
+
+    usecols = [i for i, col in enumerate(normalized) if col in columns or col in ALWAYS_READ_COLUMNS]
+    dtype = {
+        labels[i]: "float32" for i in usecols
+        if normalized[i] in columns and normalized[i] not in ALWAYS_READ_COLUMNS
+        and not keeps_full_precision(normalized[i])
+    }
+    dtype.update({labels[i]: str for i in usecols if normalized[i] in DATETIME_SOURCE_COLUMNS})
+    return usecols, dtype
+
+
+def scan_csv_preamble(f, max_scan_lines=10):
+    """
+    Scan the preamble of an open field-station CSV with the same rules as detect_header_row().
+
+    Reads line by line from the start of `f` and stops at the header, so the caller can seek
+    to "header_pos" and hand the same handle to pd.read_csv.
+
+    Returns:
+        dict: {
+            "header_row": int,          # line index of the header (0 if none was found)
+            "header_pos": int,          # byte offset of the header line in f
+            "header_line": str | None,  # the raw header line
+            "columns": list[str],       # raw header names (quotes stripped)
+            "metadata": dict,           # "key,value" pairs from the first two lines
+            "special_value": str|None,  # TVWS "SpecialValue" from the first two lines
+        }
+    """
+    lines = []
+    raw_lines = []
+    header_row = None
+    header_pos = 0
+
+    for i in range(max_scan_lines):
+        pos = f.tell()
+        line = f.readline()
+        if not line:
+            break
+        raw_lines.append(line)
+        lines.append(_split_line(line))
+        if _is_header_line(lines[-1]):
+            header_row, header_pos = i, pos
+            break
+
+    if header_row is None:
+        header_row, header_pos = 0, 0
+
+    # The preamble is at most two lines; make sure both are available for the metadata.
+    while len(lines) < 2:
+        line = f.readline()
+        if not line:
+            break
+        lines.append(_split_line(line))
+
+    metadata = {}
+    for cols in lines[:2]:
+        if len(cols) == 2:
+            metadata[cols[0]] = cols[1]
+
+    special_value = None
+    if len(lines) >= 2:
+        lowered = [h.lower() for h in lines[0]]
+        if "specialvalue" in lowered:
+            idx = lowered.index("specialvalue")
+            if idx < len(lines[1]):
+                special_value = lines[1][idx].strip()
+
+    return {
+        "header_row": header_row,
+        "header_pos": header_pos,
+        "header_line": raw_lines[header_row] if header_row < len(raw_lines) else None,
+        "columns": lines[header_row] if header_row < len(lines) else [],
+        "metadata": metadata,
+        "special_value": special_value,
+    }
@@ -0,0 +1,35 @@
+import pandas as pd
+
+# Pre-aggregated bucket sizes, finest first. Every grouping offered by the dashboard that is
+# coarser than a minute is a whole multiple of one of these.
+ROLLUP_TIERS = ("1min", "15min", "1h", "1D")
+
+
+def build_rollup_tiers(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Aggregate one column of a loaded frame into every tier of ROLLUP_TIERS.
+
+    Buckets hold sum/count/min/max rather than the mean, so buckets from several files
+    (or several tier buckets inside one coarser grouping) can be combined exactly.
+
+    Args:
+        df (pd.DataFrame): Frame with a "datetime" column and `column`.
+        column (str): Value column to aggregate.
+
+    Returns:
+        pd.DataFrame: Long table with columns tier, bucket (naive UTC), sum, count, min, max.
+    """
+    times = pd.to_datetime(df["datetime"], errors="coerce", utc=True).dt.tz_localize(None)
+    values = pd.to_numeric(df[column], errors="coerce")
+    valid = times.notna() & values.notna()
+    series = pd.Series(values[valid].to_numpy(dtype="float64"), index=pd.DatetimeIndex(times[valid]))
+
+    tiers = []
+    for tier in ROLLUP_TIERS:
+        grouped = series.groupby(series.index.floor(tier)).agg(["sum", "count", "min", "max"])
+        grouped.index.name = "bucket"
+        grouped = grouped.reset_index()
+        grouped.insert(0, "tier", tier)
+        tiers.append(grouped)
+
+    return pd.concat(tiers, ignore_index=True)
@@ -0,0 +1,37 @@
+from Codebase.DataManager.Cache.get_cache_key import get_cache_key
+from Codebase.DataManager.Rollups.update_file_rollup import read_rollup_entry, update_file_rollup
+from Codebase.Pathing.get_cache_folder import get_cache_folder
+
+
+def load_file_rollup(csv_path, column: str):
+    """
+    Return the rollup tiers of one column of one CSV.
+
+    Rollups are stored in /Cache/Rollups under the file's cache key (path + mtime + size), one
+    Parquet table per file holding every column rolled up so far, with a JSON sidecar listing
+    those columns and their sampling interval. They are normally built in the background when
+    the file catalog picks up a new or modified CSV (see schedule_rollup_updates); a column
+    that isn't there yet is built here on first use.
+
+    Returns:
+        tuple[pd.DataFrame | None, int | None]: The long tier table for `column`
+        (tier, bucket, sum, count, min, max) or None if the file lacks it, and the
+        column's base sampling interval in seconds.
+    """
+    rollup_folder = get_cache_folder() / "Rollups"
+    try:
+        key = get_cache_key(csv_path)
+    except OSError:
+        return None, None
+
+    meta, table = read_rollup_entry(rollup_folder, key)
+    if meta is None or column not in meta.get("columns", {}):
+        update_file_rollup(csv_path, {column})
+        meta, table = read_rollup_entry(rollup_folder, key)
+        if meta is None or column not in meta.get("columns", {}):
+            return None, None
+
+    if table is None or meta["columns"][column] is None:
+        return None, None
+    rows = table[table["column"] == column].drop(columns="column")
+    return rows, meta["columns"][column]
@@ -0,0 +1,58 @@
+import pandas as pd
+
+from Codebase.DataManager.Rollups.load_file_rollup import load_file_rollup
+from Codebase.DataManager.Rollups.select_rollup_tier import select_rollup_tier
+
+
+def load_rollup_series(paths, column: str, grouping: str):
+    """
+    Serve a time grouping from the pre-aggregated rollup tiers instead of raw rows.
+
+    Per-file buckets of the nearest tier are combined (sum/count/min/max) and, when the grouping
+    is coarser than the tier, re-binned with the same left-closed, day-anchored bins as
+    DataFrame.resample, so the means match resampling the raw rows.
+
+    Args:
+        paths (list[Path]): CSV files making up the series.
+        column (str): Normalized value column.
+        grouping (str): Dashboard time grouping, e.g. "15min", "1H", "1D".
+
+    Returns:
+        tuple[pd.DataFrame, int | None] | None: Frame with datetime (naive UTC), mean, min, max
+        and count per bucket, and the series' base sampling interval in seconds. None if the
+        grouping has no usable tier or no file holds the column.
+    """
+    tier = select_rollup_tier(grouping)
+    if tier is None:
+        return None
+
+    parts = []
+    bases = []
+    for path in paths:
+        rows, base = load_file_rollup(path, column)
+        if rows is None:
+            continue
+        parts.append(rows[rows["tier"] == tier])
+        if base:
+            bases.append(base)
+
+    if not parts:
+        return None
+
+    buckets = pd.concat(parts, ignore_index=True)
+    aggregations = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+    combined = buckets.groupby("bucket").agg(aggregations)
+
+    grouping_delta = pd.Timedelta(grouping.lower())
+    if grouping_delta != pd.Timedelta(tier):
+        combined = combined.resample(grouping_delta).agg(aggregations)
+    combined = combined[combined["count"] > 0]
+
+    result = pd.DataFrame({
+        "datetime": combined.index,
+        "mean": (combined["sum"] / combined["count"]).to_numpy(),
+        "min": combined["min"].to_numpy(),
+        "max": combined["max"].to_numpy(),
+        "count": combined["count"].astype("int64").to_numpy(),
+    })
+    return result, (min(bases) if bases else None)
@@ -0,0 +1,56 @@
+import queue
+import threading
+from pathlib import Path
+
+from Codebase.DataManager.Processing.FileIO.scan_csv_preamble import ALWAYS_READ_COLUMNS
+from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
+from Codebase.DataManager.Rollups.update_file_rollup import update_file_rollup
+
+_pending = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _run_pending():
+    while True:
+        path, columns = _pending.get()
+        try:
+            update_file_rollup(path, columns)
+        except Exception as e:
+            print(f"[WARN] Rollup update failed for {path}: {e}")
+        finally:
+            _pending.task_done()
+
+
+def wait_for_rollup_updates() -> None:
+    """Block until every scheduled rollup update has been written."""
+    _pending.join()
+
+
+def schedule_rollup_updates(entries) -> int:
+    """
+    Queue rollup builds for new or modified catalog entries on a background thread.
+
+    Every value column in the entry's header (everything except the date/time and depth columns)
+    is rolled up, so the first coarse plot over a long range reads the tiers instead of raw rows.
+    Columns whose tiers already exist under the file's current cache key are skipped.
+
+    Returns:
+        int: Number of files queued.
+    """
+    global _worker
+    queued = 0
+    for entry in entries:
+        columns = {normalize_header(col) for col in entry.get("columns") or []} - ALWAYS_READ_COLUMNS
+        columns.discard("")
+        if columns:
+            _pending.put((Path(entry["path"]), columns))
+            queued += 1
+
+    if queued:
+        with _worker_lock:
+            if _worker is None or not _worker.is_alive():
+                _worker = threading.Thread(target=_run_pending, name="rollup-builder", daemon=True)
+                _worker.start()
+        print(f"[DEBUG] Queued rollup updates for {queued} new or modified files")
+    return queued
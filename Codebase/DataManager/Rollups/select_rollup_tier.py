@@ -0,0 +1,26 @@
+import pandas as pd
+
+from Codebase.DataManager.Rollups.build_rollup_tiers import ROLLUP_TIERS
+
+
+def select_rollup_tier(grouping):
+    """
+    Pick the coarsest rollup tier that divides a time grouping evenly.
+
+    Returns:
+        str | None: e.g. "5min" -> "1min", "1H" -> "1h", "1D" -> "1D"; None for "raw",
+        sub-minute or unparseable groupings, which must be computed from raw rows.
+    """
+    if not grouping or grouping == "raw":
+        return None
+    try:
+        grouping_delta = pd.Timedelta(grouping.lower())
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+    best = None
+    for tier in ROLLUP_TIERS:
+        tier_delta = pd.Timedelta(tier)
+        if tier_delta <= grouping_delta and grouping_delta % tier_delta == pd.Timedelta(0):
+            best = tier
+    return best
@@ -0,0 +1,94 @@
+import json
+import threading
+
+import pandas as pd
+
+from Codebase.DataManager.Cache.get_cache_key import get_cache_key, get_path_hash
+from Codebase.DataManager.Cache.write_atomically import TEMP_SUFFIX, write_atomically
+from Codebase.DataManager.Processing.FileIO.load_csv_file import load_csv_file
+from Codebase.DataManager.Rollups.build_rollup_tiers import build_rollup_tiers
+from Codebase.Pathing.get_cache_folder import get_cache_folder
+
+# Serializes rollup writes between dashboard requests and the background builder (see schedule_rollup_updates)
+ROLLUP_WRITE_LOCK = threading.RLock()
+
+
+def read_rollup_entry(rollup_folder, key):
+    """Return (sidecar metadata, tier table) of one rollup entry, or (None, None) if absent or unreadable."""
+    meta_path = rollup_folder / f"{key}.json"
+    table_path = rollup_folder / f"{key}.parquet"
+    if not meta_path.exists():
+        return None, None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        table = pd.read_parquet(table_path) if table_path.exists() else None
+        return meta, table
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable rollup {key}: {e}")
+        return None, None
+
+
+def _base_seconds(df, column):
+    # Smallest spacing between samples of the column in whole seconds, as measured for raw series
+    valid = df[column].notna()
+    times = pd.to_datetime(df.loc[valid, "datetime"], errors="coerce", utc=True).dropna().sort_values()
+    diffs = times.diff().dt.total_seconds().dropna()
+    diffs = diffs[diffs > 0.1]
+    return int(round(diffs.min())) if not diffs.empty else None
+
+
+def update_file_rollup(csv_path, columns) -> None:
+    """
+    Make sure the rollup entry of one CSV covers every column in `columns`.
+
+    Columns already rolled up under the file's current cache key are skipped; the rest are read
+    in a single load_csv_file() call and appended to the file's Parquet table. Entries of older
+    versions of the file (same path hash, different key) are deleted.
+    """
+    rollup_folder = get_cache_folder() / "Rollups"
+    with ROLLUP_WRITE_LOCK:
+        try:
+            key = get_cache_key(csv_path)
+        except OSError:
+            return
+
+        meta, table = read_rollup_entry(rollup_folder, key)
+        meta = meta or {"source": str(csv_path), "columns": {}}
+        missing = {column for column in columns if column not in meta["columns"]}
+        if not missing:
+            return
+
+        df, _ = load_csv_file(csv_path, missing)
+        added = []
+        for column in sorted(missing):
+            rows = None
+            if df is not None and column in df.columns:
+                rows = build_rollup_tiers(df, column)
+            if rows is None or rows.empty:
+                # Files without the column are recorded too, so they aren't re-read on every request
+                meta["columns"][column] = None
+                continue
+            meta["columns"][column] = _base_seconds(df, column)
+            rows.insert(0, "column", column)
+            added.append(rows)
+
+        if added:
+            table = pd.concat(([table] if table is not None else []) + added, ignore_index=True)
+
+        try:
+            rollup_folder.mkdir(parents=True, exist_ok=True)
+            for stale in rollup_folder.glob(f"{get_path_hash(csv_path)}-*"):
+                if not stale.name.startswith(key) and not stale.name.endswith(TEMP_SUFFIX):
+                    stale.unlink(missing_ok=True)
+
+            def write_meta(path):
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+
+            # Readers (load_file_rollup) don't take the lock, so files are swapped in whole
+            if table is not None:
+                write_atomically(rollup_folder / f"{key}.parquet", lambda path: table.to_parquet(path, index=False))
+            write_atomically(rollup_folder / f"{key}.json", write_meta)
+        except Exception as e:
+            print(f"[WARN] Could not store rollup for {csv_path}: {e}")
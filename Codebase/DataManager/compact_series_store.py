@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+from Codebase.DataManager.Processing.FileIO.scan_csv_preamble import keeps_full_precision
+
+
+def _epoch_ns(datetimes) -> np.ndarray:
+    # tz-aware columns are converted to UTC; naive ones are taken as UTC already
+    values = pd.to_datetime(datetimes, errors="coerce", utc=True)
+    return values.to_numpy(dtype="datetime64[ns]").view("int64")
+
+
+class CompactSeries:
+    """
+    One sensor column as two contiguous arrays, sorted by time once at construction:
+    `times` (int64 epoch nanoseconds, UTC) and `values` (float32, or float64 for the frequency,
+    counter and ID columns that keeps_full_precision() exempts from downcasting).
+
+    12 bytes per sample for sensor readings, versus a tz-aware DataFrame column pair plus index and per-role copies.
+    Windows and frames handed out by this class are views over the same memory.
+    """
+
+    __slots__ = ("times", "values")
+
+    def __init__(self, times: np.ndarray, values: np.ndarray):
+        self.times = times
+        self.values = values
+
+    @classmethod
+    def from_frames(cls, frames, column: str) -> "CompactSeries":
+        """Concatenate `column` of every frame that has it, drop missing timestamps and sort once."""
+        dtype = "float64" if keeps_full_precision(column) else "float32"
+        times = [_epoch_ns(df["datetime"]) for df in frames if column in df.columns]
+        values = [
+            pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=dtype)
+            for df in frames if column in df.columns
+        ]
+        return cls._sorted(
+            np.concatenate(times) if times else np.empty(0, dtype="int64"),
+            np.concatenate(values) if values else np.empty(0, dtype=dtype),
+        )
+
+    @classmethod
+    def merge(cls, series_list) -> "CompactSeries":
+        """Combine several series (e.g. every special key of an instance) into one sorted series."""
+        series_list = list(series_list)
+        if len(series_list) == 1:
+            return series_list[0]
+        return cls._sorted(
+            np.concatenate([s.times for s in series_list]),
+            np.concatenate([s.values for s in series_list]),
+        )
+
+    @classmethod
+    def _sorted(cls, times: np.ndarray, values: np.ndarray) -> "CompactSeries":
+        valid = times != np.iinfo(np.int64).min  # NaT
+        if not valid.all():
+            times, values = times[valid], values[valid]
+        if len(times) > 1 and (np.diff(times) < 0).any():
+            order = np.argsort(times, kind="stable")
+            times, values = times[order], values[order]
+        return cls(np.ascontiguousarray(times), np.ascontiguousarray(values))
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def nbytes(self) -> int:
+        return self.times.nbytes + self.values.nbytes
+
+    def window(self, start=None, end=None) -> "CompactSeries":
+        """Zero-copy slice covering [start, end] (UTC pd.Timestamps; None leaves that side open)."""
+        lo = 0 if start is None else np.searchsorted(self.times, pd.Timestamp(start).value, side="left")
+        hi = len(self.times) if end is None else np.searchsorted(self.times, pd.Timestamp(end).value, side="right")
+        return CompactSeries(self.times[lo:hi], self.values[lo:hi])
+
+    def base_interval(self):
+        """Smallest spacing between samples in whole seconds (ignoring sub-0.1 s jitter), or None."""
+        if len(self.times) < 2:
+            return None
+        diffs = np.diff(self.times)
+        diffs = diffs[diffs > 100_000_000]
+        return int(round(diffs.min() / 1e9)) if len(diffs) else None
+
+    def to_frame(self, label: str) -> pd.DataFrame:
+        """DataFrame view with a naive-UTC "datetime" column and the values under `label`; no data is copied."""
+        return pd.DataFrame(
+            {"datetime": self.times.view("datetime64[ns]"), label: self.values},
+            copy=False,
+        )
+
+
+class CompactSeriesStore:
+    """
+    Loaded sensor data keyed by (category, instance key, special key, column), one CompactSeries each.
+
+    The compact counterpart of DataLoader.data: instead of a list of per-file DataFrames per special
+    key, every column is concatenated and sorted once into contiguous arrays.
+
+    Key format:
+        ("tvws", "tvws_instance0", "dirt", "drssi") -> CompactSeries
+        ("soil", "soil_instance1", "-3", "soil moisture value") -> CompactSeries
+    """
+
+    def __init__(self):
+        self._series = {}
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(series.nbytes for series in self._series.values())
+
+    def put(self, category: str, instance_key: str, special_key: str, column: str, series: CompactSeries) -> None:
+        self._series[(category, instance_key, special_key, column)] = series
+
+    def get(self, category: str, instance_key: str, special_key: str, column: str):
+        return self._series.get((category, instance_key, special_key, column))
+
+    def update(self, other: "CompactSeriesStore") -> None:
+        """Add every series of another store, merging with series already held under the same key."""
+        for key, series in other._series.items():
+            existing = self._series.get(key)
+            if existing is None or existing is series:
+                self._series[key] = series
+            else:
+                self._series[key] = CompactSeries.merge([existing, series])
+
+    def find(self, category: str, column: str, instance_filter=None) -> dict:
+        """
+        Return {(instance key, special key): CompactSeries} for one category and column.
+        instance_filter, if given, is called with each instance key and keeps those it returns True for.
+        """
+        return {
+            (instance_key, special_key): series
+            for (cat, instance_key, special_key, col), series in self._series.items()
+            if cat == category and col == column and (instance_filter is None or instance_filter(instance_key))
+        }
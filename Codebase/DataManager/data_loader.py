@@ -1,34 +1,48 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
-import re
 
-from Codebase.DataManager.Processing.FileIO.get_all_csv_files import get_all_csv_files
-from Codebase.DataManager.Processing.Header.detect_header_row import detect_header_row
+from Codebase.DataManager.compact_series_store import CompactSeries, CompactSeriesStore
+from Codebase.DataManager.file_catalog import get_file_catalog
+from Codebase.DataManager.Processing.FileIO.iter_csv_file import DEFAULT_CHUNKSIZE, iter_csv_file
+from Codebase.DataManager.Processing.FileIO.load_csv_file import load_csv_file
+from Codebase.DataManager.Processing.DataMGMT.to_utc_timestamp import to_utc_timestamp
 from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
 from Codebase.Pathing.get_data_folder import get_data_folder
 from Codebase.Pathing.get_project_root import get_project_root
-from Codebase.DataManager.Processing.DataMGMT.parse_datetime_column import parse_datetime_column
 from Codebase.DataManager.Processing.DataMGMT.scan_available_columns_by_type import scan_available_columns_by_type
 
 class DataLoader:
-    def __init__(self, dropdown_blacklist=None):
+    def __init__(self, dropdown_blacklist=None, use_cache=True, workers=None):
         self.project_root = get_project_root()
         self.data_folder = get_data_folder()
 
+        # When enabled, every parsed CSV is stored as a typed Parquet file under /Cache
+        # (keyed by path, mtime and size) and later loads read only the requested columns from it.
+        self.use_cache = use_cache
+
+        # Number of worker processes load_data() fans matching files out to (None/1 = serial).
+        self.workers = workers
+
+        # Indexed catalog of every CSV under /Data (category, instance, special value, header, time range),
+        # persisted in /Cache and refreshed incrementally by mtime.
+        self.catalog = get_file_catalog(refresh=True)
+        self.all_csv_files = self.catalog.paths()
+
         # Dictionary used to track which types of data have been found in the data folder.
         # This is populated by scan_available_data_types() and stores a set of type names (e.g., "tvws", "soil", etc.).
-        # These are detected based on filename prefixes during recursive folder scanning.
+        # These are detected based on filename prefixes of the catalogued files.
         self.data_types_available = set()
 
-        # Scan the data folder recursively to detect the first occurrence of each known data type.
+        # Look up which known data types occur in the catalog.
         # Recognized types include: "tvws", "soil", "ambient", "sdr".
         # Adds each detected type (as a string) to self.data_types_available.
         self.scan_available_data_types()
 
         # A dictionary mapping each data type (e.g., "tvws", "soil") to a list of available column names
-        # extracted from the first valid CSV file found in each corresponding subfolder under /Data.
+        # collected from the headers of the CSV files in each corresponding subfolder under /Data/Train.
         # Columns listed in the provided blacklist will be excluded from the results.
         # Format:
         # {
@@ -39,7 +53,9 @@ class DataLoader:
         self.column_list_by_type = scan_available_columns_by_type(dropdown_blacklist)
         # print(self.column_list_by_type)
 
-        self.all_csv_files = get_all_csv_files()
+        # Compact alternative to self.data used by the dashboard: one sorted int64/float array pair
+        # per (category, instance, special, column). Filled by store_series().
+        self.series = CompactSeriesStore()
 
         self.data = {}
         """
@@ -116,10 +132,10 @@ class DataLoader:
         """
 
     @classmethod
-    def from_cached_state(cls, dropdown_blacklist, data_types_available, column_list_by_type, all_csv_files):
+    def from_cached_state(cls, dropdown_blacklist, data_types_available, column_list_by_type, all_csv_files=None):
         """
         Reconstruct a DataLoader object from cached serialized values.
-        Used when loading from a Dash dcc.Store or similar.
+        Used by the dashboard's server-side loader sessions. all_csv_files defaults to the file catalog's paths.
         """
         obj = cls.__new__(cls)  # Create an uninitialized instance
         obj.project_root = get_project_root()
@@ -127,135 +143,179 @@ class DataLoader:
 
         obj.data_types_available = set(data_types_available)
         obj.column_list_by_type = column_list_by_type
-        obj.all_csv_files = [Path(p) for p in all_csv_files]
+        obj.catalog = get_file_catalog()
+        obj.all_csv_files = [Path(p) for p in all_csv_files] if all_csv_files is not None else obj.catalog.paths()
         obj.blacklist = dropdown_blacklist
+        obj.use_cache = True
+        obj.workers = None
+        obj.series = CompactSeriesStore()
         obj.data = {}
 
         return obj
 
     def scan_available_data_types(self):
         """
-        Recursively scan self.data_folder and collect the first occurrence of each known data type
-        (by filename prefix). Updates self.data_types_available as a set: {"tvws", "ambient", ...}
+        Collect each known data type that at least one catalogued file name starts with.
+        Updates self.data_types_available as a set: {"tvws", "ambient", ...}
         """
         known_types = {"tvws", "soil", "ambient", "sdr"}
-        self.data_types_available = set()
+        self.data_types_available = self.catalog.data_types(known_types)
 
-        for root, _, files in os.walk(self.data_folder):
-            for file in sorted(files):  # consistent order
-                if not file.lower().endswith(".csv"):
-                    continue
+    def load_data(self, csv_category: str, instance_id: int, set_of_columns: set, workers: int = None,
+                  start=None, end=None) -> None:
+        """
+        Load the requested columns of every CSV matching the category/instance into self.data.
+
+        Args:
+            workers (int, optional): Number of worker processes used to parse the matching files.
+                                     Defaults to self.workers; None or 1 loads serially. Results are
+                                     stored in file order either way.
+            start, end (optional): Time window (anything pd.Timestamp accepts; naive values are UTC).
+                                   Files the catalog knows to lie outside it are not read, and rows
+                                   outside it are dropped as each file is loaded.
+        """
+        frames = self.load_frames(csv_category, instance_id, set_of_columns, workers=workers, start=start, end=end)
+        self.store_frames(csv_category, instance_id, frames)
 
-                name = file.lower()
-                for dtype in known_types:
-                    if dtype not in self.data_types_available and name.startswith(dtype):
-                        self.data_types_available.add(dtype)
-                        # print(f"[INFO] Found type: {dtype}")
-                        if self.data_types_available == known_types:
-                            return  # all types found, stop early
+    def load_frames(self, csv_category: str, instance_id: int, set_of_columns: set, workers: int = None,
+                    start=None, end=None) -> list:
+        """
+        Same as load_data(), but return the loaded frames instead of storing them in self.data.
 
-    def load_data(self, csv_category: str, instance_id: int, set_of_columns: set) -> None:
+        Returns:
+            list[tuple[Path, pd.DataFrame, dict]]: (file path, frame, file metadata) in file order.
+            Pass the list to store_frames() to add it to self.data.
+        """
         csv_category = csv_category.lower()
-        all_csv_files = self.all_csv_files
-
-        for full_path in all_csv_files:
-            file = full_path.name
-            # print(f"[DEBUG] Found file: {file}")
-
-            if not self._matches_file(file, csv_category, instance_id):
-                # print("file does not match")
-                continue
+        workers = self.workers if workers is None else workers
+        requested = {normalize_header(col) for col in set_of_columns}
+        start, end = to_utc_timestamp(start), to_utc_timestamp(end)
+
+        matched_files = self.catalog.find(csv_category, instance_id, start, end)
+        # print(f"[DEBUG] Matched {len(matched_files)} files for category '{csv_category}', instance '{instance_id}'")
+
+        results = []
+        if workers and workers > 1 and len(matched_files) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(load_csv_file, path, requested, self.use_cache, start, end) for path in matched_files]
+                # Collect in submission order so self.data is identical to a serial load
+                for full_path, future in zip(matched_files, futures):
+                    try:
+                        final_df, file_metadata = future.result()
+                    except Exception as e:
+                        print(f"[ERROR] Skipping {full_path.name} due to error: {e}")
+                        continue
+                    results.append((full_path, final_df, file_metadata))
+        else:
+            for full_path in matched_files:
+                try:
+                    final_df, file_metadata = load_csv_file(full_path, requested, self.use_cache, start, end)
+                except Exception as e:
+                    print(f"[ERROR] Skipping {full_path.name} due to error: {e}")
+                    continue
+                results.append((full_path, final_df, file_metadata))
+
+        # Remember each file's time span (also for files with no rows in the window) so later
+        # date-window queries can skip it without reading it
+        for full_path, final_df, file_metadata in results:
+            if file_metadata.get("start"):
+                self.catalog.record_time_range(full_path, file_metadata["start"], file_metadata["end"])
+            elif final_df is not None and start is None and end is None:
+                self.catalog.record_time_range(full_path, final_df["datetime"].min(), final_df["datetime"].max())
+        self.catalog.save()
+
+        return [(full_path, final_df, file_metadata) for full_path, final_df, file_metadata in results
+                if final_df is not None]
+
+    def iter_data(self, csv_category: str, instance_id: int, set_of_columns: set,
+                  start=None, end=None, chunksize: int = DEFAULT_CHUNKSIZE):
+        """
+        Stream the requested columns of every matching CSV in bounded-memory chunks.
 
+        Unlike load_data(), nothing is kept in self.data: each chunk is date-filtered to
+        [start, end] and yielded as soon as it is parsed. Files the catalog already knows to lie
+        outside the window are skipped unopened, and a file is abandoned at the first chunk past
+        `end`, so very large merged exports can be processed without loading them whole.
 
-            # print(f"[DEBUG] Matched: {file} for category '{csv_category}', instance '{instance_id}'")
+        Args:
+            start, end: Optional window bounds (anything pd.Timestamp accepts; naive values are UTC).
+            chunksize (int): Rows parsed per chunk.
 
+        Yields:
+            tuple[Path, pd.DataFrame, dict]: (file path, chunk, file metadata), the same shape
+            as the entries returned by load_frames().
+        """
+        csv_category = csv_category.lower()
+        for full_path in self.catalog.find(csv_category, instance_id, start, end):
             try:
-                # Detect header line
-                header_row_index, _ = detect_header_row(str(full_path))
-                # print(f"[DEBUG] Detected header row at line {header_row_index} in {file}")
-
-                # Read CSV starting after header
-                df = pd.read_csv(full_path, skiprows=header_row_index, header=0, low_memory=False)
-                df.columns = [normalize_header(col) for col in df.columns]
-
-                # print(f"[DEBUG] Cleaned column names: {df.columns.tolist()}")
-
-                # Parse datetime
-                datetime_series = parse_datetime_column(str(full_path), df)
-                if datetime_series.isna().all():
-                    print(f"[WARN] No valid datetime found in {file}. Skipping.")
-                    continue
-
-                # Match requested columns
-                requested = {normalize_header(col) for col in set_of_columns}
-
-                matching = [col for col in df.columns if col in requested]
-                if not matching:
-                    print(f"[WARN] Skipping {file}: No requested columns found.")
-                    continue
+                for chunk, file_metadata in iter_csv_file(full_path, set_of_columns, start, end, chunksize):
+                    yield full_path, chunk, file_metadata
+            except Exception as e:
+                print(f"[ERROR] Skipping {full_path.name} due to error: {e}")
 
-                # 🔍 Determine special subkey (TVWS → SpecialValue, Soil → Depth)
-                special_key = "unknown"
-                if csv_category == "tvws":
-                    try:
-                        with open(full_path, "r", encoding="utf-8") as f:
-                            headers = next(f).strip().split(",")
-                            values = next(f).strip().split(",")
-                            if "specialvalue" in [h.lower() for h in headers]:
-                                idx = [h.lower() for h in headers].index("specialvalue")
-                                special_key = values[idx].strip()
-                    except Exception as e:
-                        print(f"[WARN] Failed to extract SpecialValue from {file}: {e}")
-
-                elif csv_category == "soil":
-                    print(f"[DEBUG] Soil columns: {df.columns}")
-                    if "depth" in df.columns:
-                        depth_vals = df["depth"].dropna().unique()
-                        print(f"[DEBUG] Found depths: {depth_vals}")
-                        if len(depth_vals) == 1:
-                            special_key = normalize_header(str(depth_vals[0]))
-                        elif len(depth_vals) > 1:
-                            special_key = "mixed-depth"
-
-                # 📦 Construct final DataFrame
-                final_df = pd.concat([datetime_series.rename("datetime"), df[matching]], axis=1)
-
-                # 🗂 Set correct storage key
-                if csv_category in {"ambientweather", "atmospheric"}:
-                    key = csv_category  # no instance
-                else:
-                    key = f"{csv_category}_instance{instance_id}"
-
-                self.data.setdefault(csv_category, {})
-                self.data[csv_category].setdefault(key, {})
-                self.data[csv_category][key].setdefault(special_key, {"data": []})
-                self.data[csv_category][key][special_key]["data"].append(final_df)
-
-                '''
-                print(f"[DEBUG] Attempting to store data:")
-                print(f"  - Category: {csv_category}")
-                print(f"  - Key: {key}")
-                print(f"  - Special Key: {special_key}")
-                print(f"  - Columns: {final_df.columns.tolist()}")
-                print(f"  - Num rows: {len(final_df)}")
-                
-                '''
-
-                # print(f"[INFO] Loaded: {file} | Subkey: {special_key} | Columns: {list(final_df.columns)}")
+    def store_frames(self, csv_category: str, instance_id: int, frames: list) -> None:
+        """Add frames returned by load_frames() to self.data."""
+        csv_category = csv_category.lower()
+        for full_path, final_df, file_metadata in frames:
+            self._store_frame(csv_category, instance_id, final_df, file_metadata)
 
-            except Exception as e:
-                print(f"[ERROR] Skipping {file} due to error: {e}")
+    def compact_frames(self, csv_category: str, instance_id: int, frames: list) -> CompactSeriesStore:
+        """
+        Convert frames returned by load_frames() into a CompactSeriesStore without touching self.data.
+        Frames are grouped by special key and each value column is concatenated and sorted once.
+        """
+        csv_category = csv_category.lower()
+        instance_key = self.storage_key(csv_category, instance_id)
+
+        by_special = {}
+        for _, final_df, file_metadata in frames:
+            by_special.setdefault(self._special_key(csv_category, file_metadata), []).append(final_df)
+
+        store = CompactSeriesStore()
+        for special_key, dfs in by_special.items():
+            columns = {col for df in dfs for col in df.columns if col != "datetime"}
+            for column in sorted(columns):
+                store.put(csv_category, instance_key, special_key, column, CompactSeries.from_frames(dfs, column))
+        return store
+
+    def store_series(self, csv_category: str, instance_id: int, frames: list) -> None:
+        """Add frames returned by load_frames() to self.series in compact form."""
+        self.series.update(self.compact_frames(csv_category, instance_id, frames))
+
+    def _store_frame(self, csv_category: str, instance_id: int, final_df, file_metadata: dict) -> None:
+        # 🔍 Determine special subkey (TVWS → SpecialValue, Soil → Depth)
+        special_key = self._special_key(csv_category, file_metadata)
+
+        # 🗂 Set correct storage key
+        key = self.storage_key(csv_category, instance_id)
+
+        self.data.setdefault(csv_category, {})
+        self.data[csv_category].setdefault(key, {})
+        self.data[csv_category][key].setdefault(special_key, {"data": []})
+        self.data[csv_category][key][special_key]["data"].append(final_df)
+
+        # print(f"[INFO] Loaded: {key} | Subkey: {special_key} | Columns: {list(final_df.columns)}")
+
+    @staticmethod
+    def storage_key(csv_category: str, instance_id) -> str:
+        if csv_category in {"ambientweather", "atmospheric"}:
+            return csv_category  # no instance
+        return f"{csv_category}_instance{instance_id}"
+
+    @staticmethod
+    def _special_key(csv_category: str, file_metadata: dict) -> str:
+        if csv_category == "tvws":
+            return file_metadata.get("special_value") or "unknown"
+        if csv_category == "soil":
+            return file_metadata.get("depth") or "unknown"
+        return "unknown"
 
     def load_metadata(self, csv_category: str, instance_id: int) -> list:
-        all_csv_files = self.all_csv_files
         metadata_list = []
 
-        for full_path in all_csv_files:
+        for full_path in self.catalog.find(csv_category, instance_id):
             file = os.path.basename(full_path)
 
-            if not self._matches_file(file, csv_category, instance_id):
-                continue
-
             try:
                 metadata = self._extract_metadata(full_path)
                 if metadata:
@@ -266,35 +326,12 @@ class DataLoader:
 
         return metadata_list
 
-    def _matches_file(self, filename: str, category: str, instance_id: int) -> bool:
-        filename = filename.lower()
-        category = category.lower()
-
-        # Check category match
-        if category == "ambient":
-            cat_match = "ambient" in filename
-            print(f"[DEBUG] Matching ambient file '{filename}': cat_match={cat_match}")
-            return cat_match
-
-        cat_match = category in filename
-
-        if instance_id is None:
-            print(
-                f"[DEBUG] Matching file '{filename}': cat_match={cat_match}, instance_id=None (skipping instance check)")
-            return cat_match
-
-        instance_pattern = re.compile(rf"_{re.escape(str(instance_id))}(?:_|\.|-)?")
-        instance_match = bool(instance_pattern.search(filename))
-
-        print(f"[DEBUG] Matching file '{filename}': cat_match={cat_match}, instance_match={instance_match}")
-        return cat_match and instance_match
-
     def _extract_metadata(self, file_path: str) -> dict:
         metadata = {}
         with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+            lines = [f.readline() for _ in range(2)]
 
-        for line in lines[:2]:
+        for line in lines:
             key_value = line.strip().split(",")
             if len(key_value) == 2:
                 metadata[key_value[0].strip()] = key_value[1].strip()
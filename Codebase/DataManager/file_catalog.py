@@ -0,0 +1,409 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from Codebase.DataManager.Processing.DataMGMT.to_utc_timestamp import to_utc_timestamp
+from Codebase.DataManager.Processing.FileIO.scan_csv_preamble import scan_csv_preamble
+from Codebase.DataManager.Processing.Header.normalize_header import normalize_header
+from Codebase.DataManager.Rollups.schedule_rollup_updates import schedule_rollup_updates
+from Codebase.Pathing.get_cache_folder import get_cache_folder
+from Codebase.Pathing.get_data_folder import get_data_folder
+
+# Bump when the entry layout changes so an old catalog file is rebuilt instead of misread.
+CATALOG_VERSION = 2
+
+# get_file_catalog(refresh=True) re-walks /Data at most this often; page loads in between reuse the index.
+MIN_REFRESH_INTERVAL_S = 30
+# Roll up new or modified files in the background as soon as a refresh picks them up
+BUILD_ROLLUPS_ON_REFRESH = True
+
+# "TVWSData_0_2025-06-06.csv" -> prefix "tvwsdata"
+PREFIX_PATTERN = re.compile(r"^[a-z]+")
+# The "_<number>" token right after the name prefix: "soildata_1_2025-06-06.csv" -> 1 (date parts are not instances)
+INSTANCE_PATTERN = re.compile(r"^[a-z]+_(-?\d+)(?=[_.\-]|$)")
+# Instance as read by the special-value dropdowns: the first "-<n>-" / "_<n>_" token
+DROPDOWN_INSTANCE_PATTERN = re.compile(r"[-_](\-?\d+)[-_]")
+# Name prefixes of the families whose preamble carries a depth ("Depth,-3" on the second line)
+DEPTH_FAMILIES = ("soil",)
+
+
+def _read_preamble(path):
+    # Raw line reads only, no pandas: the header and SpecialValue (as scan_csv_preamble finds them) and the first two lines.
+    lines, columns, special_value = [], [], None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            scanned = scan_csv_preamble(f)
+            columns, special_value = scanned["columns"], scanned["special_value"]
+            f.seek(0)
+            for _ in range(2):
+                line = f.readline()
+                if not line:
+                    break
+                lines.append([c.strip().replace('"', '') for c in line.strip().split(",")])
+    except (OSError, UnicodeDecodeError):
+        pass
+    return lines, columns, special_value
+
+
+def _schema_fingerprint(columns) -> str:
+    normalized = "|".join(normalize_header(col) for col in columns)
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+
+
+class FileCatalog:
+    """
+    Index of every CSV under /Data, built once and kept between runs in /Cache/file_catalog.json.
+
+    Each entry records the file's name prefix (category), instance ids, the special value / depth
+    from its preamble, its header columns with a schema fingerprint and, once the file has been
+    loaded, the min/max timestamp it holds. Lookups by (category, instance) are dictionary hits
+    after the first query; refresh() re-indexes only files whose mtime or size changed.
+
+    Entry format:
+        {
+            "path": "/.../Data/Train/TVWS/TVWSData_0_2025-06-06.csv",
+            "mtime_ns": 1717670000000000000,
+            "size": 482113,
+            "prefix": "tvwsdata",
+            "instance_ids": [0],
+            "dropdown_instance": 0,       # instance shown in the special-value dropdown
+            "special_value": "dirt",      # TVWS SpecialValue (None if absent)
+            "depth": "-3",                # Soil depth from the preamble (None for other families)
+            "data_type": "tvws",          # Folder under /Data/Train (None outside it)
+            "columns": ["Date (Year-Mon-Day)", "Time (Hour-Min-Sec)", "DRSSI", ...],
+            "schema": "9f1c2e0a7b3d",     # Fingerprint of the normalized header
+            "start": "2025-06-06T00:00:00+00:00",  # None until the file has been loaded
+            "end": "2025-06-06T23:59:55+00:00",
+        }
+    """
+
+    def __init__(self, data_folder=None, catalog_path=None):
+        self.data_folder = Path(data_folder) if data_folder else get_data_folder()
+        self.catalog_path = Path(catalog_path) if catalog_path else get_cache_folder() / "file_catalog.json"
+        self.entries = {}
+        self.version = 0
+        self.last_refresh = None
+        self.changed_paths = []  # Entries (re)built by the last refresh()
+        self._reported_drift = set()
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._reset_indexes()
+
+    def _reset_indexes(self):
+        self._by_prefix = {}
+        self._by_instance = {}
+        self._lookup_cache = {}
+
+    def _index_entry(self, entry):
+        path = entry["path"]
+        self._by_prefix.setdefault(entry["prefix"], set()).add(path)
+        for instance_id in entry["instance_ids"]:
+            self._by_instance.setdefault(instance_id, set()).add(path)
+
+    def _rebuild_indexes(self):
+        self._reset_indexes()
+        for entry in self.entries.values():
+            self._index_entry(entry)
+
+    def _data_type(self, path: Path):
+        # Same rule as the old per-folder scan: the first folder below /Data/Train
+        try:
+            parts = path.relative_to(self.data_folder / "Train").parts
+        except ValueError:
+            return None
+        return parts[0].lower() if len(parts) >= 2 else None
+
+    def _build_entry(self, path: Path, stat) -> dict:
+        name = path.name.lower()
+        prefix_match = PREFIX_PATTERN.match(name)
+        dropdown_match = DROPDOWN_INSTANCE_PATTERN.search(path.name)
+
+        prefix = prefix_match.group(0) if prefix_match else name
+        instance_match = INSTANCE_PATTERN.match(name)
+
+        preamble, columns, special_value = _read_preamble(path)
+        depth = None
+        if any(family in prefix for family in DEPTH_FAMILIES) and len(preamble) >= 2 and len(preamble[1]) >= 2:
+            depth = preamble[1][1]
+
+        return {
+            "path": str(path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "prefix": prefix,
+            "instance_ids": [int(instance_match.group(1))] if instance_match else [],
+            "dropdown_instance": int(dropdown_match.group(1)) if dropdown_match else None,
+            "special_value": special_value,
+            "depth": depth,
+            "data_type": self._data_type(path),
+            "columns": columns,
+            "schema": _schema_fingerprint(columns),
+            "start": None,
+            "end": None,
+        }
+
+    def load(self) -> None:
+        """Read the persisted catalog, if there is a compatible one."""
+        if not self.catalog_path.exists():
+            return
+        try:
+            with open(self.catalog_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("catalog_version") != CATALOG_VERSION:
+                return
+            with self._lock:
+                self.entries = {entry["path"]: entry for entry in stored.get("entries", [])}
+                self._rebuild_indexes()
+        except Exception as e:
+            print(f"[WARN] Ignoring unreadable file catalog {self.catalog_path}: {e}")
+
+    def save(self) -> None:
+        """Persist the catalog if anything changed since it was loaded or last saved."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"catalog_version": CATALOG_VERSION, "entries": list(self.entries.values())}
+            self._dirty = False
+        try:
+            self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.catalog_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.catalog_path)
+        except Exception as e:
+            print(f"[WARN] Could not save file catalog: {e}")
+
+    def refresh(self) -> bool:
+        """
+        Walk /Data and re-index only new or modified CSVs; drop entries for deleted files.
+
+        Returns:
+            bool: True if the catalog changed.
+        """
+        seen = set()
+        changed = False
+        with self._lock:
+            self.changed_paths = []
+            for path in self.data_folder.rglob("*.csv"):
+                key = str(path)
+                seen.add(key)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entry = self.entries.get(key)
+                if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    continue
+                self.entries[key] = self._build_entry(path, stat)
+                self.changed_paths.append(key)
+                changed = True
+
+            for key in [k for k in self.entries if k not in seen]:
+                del self.entries[key]
+                changed = True
+
+            if changed:
+                self._rebuild_indexes()
+                self.version += 1
+                self._dirty = True
+            self.last_refresh = time.monotonic()
+        return changed
+
+    def paths(self) -> list:
+        """All catalogued CSV paths in sorted order."""
+        with self._lock:
+            return [Path(p) for p in sorted(self.entries)]
+
+    def find(self, category: str, instance_id=None, start=None, end=None) -> list:
+        """
+        Return the CSV paths (sorted) whose name prefix contains `category` and, unless
+        instance_id is None or the category is "ambient", whose instance token (the "_<n>" right
+        after the prefix) is instance_id.
+
+        If a window (start/end, naive values taken as UTC) is given, files whose recorded time
+        range lies entirely outside it are left out. Files that were never loaded have no range
+        yet and are always kept.
+        """
+        category = category.lower()
+        if category == "ambient":
+            instance_id = None
+
+        paths = self._find_all(category, instance_id)
+        if start is None and end is None:
+            return paths
+
+        start, end = to_utc_timestamp(start), to_utc_timestamp(end)
+        in_window = []
+        with self._lock:
+            for path in paths:
+                entry = self.entries.get(str(path), {})
+                if start is not None and entry.get("end") and pd.Timestamp(entry["end"]) < start:
+                    continue
+                if end is not None and entry.get("start") and pd.Timestamp(entry["start"]) > end:
+                    continue
+                in_window.append(path)
+        return in_window
+
+    def _find_all(self, category: str, instance_id) -> list:
+        key = (category, instance_id)
+        with self._lock:
+            cached = self._lookup_cache.get(key)
+            if cached is not None:
+                return cached
+
+            matches = set()
+            for prefix, paths in self._by_prefix.items():
+                if category in prefix:
+                    matches |= paths
+            if instance_id is not None:
+                try:
+                    matches &= self._by_instance.get(int(instance_id), set())
+                except (TypeError, ValueError):
+                    matches = set()
+
+            result = [Path(p) for p in sorted(matches)]
+            self._lookup_cache[key] = result
+            return result
+
+    def special_values(self, category: str) -> list:
+        """
+        Sorted, de-duplicated (instance, special) pairs offered by the special-value dropdown:
+        the TVWS SpecialValue for "tvws", the preamble depth for "soil". Files without a dropdown
+        instance in their name or without the value are skipped. Memoized until the next refresh.
+        """
+        category = category.lower()
+        field = {"tvws": "special_value", "soil": "depth"}.get(category)
+        if field is None:
+            return []
+
+        key = ("special_values", category)
+        with self._lock:
+            cached = self._lookup_cache.get(key)
+            if cached is not None:
+                return cached
+
+            pairs = set()
+            for entry in self.entries.values():
+                if category not in Path(entry["path"]).name.lower():
+                    continue
+                if entry["dropdown_instance"] is None or entry[field] in (None, ""):
+                    continue
+                pairs.add((entry["dropdown_instance"], entry[field]))
+
+            result = sorted(pairs)
+            self._lookup_cache[key] = result
+            return result
+
+    def data_types(self, known_types) -> set:
+        """The known types (e.g. {"tvws", "soil", "ambient", "sdr"}) that at least one file name starts with."""
+        with self._lock:
+            names = [Path(p).name.lower() for p in self.entries]
+        return {dtype for dtype in known_types if any(name.startswith(dtype) for name in names)}
+
+    def columns_by_type(self, blacklist=None) -> dict:
+        """
+        Union of the header columns of every file per data type (folder under /Data/Train), in
+        first-seen order over the sorted paths. Columns whose normalized name is in the blacklist
+        are left out.
+
+        A type whose files carry more than one schema fingerprint is reported once per change as
+        schema drift, listing the columns not every file has.
+        """
+        blacklist = {x.strip().lower() for x in blacklist} if blacklist else set()
+        columns = {}
+        schemas = {}
+        with self._lock:
+            for path in sorted(self.entries):
+                entry = self.entries[path]
+                data_type = entry.get("data_type")
+                if not data_type or not entry.get("columns"):
+                    continue
+                schemas.setdefault(data_type, {}).setdefault(entry["schema"], entry["columns"])
+                seen = columns.setdefault(data_type, {})
+                for col in entry["columns"]:
+                    key = normalize_header(col)
+                    if key not in seen and col.strip().lower() not in blacklist:
+                        seen[key] = col
+
+            for data_type, variants in schemas.items():
+                if len(variants) < 2:
+                    continue
+                drift_key = (data_type, frozenset(variants))
+                if drift_key in self._reported_drift:
+                    continue
+                self._reported_drift.add(drift_key)
+                header_sets = [{normalize_header(c) for c in cols} for cols in variants.values()]
+                partial = sorted(set.union(*header_sets) - set.intersection(*header_sets))
+                print(f"[WARN] ⚠️ Schema drift in '{data_type}': {len(variants)} header layouts; "
+                      f"not in every file: {partial}")
+
+        return {data_type: list(seen.values()) for data_type, seen in columns.items()}
+
+    def get_entry(self, path) -> dict:
+        with self._lock:
+            return self.entries.get(str(path))
+
+    def time_extent(self, category: str, instance_id=None):
+        """
+        Earliest start and latest end recorded for the files find(category, instance_id) returns,
+        as UTC pd.Timestamps, regardless of any window later loads were limited to. Files that
+        were never loaded have no range and are left out; None if no file has one.
+        """
+        starts, ends = [], []
+        with self._lock:
+            for path in self.find(category, instance_id):
+                entry = self.entries.get(str(path), {})
+                if entry.get("start") and entry.get("end"):
+                    starts.append(pd.Timestamp(entry["start"]))
+                    ends.append(pd.Timestamp(entry["end"]))
+        if not starts:
+            return None
+        return min(starts), max(ends)
+
+    def record_time_range(self, path, start, end) -> None:
+        """Remember the min/max timestamp found in a loaded file (pd.Timestamp or ISO string)."""
+        with self._lock:
+            entry = self.entries.get(str(path))
+            if entry is None:
+                return
+            start = to_utc_timestamp(start).isoformat() if pd.notna(start) else None
+            end = to_utc_timestamp(end).isoformat() if pd.notna(end) else None
+            if entry["start"] != start or entry["end"] != end:
+                entry["start"], entry["end"] = start, end
+                self._dirty = True
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_file_catalog(refresh: bool = False) -> FileCatalog:
+    """
+    Return the process-wide FileCatalog, loading the persisted copy on first use.
+
+    Args:
+        refresh (bool): Re-scan /Data for new or modified files even if the catalog is already loaded.
+                        Skipped if the last scan is less than MIN_REFRESH_INTERVAL_S old.
+    """
+    global _catalog
+    with _catalog_lock:
+        first_use = _catalog is None
+        if first_use:
+            _catalog = FileCatalog()
+            _catalog.load()
+        recently_refreshed = (
+            _catalog.last_refresh is not None
+            and time.monotonic() - _catalog.last_refresh < MIN_REFRESH_INTERVAL_S
+        )
+        if first_use or (refresh and not recently_refreshed):
+            _catalog.refresh()
+            _catalog.save()
+            if BUILD_ROLLUPS_ON_REFRESH and _catalog.changed_paths:
+                schedule_rollup_updates([_catalog.entries[path] for path in _catalog.changed_paths])
+        return _catalog
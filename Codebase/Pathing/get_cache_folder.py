@@ -0,0 +1,7 @@
+from Codebase.Pathing.get_project_root import get_project_root
+
+
+def get_cache_folder():
+    root = get_project_root()
+    folder = root / "Cache"
+    return folder
@@ -0,0 +1,35 @@
+import numpy as np
+
+from Codebase.SDRAnalysis.Analysis.iter_channel_blocks import DEFAULT_CHANNEL_BLOCK, channel_decimation, iter_channel_blocks
+
+
+def channelize_peaks(
+    iq_data,
+    sample_rate: float,
+    offsets_hz,
+    bandwidth_hz: float = 200_000,
+    block_size: int = DEFAULT_CHANNEL_BLOCK
+) -> tuple:
+    """
+    Extracts one narrow channel per frequency offset in a single pass over the capture
+    (see iter_channel_blocks) and collects them into one array.
+
+    Args:
+        iq_data: HackRFCapture or complex ndarray.
+        sample_rate: Input sample rate in Hz.
+        offsets_hz: Channel centres relative to the capture's centre frequency.
+        bandwidth_hz: Channel bandwidth; the output rate is the input rate divided down to about this.
+        block_size: Input samples processed per block.
+
+    Returns:
+        (channels, channel_rate): complex64 array of shape (len(offsets_hz), ceil(N / decimation))
+        and the channel sample rate in Hz.
+    """
+    offsets_hz = np.atleast_1d(np.asarray(offsets_hz, dtype=np.float64))
+    decimation, channel_rate = channel_decimation(sample_rate, bandwidth_hz)
+    channels = np.empty((len(offsets_hz), -(-len(iq_data) // decimation)), dtype=np.complex64)
+
+    for first, block in iter_channel_blocks(iq_data, sample_rate, offsets_hz, bandwidth_hz, block_size):
+        channels[:, first:first + block.shape[1]] = block
+
+    return channels, channel_rate
@@ -1,11 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.signal import spectrogram, correlate
+
+from Codebase.SDRAnalysis.Analysis.fast_convolve import fast_convolve
 
 
 def correlate_with_pulse(iq_data: np.ndarray, pulse: np.ndarray) -> np.ndarray:
     """
     Performs magnitude-based correlation of the IQ data with the extracted pulse.
+    Computed as convolution with the reversed pulse, using overlap-add FFT for long captures.
     """
-    correlation = correlate(np.abs(iq_data), np.abs(pulse), mode='valid')
-    return correlation
\ No newline at end of file
+    correlation = fast_convolve(np.abs(iq_data), np.abs(pulse)[::-1], mode='valid')
+    return correlation
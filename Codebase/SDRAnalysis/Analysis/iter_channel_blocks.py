@@ -0,0 +1,65 @@
+import numpy as np
+from scipy.signal import firwin, upfirdn
+
+DEFAULT_CHANNEL_BLOCK = 2**20  # input samples per block (rounded down to a multiple of the decimation)
+TAPS_PER_PHASE = 10  # prototype low-pass length per polyphase branch
+
+
+def _read_window(iq_data, start: int, stop: int) -> np.ndarray:
+    """Samples [start, stop) as complex64, zero-padded where the range runs past either end of the capture."""
+    lo, hi = max(start, 0), min(stop, len(iq_data))
+    out = np.zeros(stop - start, dtype=np.complex64)
+    if hi > lo:
+        out[lo - start:hi - start] = iq_data[lo:hi]
+    return out
+
+
+def channel_decimation(sample_rate: float, bandwidth_hz: float) -> tuple:
+    """(decimation factor, channel sample rate) used for a channel of bandwidth_hz."""
+    decimation = max(int(sample_rate // bandwidth_hz), 1)
+    return decimation, sample_rate / decimation
+
+
+def iter_channel_blocks(
+    iq_data,
+    sample_rate: float,
+    offsets_hz,
+    bandwidth_hz: float = 200_000,
+    block_size: int = DEFAULT_CHANNEL_BLOCK
+):
+    """
+    Streams narrow channels, one per frequency offset, out of the capture block by block.
+
+    Each block is mixed against all offsets at once (a K x block oscillator bank with phase taken
+    from the absolute sample index, so it is continuous across blocks), low-pass filtered to
+    ±bandwidth/2 and decimated with a polyphase FIR (upfirdn), which only computes the kept outputs.
+    The filter's group delay is compensated, so channel sample j lines up with input sample j * decimation.
+    Only one block of input and output is held at a time.
+
+    Yields:
+        (first channel sample index, complex64 array of shape (len(offsets_hz), samples in block))
+    """
+    offsets_hz = np.atleast_1d(np.asarray(offsets_hz, dtype=np.float64))
+    decimation, _ = channel_decimation(sample_rate, bandwidth_hz)
+
+    taps = firwin(TAPS_PER_PHASE * decimation + 1, bandwidth_hz / 2, fs=sample_rate) if decimation > 1 else np.ones(1)
+    delay = (len(taps) - 1) // 2
+    # History prepended to every block, rounded up so block starts stay on the decimation grid
+    history = -(-(len(taps) - 1) // decimation) * decimation
+    block_size = max(block_size // decimation, 1) * decimation
+    cycles_per_sample = (-offsets_hz / sample_rate)[:, None]
+
+    n_samples = len(iq_data)
+    for start in range(0, n_samples, block_size):
+        stop = min(start + block_size, n_samples)
+        # Read ahead by the group delay so output j is centred on input sample j * decimation
+        window_start = start - history + delay
+        x = _read_window(iq_data, window_start, stop + delay)
+
+        n = np.arange(window_start, stop + delay, dtype=np.float64)
+        mixer = np.exp(2j * np.pi * ((cycles_per_sample * n) % 1.0)).astype(np.complex64)
+        filtered = upfirdn(taps, mixer * x, up=1, down=decimation, axis=1)
+
+        first = history // decimation
+        count = -(-(stop - start) // decimation)
+        yield start // decimation, filtered[:, first:first + count].astype(np.complex64)
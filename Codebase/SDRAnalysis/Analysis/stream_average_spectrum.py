@@ -0,0 +1,40 @@
+import numpy as np
+
+from Codebase.SDRAnalysis.FileIO.iter_iq_blocks import DEFAULT_BLOCK_SIZE, iter_iq_blocks
+
+
+def stream_average_spectrum(
+    iq_data,
+    sample_rate: float,
+    nfft: int = 2**16,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> tuple:
+    """
+    Averaged amplitude spectrum of the whole capture (Bartlett's method), computed block by block.
+
+    The capture is cut into consecutive `nfft`-sample segments; samples left over at the end of a
+    block are carried into the next one. Each segment's |FFT|^2 is accumulated, so memory stays at
+    one block plus one spectrum however long the capture is.
+
+    Returns:
+        (freqs, amplitude): fftshifted baseband frequencies in Hz and the RMS FFT magnitude per bin
+        (on the same scale as np.abs(np.fft.fft(segment))). Captures shorter than nfft give a single
+        FFT of the available samples.
+    """
+    nfft = min(nfft, len(iq_data))
+    power_sum = np.zeros(nfft, dtype=np.float64)
+    segments = 0
+    carry = np.empty(0, dtype=np.complex64)
+
+    for block in iter_iq_blocks(iq_data, block_size):
+        x = np.concatenate((carry, block)) if len(carry) else block
+        n_segments = len(x) // nfft
+        if n_segments:
+            spectra = np.fft.fft(x[:n_segments * nfft].reshape(n_segments, nfft), axis=1)
+            power_sum += (np.abs(spectra) ** 2).sum(axis=0)
+            segments += n_segments
+        carry = x[n_segments * nfft:].copy()
+
+    amplitude = np.sqrt(power_sum / max(segments, 1))
+    freqs = np.fft.fftfreq(nfft, d=1 / sample_rate)
+    return np.fft.fftshift(freqs), np.fft.fftshift(amplitude)
@@ -0,0 +1,33 @@
+import numpy as np
+
+from Codebase.SDRAnalysis.Analysis.streaming_fir import StreamingFIR
+from Codebase.SDRAnalysis.FileIO.iter_iq_blocks import DEFAULT_BLOCK_SIZE, iter_iq_blocks
+
+
+def stream_correlation(
+    iq_data,
+    pulse: np.ndarray,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    out: np.ndarray = None
+) -> np.ndarray:
+    """
+    Block-streaming correlate_with_pulse(): magnitude correlation of the capture with the pulse,
+    read block by block with the last len(pulse) - 1 samples carried across block boundaries.
+
+    Pass `out` (e.g. an np.memmap of len(iq_data) - len(pulse) + 1 float32 values) when the
+    correlation itself does not fit in RAM.
+    """
+    # Correlation with a real template is convolution with the reversed template
+    taps = np.abs(pulse).astype(np.float64)[::-1]
+    n_out = max(len(iq_data) - len(taps) + 1, 0)
+    if out is None:
+        out = np.empty(n_out, dtype=np.float32)
+
+    fir = StreamingFIR(taps)
+    pos = 0
+    for block in iter_iq_blocks(iq_data, block_size):
+        correlation = fir.process(np.abs(block).astype(np.float64))
+        out[pos:pos + len(correlation)] = correlation
+        pos += len(correlation)
+
+    return out[:pos]
@@ -0,0 +1,38 @@
+import numpy as np
+
+from Codebase.SDRAnalysis.FileIO.iter_iq_blocks import DEFAULT_BLOCK_SIZE, iter_iq_blocks
+
+
+def stream_signal_energy(
+    iq_data,
+    sample_rate: float,
+    window_ms: float = 1.0,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    out: np.ndarray = None
+) -> np.ndarray:
+    """
+    Block-streaming compute_signal_energy(): same short-term energy trace, but the capture is read
+    block by block. Window sums are cumulative-sum differences over each block prefixed with the
+    previous block's last window - 1 power samples, so every window spanning a boundary is complete.
+
+    Working memory is one block regardless of capture length. For captures whose energy trace does not
+    fit in RAM either, pass `out` (e.g. an np.memmap of len(iq_data) - window + 1 float32 values).
+    """
+    window = int(window_ms * sample_rate / 1000.0)
+    n_out = max(len(iq_data) - window + 1, 0)
+    if out is None:
+        out = np.empty(n_out, dtype=np.float32)
+
+    history = np.empty(0, dtype=np.float64)
+    pos = 0
+    for block in iter_iq_blocks(iq_data, block_size):
+        power = np.concatenate((history, np.square(np.abs(block), dtype=np.float64)))
+        if len(power) >= window:
+            # Cumulative sums restart every block, so rounding error never builds up over the capture
+            cumulative = np.concatenate(([0.0], np.cumsum(power)))
+            energy = cumulative[window:] - cumulative[:-window]
+            out[pos:pos + len(energy)] = energy
+            pos += len(energy)
+        history = power[max(len(power) - (window - 1), 0):] if window > 1 else power[:0]
+
+    return out[:pos]
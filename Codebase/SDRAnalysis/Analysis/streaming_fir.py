@@ -0,0 +1,34 @@
+import numpy as np
+
+from Codebase.SDRAnalysis.Analysis.fast_convolve import fast_convolve
+
+
+class StreamingFIR:
+    """
+    FIR filter applied block by block with its input history carried between calls (overlap-save).
+
+    Feeding a signal through process() in any number of blocks and concatenating the outputs gives
+    exactly np.convolve(signal, taps, mode="valid"), while only len(taps) - 1 past samples are kept.
+
+    Usage:
+        fir = StreamingFIR(np.ones(20_000))
+        for block in iter_iq_blocks(capture):
+            out = fir.process(np.abs(block) ** 2)
+    """
+
+    def __init__(self, taps: np.ndarray):
+        self.taps = np.asarray(taps)
+        self._history = np.empty(0, dtype=self.taps.dtype)
+
+    def reset(self) -> None:
+        self._history = np.empty(0, dtype=self.taps.dtype)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Filter one block; returns the outputs that became complete with it (may be empty)."""
+        x = np.concatenate((self._history, block)) if len(self._history) else np.asarray(block)
+        keep = len(self.taps) - 1
+        self._history = x[max(len(x) - keep, 0):].copy() if keep else x[:0]
+
+        if len(x) < len(self.taps):
+            return np.empty(0, dtype=np.result_type(x, self.taps))
+        return fast_convolve(x, self.taps, mode="valid")
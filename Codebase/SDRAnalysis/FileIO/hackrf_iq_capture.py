@@ -0,0 +1,98 @@
+import numpy as np
+
+
+class HackRFCapture:
+    """
+    Memory-mapped view of a HackRF .iq capture (interleaved int8 I/Q pairs).
+
+    Nothing is read when the capture is opened; the OS pages in only the byte ranges that are
+    sliced, and each slice is converted to complex64 on demand. Captures larger than RAM can be
+    analyzed window by window.
+
+    Usage:
+        capture = HackRFCapture("Data/.../capture.iq", sample_rate=20e6)
+        len(capture)                     # number of complex samples
+        capture[1_000:2_000]             # complex64 ndarray of 1000 samples
+        capture.time_slice(0.5, 0.75)    # samples between 0.5 s and 0.75 s
+        for start, block in capture.iter_blocks(2**20): ...
+        np.asarray(capture)              # whole capture as complex64 (only if it fits in memory)
+    """
+
+    def __init__(self, filename, sample_rate: float = None):
+        self.filename = str(filename)
+        self.sample_rate = sample_rate
+        raw = np.memmap(self.filename, dtype=np.int8, mode="r")
+        n_samples = len(raw) // 2
+        # (n, 2) int8 view over the file: column 0 is I, column 1 is Q
+        self._pairs = raw[:n_samples * 2].reshape(n_samples, 2)
+
+    def __len__(self) -> int:
+        return self._pairs.shape[0]
+
+    @property
+    def shape(self) -> tuple:
+        return (len(self),)
+
+    @property
+    def size(self) -> int:
+        return len(self)
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def dtype(self):
+        return np.dtype(np.complex64)
+
+    @property
+    def duration_s(self) -> float:
+        if not self.sample_rate:
+            raise ValueError("sample_rate is required for time-based access")
+        return len(self) / self.sample_rate
+
+    @staticmethod
+    def _to_complex(pairs: np.ndarray) -> np.ndarray:
+        # One float32 copy of the window, reinterpreted as complex64 (I, Q adjacent in memory)
+        return pairs.astype(np.float32).view(np.complex64).reshape(-1)
+
+    def read(self, start: int = 0, stop: int = None, step: int = 1) -> np.ndarray:
+        """Convert samples [start, stop) (every `step`-th one) to a complex64 array."""
+        return self._to_complex(self._pairs[start:stop:step])
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._to_complex(self._pairs[key])
+        if isinstance(key, (int, np.integer)):
+            i, q = self._pairs[key]
+            return np.complex64(complex(float(i), float(q)))
+        # Index arrays / masks: gather only the requested samples
+        return self._to_complex(self._pairs[np.asarray(key)])
+
+    def time_slice(self, start_s: float = 0.0, stop_s: float = None) -> np.ndarray:
+        """Samples between start_s and stop_s seconds from the start of the capture."""
+        if not self.sample_rate:
+            raise ValueError("sample_rate is required for time-based access")
+        start = int(round(start_s * self.sample_rate))
+        stop = None if stop_s is None else int(round(stop_s * self.sample_rate))
+        return self.read(start, stop)
+
+    def iter_blocks(self, block_size: int, overlap: int = 0, start: int = 0, stop: int = None):
+        """
+        Yield (first sample index, complex64 block) over [start, stop) in blocks of `block_size`
+        new samples, each prefixed with the last `overlap` samples of the previous block.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        pos = start
+        while pos < stop:
+            block_start = max(pos - overlap, start)
+            block_stop = min(pos + block_size, stop)
+            yield block_start, self.read(block_start, block_stop)
+            pos = block_stop
+
+    def __array__(self, dtype=None, copy=None):
+        data = self.read()
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        return f"HackRFCapture({self.filename!r}, samples={len(self)}, sample_rate={self.sample_rate})"
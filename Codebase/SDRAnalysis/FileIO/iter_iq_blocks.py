@@ -0,0 +1,19 @@
+import numpy as np
+
+from Codebase.SDRAnalysis.FileIO.hackrf_iq_capture import HackRFCapture
+
+DEFAULT_BLOCK_SIZE = 2**22  # samples per block (32 MB as complex64)
+
+
+def iter_iq_blocks(iq_data, block_size: int = DEFAULT_BLOCK_SIZE):
+    """
+    Yields consecutive, non-overlapping complex64 blocks of at most `block_size` samples.
+    Works on a memory-mapped HackRFCapture (each block is read from disk on demand) or an in-memory array.
+    """
+    if isinstance(iq_data, HackRFCapture):
+        for _, block in iq_data.iter_blocks(block_size):
+            yield block
+        return
+
+    for start in range(0, len(iq_data), block_size):
+        yield np.asarray(iq_data[start:start + block_size])
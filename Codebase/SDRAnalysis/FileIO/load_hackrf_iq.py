@@ -1,6 +1,8 @@
 import numpy as np
 import os
 
+from Codebase.SDRAnalysis.FileIO.hackrf_iq_capture import HackRFCapture
+
 def prompt_user_to_select_iq_file(base_dir="Data") -> str:
     """
     Recursively scans for .iq files under the given base_dir and prompts user to select one.
@@ -39,6 +41,5 @@ def load_hackrf_iq(filename: str = None) -> np.ndarray:
         filename = prompt_user_to_select_iq_file()
 
     print(f"\n[INFO] Loading: {filename}")
-    raw = np.fromfile(filename, dtype=np.int8)
-    iq = raw[::2].astype(np.float32) + 1j * raw[1::2].astype(np.float32)
-    return iq
+    # Converted straight from the memory map: one complex64 allocation instead of two float copies plus the sum
+    return HackRFCapture(filename).read()
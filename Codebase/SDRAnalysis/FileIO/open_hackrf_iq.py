@@ -0,0 +1,15 @@
+from Codebase.SDRAnalysis.FileIO.hackrf_iq_capture import HackRFCapture
+from Codebase.SDRAnalysis.FileIO.load_hackrf_iq import prompt_user_to_select_iq_file
+
+
+def open_hackrf_iq(filename: str = None, sample_rate: float = None) -> HackRFCapture:
+    """
+    Opens a HackRF .iq file as a memory-mapped HackRFCapture without reading it.
+    Slices of the capture are converted to complex64 on demand, so captures larger than RAM can be analyzed.
+    If no filename is provided, prompts the user to select one from Data/.
+    """
+    if filename is None:
+        filename = prompt_user_to_select_iq_file()
+
+    print(f"\n[INFO] Opening: {filename}")
+    return HackRFCapture(filename, sample_rate=sample_rate)
@@ -4,6 +4,7 @@ matplotlib.use('TkAgg')
 import numpy as np
 import matplotlib.pyplot as plt
 from datetime import datetime
+from Codebase.SDRAnalysis.Analysis.iter_channel_blocks import channel_decimation, iter_channel_blocks
 from Codebase.SDRAnalysis.FileIO.save_plot import save_plot
 
 def plot_amplitude_over_time(
@@ -16,6 +17,7 @@ def plot_amplitude_over_time(
 ):
     """
     Plot average amplitude over time in a narrow frequency band.
+    Works on a memory-mapped HackRFCapture or an array; the capture is streamed in blocks.
     """
     print("🟢 [START] Amplitude vs Time")
     print(f"   • Center Frequency  : {center_freq_hz/1e6:.3f} MHz")
@@ -23,33 +25,26 @@ def plot_amplitude_over_time(
     print(f"   • Bandwidth         : ±{bandwidth_hz/2/1e3:.0f} kHz")
     print(f"   • Time Bin Duration : {time_bin_ms:.1f} ms")
 
-    # Step 1: Shift frequency
+    # Step 1+2: Shift to baseband, low-pass and decimate block by block (never the whole capture at once)
     delta_f = target_freq_hz - center_freq_hz
     print(f"   ↪ Frequency shift applied: {delta_f/1e3:.1f} kHz")
-    n = np.arange(len(iq_data))
-    iq_shifted = iq_data * np.exp(-1j * 2 * np.pi * delta_f * n / sample_rate)
+    _, channel_rate = channel_decimation(sample_rate, bandwidth_hz)
+    print(f"   ↪ Streaming ±{bandwidth_hz/2/1e3:.0f} kHz channel at {channel_rate/1e3:.0f} kHz...")
 
-    # Step 2: Low-pass filter via FFT (apply frequency mask)
-    print("   ↪ Applying frequency mask and filtering...")
-    fft_len = len(iq_shifted)
-    spectrum = np.fft.fftshift(np.fft.fft(iq_shifted))
-    freqs = np.fft.fftshift(np.fft.fftfreq(fft_len, d=1/sample_rate))
+    # Step 3: Compute amplitude per time bin; samples of an unfinished bin carry into the next block
+    bin_size = max(int(round(channel_rate * time_bin_ms / 1000)), 1)
+    binned = []
+    carry = np.empty(0, dtype=np.float32)
+    for _, block in iter_channel_blocks(iq_data, sample_rate, [delta_f], bandwidth_hz):
+        magnitudes = np.concatenate((carry, np.abs(block[0])))
+        num_full = len(magnitudes) // bin_size
+        binned.append(magnitudes[:num_full * bin_size].reshape(num_full, bin_size).mean(axis=1))
+        carry = magnitudes[num_full * bin_size:]
+    amplitudes = np.concatenate(binned) if binned else np.empty(0)
+    num_bins = len(amplitudes)
+    print(f"   ↪ Binned channel into {num_bins} bins of {bin_size} samples each...")
 
-    mask = np.abs(freqs) < (bandwidth_hz / 2)
-    spectrum_filtered = np.zeros_like(spectrum)
-    spectrum_filtered[mask] = spectrum[mask]
-
-    iq_filtered = np.fft.ifft(np.fft.ifftshift(spectrum_filtered))
-
-    # Step 3: Compute amplitude per time bin
-    bin_size = int(sample_rate * time_bin_ms / 1000)
-    num_bins = len(iq_filtered) // bin_size
-    print(f"   ↪ Binning {len(iq_filtered)} samples into {num_bins} bins of {bin_size} each...")
-    iq_trimmed = iq_filtered[:num_bins * bin_size]
-    iq_binned = iq_trimmed.reshape((num_bins, bin_size))
-    amplitudes = np.abs(iq_binned).mean(axis=1)
-
-    times = np.arange(num_bins) * (time_bin_ms / 1000)
+    times = np.arange(num_bins) * (bin_size / channel_rate)
 
     # Step 4: Plot
     print("   📊 Plotting...")
@@ -4,7 +4,12 @@ import numpy as np
 import scipy.signal as signal
 import pandas as pd
 from datetime import datetime, timedelta
-import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+from Codebase.SDRAnalysis.FileIO.hackrf_iq_capture import HackRFCapture
 
 # -------- CONFIG --------
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -13,63 +18,125 @@ OUTPUT_DIR = DATA_DIR / "Train" / "SDR" / "CSV"
 TARGET_FREQ_HZ = 491e3  # Example: 100 kHz tone you're tracking
 SAMPLE_RATE = 2e6  # Example: 2 MHz HackRF sample rate
 SAMPLE_RATIO = 0.01  # % of the samples
+LOAD_BLOCK_SAMPLES = 2**22     # Raw samples streamed from disk per block while decimating
 MINUTE_BLOCK_SEC = 60
 FIXED_FREQ_HZ = 491e6          # Center frequency 491 MHz
 RANGE_START_HZ = 489e6         # Range start
 RANGE_END_HZ = 492.6e6         # Range end
 RANGE_STEPS = 8                # Number of steps in range
+LOWPASS_ORDER = 5
+LOWPASS_CUTOFF = 0.01          # Normalized to Nyquist
+PHASE_DECIMATION = 50          # Keep every Nth filtered sample (output Nyquist stays at 2x the cutoff)
+PHASE_BLOCK_SAMPLES = 2**18    # Samples mixed/filtered per block, for all frequencies at once
+GROUP_STATS = ("mean", "circular_mean", "std", "count")
+MAX_WORKERS = os.cpu_count() or 1
+MEMORY_BUDGET_BYTES = 4 * 1024**3  # Estimated memory of all files in flight at once
+MAX_FILE_RETRIES = 1           # Resubmissions of a file whose worker pool died under it
 
 # ------------------------
 
-def load_iq_data(iq_file, sample_ratio):
+def load_iq_data(iq_file, sample_ratio, fs=SAMPLE_RATE):
+    """
+    Deterministic, time-ordered decimation of an IQ file to `sample_ratio` of its samples.
+
+    Every 1 / sample_ratio consecutive samples are averaged into one (a boxcar anti-alias filter
+    before decimation), streaming the memory-mapped file block by block, so the result is a
+    continuous signal at fs * sample_ratio. A partial block at the end of the file is dropped.
+    """
     print(f"  ⏳ Loading IQ data from {iq_file.name}...")
-    raw = np.fromfile(iq_file, dtype=np.int8)
-    raw_i = raw[0::2]
-    raw_q = raw[1::2]
-    iq = raw_i.astype(np.float32) + 1j * raw_q.astype(np.float32)
-
-    num_samples = int(len(iq) * sample_ratio)
-    print(f"  🔍 Downsampling to {sample_ratio*100:.0f}%: {num_samples} samples...")
-    iq = iq[np.random.choice(len(iq), num_samples, replace=False)]
+    capture = HackRFCapture(iq_file, sample_rate=fs)
+    step = max(int(round(1 / sample_ratio)), 1)
+
+    num_samples = len(capture) // step
+    print(f"  🔍 Block-averaging every {step} samples: {num_samples} samples...")
+    iq = np.empty(num_samples, dtype=np.complex64)
+    pos = 0
+    block_size = max((LOAD_BLOCK_SAMPLES // step) * step, step)
+    for _, block in capture.iter_blocks(block_size, stop=num_samples * step):
+        averaged = block.reshape(-1, step).mean(axis=1)
+        iq[pos:pos + len(averaged)] = averaged
+        pos += len(averaged)
     return iq
 
-def get_avg_phase_over_range(iq_data, fs, start_freq, end_freq, steps):
-    freqs = np.linspace(start_freq, end_freq, steps)
-    all_phases = []
+@lru_cache(maxsize=None)
+def get_lowpass_sos(order=LOWPASS_ORDER, cutoff=LOWPASS_CUTOFF):
+    return signal.butter(order, cutoff, output="sos")
+
+def get_phases(iq_data, target_freqs, fs, decimation=PHASE_DECIMATION, block_samples=PHASE_BLOCK_SAMPLES):
+    """
+    Instantaneous phase at several frequencies in one pass: each block of samples is mixed against
+    all frequencies as a 2-D array, low-passed with sosfilt (filter state carried between blocks)
+    and decimated by `decimation` before the phase is taken.
+    Returns an array of shape (len(target_freqs), ceil(len(iq_data) / decimation)) at fs / decimation.
+    """
+    target_freqs = np.atleast_1d(np.asarray(target_freqs, dtype=np.float64))
+    print(f"  🧮 Calculating instantaneous phase at {len(target_freqs)} frequencies (decimation {decimation})...")
+    sos = get_lowpass_sos()
+    zi = np.zeros((sos.shape[0], len(target_freqs), 2), dtype=np.complex128)
+    cycles_per_sample = (target_freqs / fs)[:, None]
+
+    # Block length on the decimation grid, so every block keeps samples 0, decimation, 2*decimation, ...
+    block_samples = max(block_samples // decimation, 1) * decimation
+    # One block of oscillators, rotated to each block's starting phase instead of recomputed
+    block_osc = np.exp(-2j * np.pi * ((cycles_per_sample * np.arange(block_samples)) % 1.0))
+    phases = []
+    for start in range(0, len(iq_data), block_samples):
+        block = np.asarray(iq_data[start:start + block_samples])
+        start_phase = np.exp(-2j * np.pi * ((cycles_per_sample * start) % 1.0))
+        mixed = block[None, :] * (block_osc[:, :len(block)] * start_phase)
+        filtered, zi = signal.sosfilt(sos, mixed, axis=1, zi=zi)
+        phases.append(np.angle(filtered[:, ::decimation]))
+
+    if not phases:
+        return np.empty((len(target_freqs), 0))
+    return np.concatenate(phases, axis=1)
 
-    for f in freqs:
-        phase = get_instantaneous_phase(iq_data, f, fs)
-        all_phases.append(phase)
+def circular_mean_phase(phases, axis=0):
+    # Angle of the mean unit vector; a linear mean of angles wrapping at ±pi is biased towards 0
+    return np.angle(np.exp(1j * np.asarray(phases)).mean(axis=axis))
 
-    # Convert to numpy array and average across axis=0 (samples)
-    avg_phase = np.mean(all_phases, axis=0)
+def get_avg_phase_over_range(iq_data, fs, start_freq, end_freq, steps, decimation=PHASE_DECIMATION):
+    freqs = np.linspace(start_freq, end_freq, steps)
+    # Circular average across frequencies (axis=0), sample by sample
+    avg_phase = circular_mean_phase(get_phases(iq_data, freqs, fs, decimation), axis=0)
     return avg_phase
 
 
-def get_instantaneous_phase(iq_data, target_freq, fs):
-    print(f"  🧮 Calculating instantaneous phase at {target_freq/1e3:.1f} kHz...")
-    t = np.arange(len(iq_data)) / fs
-    osc = np.exp(-1j * 2 * np.pi * target_freq * t)
-    mixed = iq_data * osc
+def get_instantaneous_phase(iq_data, target_freq, fs, decimation=1):
+    return get_phases(iq_data, [target_freq], fs, decimation)[0]
 
-    b, a = signal.butter(5, 0.01)
-    filtered = signal.lfilter(b, a, mixed)
-    phase = np.angle(filtered)
-    return phase
+def group_by_minute(phases, fs, block_duration_sec, stats=GROUP_STATS):
+    """
+    Reduces phases (radians) to per-block statistics with np.add.reduceat, one pass per sum.
+    A partial trailing block is kept and reduced over the samples it has.
 
-def group_by_minute(phases, fs, block_duration_sec):
+    Stats: "mean" (linear), "circular_mean" (angle of the mean unit vector; use this for wrapped
+    phases, whose linear mean is pulled towards 0 across the ±pi wrap), "std" and "count".
+    Returns {stat: np.ndarray with one value per block}.
+    """
     print(f"  📊 Grouping phase data into {block_duration_sec}-second blocks...")
-    samples_per_block = int(fs * block_duration_sec)
-    block_count = math.ceil(len(phases) / samples_per_block)
-    avg_phases = []
+    phases = np.asarray(phases, dtype=np.float64)
+    samples_per_block = max(int(fs * block_duration_sec), 1)
+    starts = np.arange(0, len(phases), samples_per_block)
+    if not len(starts):
+        return {stat: np.empty(0) for stat in stats}
 
-    for i in range(block_count):
-        block = phases[i * samples_per_block: (i + 1) * samples_per_block]
-        if len(block) > 0:
-            avg_phases.append(np.mean(block))
+    counts = np.diff(np.append(starts, len(phases)))
+    grouped = {}
+    mean = np.add.reduceat(phases, starts) / counts
+    if "mean" in stats:
+        grouped["mean"] = mean
+    if "circular_mean" in stats:
+        grouped["circular_mean"] = np.arctan2(np.add.reduceat(np.sin(phases), starts),
+                                              np.add.reduceat(np.cos(phases), starts))
+    if "std" in stats:
+        deviations = phases - np.repeat(mean, counts)
+        grouped["std"] = np.sqrt(np.add.reduceat(deviations * deviations, starts) / counts)
+    if "count" in stats:
+        grouped["count"] = counts
 
-    print(f"  ✅ Created {len(avg_phases)} averaged phase entries.")
-    return avg_phases
+    print(f"  ✅ Created {len(starts)} averaged phase entries.")
+    return grouped
 
 def parse_start_time_from_filename(filename):
     try:
@@ -85,13 +152,18 @@ def process_iq_file(iq_path, output_dir):
     try:
         iq = load_iq_data(iq_path, SAMPLE_RATIO)
 
+        # Fixed frequency and every range step, mixed, filtered and decimated together
+        range_freqs = np.linspace(RANGE_START_HZ, RANGE_END_HZ, RANGE_STEPS)
+        # The decimated samples are a continuous signal at the reduced rate
+        phases = get_phases(iq, np.concatenate(([FIXED_FREQ_HZ], range_freqs)), SAMPLE_RATE * SAMPLE_RATIO)
+        phase_rate = SAMPLE_RATE * SAMPLE_RATIO / PHASE_DECIMATION
+
         # Phase at fixed frequency
-        phase_fixed = get_instantaneous_phase(iq, FIXED_FREQ_HZ, SAMPLE_RATE)
-        avg_phases_fixed = group_by_minute(phase_fixed, SAMPLE_RATE * SAMPLE_RATIO, MINUTE_BLOCK_SEC)
+        avg_phases_fixed = group_by_minute(phases[0], phase_rate, MINUTE_BLOCK_SEC, ("circular_mean",))["circular_mean"]
 
-        # Phase over range
-        phase_range = get_avg_phase_over_range(iq, SAMPLE_RATE, RANGE_START_HZ, RANGE_END_HZ, RANGE_STEPS)
-        avg_phases_range = group_by_minute(phase_range, SAMPLE_RATE * SAMPLE_RATIO, MINUTE_BLOCK_SEC)
+        # Phase over range (circular mean across the range steps, then per minute)
+        range_phase = circular_mean_phase(phases[1:], axis=0)
+        avg_phases_range = group_by_minute(range_phase, phase_rate, MINUTE_BLOCK_SEC, ("circular_mean",))["circular_mean"]
 
         # Use same time index
         start_time = parse_start_time_from_filename(iq_path.name)
@@ -108,26 +180,137 @@ def process_iq_file(iq_path, output_dir):
         })
 
         output_dir.mkdir(parents=True, exist_ok=True)
-        out_path = output_dir / (iq_path.stem + ".csv")
-        df.to_csv(out_path, index=False)
+        out_path = get_output_path(iq_path, output_dir)
+        # Written under a temporary name first, so an interrupted run never leaves a CSV that looks finished
+        tmp_path = out_path.with_suffix(".csv.tmp")
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, out_path)
         print(f"  💾 Saved CSV to {out_path}")
+        return out_path
     except Exception as e:
         print(f"  ❌ Failed to process {iq_path.name}: {e}")
+        return None
 
 
-def main():
-    print("🔍 Searching for IQ files in:", DATA_DIR)
-    found = False
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    for root, dirs, files in os.walk(DATA_DIR):
+def get_output_path(iq_path, output_dir):
+    return output_dir / (iq_path.stem + ".csv")
+
+def is_up_to_date(iq_path, output_dir):
+    """True when the file's CSV exists and is newer than the .iq file (already processed)."""
+    out_path = get_output_path(iq_path, output_dir)
+    return out_path.exists() and out_path.stat().st_mtime >= iq_path.stat().st_mtime
+
+def estimate_file_memory(iq_path):
+    """Rough peak memory of process_iq_file for one file: decimated samples, per-frequency phases and the block buffers."""
+    kept_samples = iq_path.stat().st_size // 2 * SAMPLE_RATIO
+    frequencies = RANGE_STEPS + 1
+    loaded = kept_samples * 8  # complex64
+    phases = kept_samples / PHASE_DECIMATION * frequencies * 8 * 2
+    blocks = PHASE_BLOCK_SAMPLES * frequencies * 16 * 4  # oscillator, mixed, filtered and temporaries
+    load_block = LOAD_BLOCK_SAMPLES * 8 * 2  # complex64 read block and its float32 conversion
+    return int(loaded + phases + blocks + load_block)
+
+def find_iq_files(data_dir):
+    iq_files = []
+    for root, dirs, files in os.walk(data_dir):
         for file in files:
             if file.endswith(".iq"):
-                found = True
-                iq_path = Path(root) / file
-                process_iq_file(iq_path, OUTPUT_DIR)
+                iq_files.append(Path(root) / file)
+    return sorted(iq_files)
+
+def main(max_workers=MAX_WORKERS, memory_budget=MEMORY_BUDGET_BYTES, force=False):
+    """
+    Processes every .iq file under DATA_DIR in a process pool.
 
-    if not found:
+    Files whose CSV is newer than the capture are skipped (pass force=True to redo them), so an
+    interrupted backfill resumes where it stopped. New files are only submitted while the estimated
+    memory of the files in flight stays under memory_budget (one file is always allowed).
+    """
+    print("🔍 Searching for IQ files in:", DATA_DIR)
+    iq_files = find_iq_files(DATA_DIR)
+    if not iq_files:
         print("❗ No .iq files found in the Data folder.")
+        return
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    pending = [path for path in iq_files if force or not is_up_to_date(path, OUTPUT_DIR)]
+    skipped = len(iq_files) - len(pending)
+    print(f"📋 {len(iq_files)} IQ files: {len(pending)} to process, {skipped} already up to date.")
+    if not pending:
+        return
+
+    total_bytes = sum(path.stat().st_size for path in pending)
+    done_bytes = done_count = failed = 0
+    started = time.time()
+    queue = list(pending)
+    retries = {}  # path -> times resubmitted after a pool crash
+
+    def requeue_or_fail(path):
+        # A crashed worker takes the whole pool down, so every file in flight is retried once,
+        # on its own (see the fill loop) so that a second crash can be pinned on it.
+        nonlocal failed, done_count, done_bytes
+        if retries.get(path, 0) < MAX_FILE_RETRIES:
+            retries[path] = retries.get(path, 0) + 1
+            queue.insert(0, path)
+            return
+        print(f"❌ {path.name} failed: worker process crashed {retries[path] + 1} times")
+        failed += 1
+        done_count += 1
+        done_bytes += path.stat().st_size
+
+    while queue:
+        in_flight = {}  # future -> (path, estimated memory)
+        pool_broken = False
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            while (queue or in_flight) and not pool_broken:
+                # Fill the pool up to the worker count and the memory budget
+                while queue and len(in_flight) < max_workers:
+                    estimate = estimate_file_memory(queue[0])
+                    in_use = sum(mem for _, mem in in_flight.values())
+                    if in_flight and in_use + estimate > memory_budget:
+                        break
+                    if in_flight and (queue[0] in retries or any(p in retries for p, _ in in_flight.values())):
+                        break  # Files retried after a crash run alone
+                    try:
+                        future = pool.submit(process_iq_file, queue[0], OUTPUT_DIR)
+                    except BrokenProcessPool:
+                        pool_broken = True
+                        break
+                    in_flight[future] = (queue.pop(0), estimate)
+                if pool_broken or not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    path, _ = in_flight.pop(future)
+                    error = future.exception()
+                    if isinstance(error, BrokenProcessPool):
+                        pool_broken = True
+                        requeue_or_fail(path)
+                        continue
+
+                    done_count += 1
+                    done_bytes += path.stat().st_size
+                    if error is not None:
+                        print(f"❌ {path.name} failed: {error!r}")
+                        failed += 1
+                    elif future.result() is None:
+                        failed += 1
+
+                    elapsed = time.time() - started
+                    rate = done_bytes / 1e6 / elapsed if elapsed > 0 else 0.0
+                    eta = (total_bytes - done_bytes) / 1e6 / rate if rate > 0 else 0.0
+                    print(f"📈 [{done_count}/{len(pending)}] {path.name} — {rate:.1f} MB/s, ETA {eta:.0f} s")
+
+            if pool_broken:
+                # The remaining futures died with the pool; requeue their files
+                for future in list(in_flight):
+                    path, _ = in_flight.pop(future)
+                    requeue_or_fail(path)
+                print(f"⚠️ Worker pool crashed; restarting it with {len(queue)} files left.")
+
+    print(f"✅ Processed {done_count - failed} files ({failed} failed, {skipped} skipped) "
+          f"in {time.time() - started:.1f} s.")
 
 if __name__ == "__main__":
     print("📡 Starting IQ Phase Extraction Script")
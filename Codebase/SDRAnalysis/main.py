@@ -1,12 +1,12 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-from Codebase.SDRAnalysis.Analysis.compute_signal_energy import compute_signal_energy
+from Codebase.SDRAnalysis.Analysis.stream_signal_energy import stream_signal_energy
 from Codebase.SDRAnalysis.Analysis.extract_pulse import extract_pulse
-from Codebase.SDRAnalysis.Analysis.correlate_with_pulse import correlate_with_pulse
+from Codebase.SDRAnalysis.Analysis.stream_correlation import stream_correlation
 from Codebase.SDRAnalysis.Plot.analyze_headers_at_peaks import analyze_headers_at_peaks
 
-from Codebase.SDRAnalysis.FileIO.load_hackrf_iq import load_hackrf_iq
+from Codebase.SDRAnalysis.FileIO.open_hackrf_iq import open_hackrf_iq
 
 from Codebase.SDRAnalysis.Plot.plot_spectrogram import plot_spectrogram
 from Codebase.SDRAnalysis.Plot.plot_energy import plot_energy
@@ -22,9 +22,10 @@ def main():
     fs = 20e6  # Sample rate in Hz
     center_freq = 491_000_000  # Hz
 
-    print("\U0001f4e1 [START] Loading IQ data...")
-    iq_data = load_hackrf_iq()
-    print("✅ IQ data loaded.\n")
+    print("\U0001f4e1 [START] Opening IQ data...")
+    # Memory-mapped: each analysis converts only the samples it slices
+    iq_data = open_hackrf_iq(sample_rate=fs)
+    print(f"✅ IQ data mapped ({len(iq_data):,} samples, {iq_data.duration_s:.2f} s).\n")
 
     energy = None
     pulse = None
@@ -34,7 +35,7 @@ def main():
     plot_dispatch = {
         "1": {
             "name": "Spectrogram (2D)",
-            "func": lambda: plot_spectrogram(iq_data[:int(fs * 1.0)], fs)
+            "func": lambda: plot_spectrogram(iq_data.time_slice(0.0, 1.0), fs)
         },
         "2": {
             "name": "Signal Energy",
@@ -54,7 +55,7 @@ def main():
         },
         "6": {
             "name": "3D Spectrogram",
-            "func": lambda: plot_3d_spectrogram(iq_data, fs, max_seconds=0.5)
+            "func": lambda: plot_3d_spectrogram(iq_data.time_slice(0.0, 0.5), fs, max_seconds=0.5)
         },
         "7": {
             "name": "Amplitude Over Time @ Frequency",
@@ -102,7 +103,7 @@ def main():
         nonlocal energy
         if energy is None:
             print("↪ Computing signal energy...")
-            energy = compute_signal_energy(iq_data, sample_rate=fs, window_ms=1.0)
+            energy = stream_signal_energy(iq_data, sample_rate=fs, window_ms=1.0)
         return energy
 
     def _get_pulse():
@@ -119,7 +120,7 @@ def main():
         if correlation is None:
             p = _get_pulse()
             print("↪ Correlating with extracted pulse...")
-            correlation = correlate_with_pulse(iq_data, p)
+            correlation = stream_correlation(iq_data, p)
         return correlation
 
     def _run_fft():
@@ -0,0 +1,33 @@
+import sys
+
+import pandas as pd
+import pytest
+
+TVWS_PREAMBLE = "A,B,C,D,E,F,G,H,SpecialValue\na,b,c,d,e,f,g,h,dirt\n"
+TVWS_HEADER = "Date (Year-Mon-Day),Time (Hour-Min-Sec),DRSSI,Frequency,TxCount,RxCount\n"
+
+
+@pytest.fixture
+def cache_folder(tmp_path, monkeypatch):
+    """Point every module that imported get_cache_folder at a temporary /Cache."""
+    folder = tmp_path / "Cache"
+    folder.mkdir()
+    for name, module in list(sys.modules.items()):
+        if name.startswith("Codebase.") and hasattr(module, "get_cache_folder"):
+            monkeypatch.setattr(module, "get_cache_folder", lambda: folder)
+    return folder
+
+
+@pytest.fixture
+def make_tvws_csv():
+    """Write a TVWS CSV in the field-station layout, one row every `freq` from `start`."""
+    def make(path, start="2025-06-06 00:00:00", periods=10, freq="5s", drssi_offset=0.0):
+        times = pd.date_range(start, periods=periods, freq=freq)
+        lines = [
+            f"{t:%Y-%m-%d},{t:%H-%M-%S},{-80.0 - i * 0.5 + drssi_offset:.2f},491000000,{i * 5},{i * 10}\n"
+            for i, t in enumerate(times)
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(TVWS_PREAMBLE + TVWS_HEADER + "".join(lines), encoding="utf-8")
+        return path
+    return make
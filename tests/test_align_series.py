@@ -0,0 +1,75 @@
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from Codebase.Dashboard.SupportMethods.align_series import align_series
+
+
+def _frame(times, column, values, tz="UTC"):
+    return pd.DataFrame({"datetime": pd.to_datetime(times).tz_localize(tz), column: values})
+
+
+def test_matches_chained_outer_merge_without_duplicates():
+    rng = np.random.default_rng(0)
+    frames = []
+    for i, freq in enumerate(("5s", "7s", "1min")):
+        times = pd.date_range("2025-06-06", periods=40, freq=freq, tz="UTC")
+        frames.append(pd.DataFrame({"datetime": times, f"role{i}": rng.normal(size=len(times))}))
+
+    aligned = align_series(frames)
+    merged = reduce(lambda a, b: pd.merge(a, b, on="datetime", how="outer"), frames)
+    merged = merged.sort_values("datetime", ignore_index=True)
+
+    pd.testing.assert_frame_equal(aligned, merged, check_dtype=False)
+
+
+def test_duplicate_timestamps_within_a_frame_are_kept():
+    times = ["2025-06-06 00:00:00", "2025-06-06 00:00:05", "2025-06-06 00:00:05", "2025-06-06 00:00:10"]
+    aligned = align_series([_frame(times, "a", [1.0, 2.0, 3.0, 4.0])])
+
+    assert len(aligned) == 4
+    assert aligned["a"].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_duplicate_timestamps_pair_up_by_occurrence_across_frames():
+    left = _frame(["2025-06-06 00:00:05"] * 2, "a", [1.0, 2.0])
+    right = _frame(["2025-06-06 00:00:05"] * 3, "b", [10.0, 20.0, 30.0])
+
+    aligned = align_series([left, right])
+
+    assert len(aligned) == 3
+    assert aligned["a"].tolist()[:2] == [1.0, 2.0]
+    assert np.isnan(aligned["a"].iloc[2])
+    assert aligned["b"].tolist() == [10.0, 20.0, 30.0]
+
+
+def test_shared_column_fills_one_output_column_and_later_frame_wins():
+    first = _frame(["2025-06-06 00:00:00", "2025-06-06 00:00:05"], "drssi", [1.0, 2.0])
+    second = _frame(["2025-06-06 00:00:05", "2025-06-06 00:00:10"], "drssi", [20.0, 30.0])
+
+    aligned = align_series([first, second])
+
+    assert list(aligned.columns) == ["datetime", "drssi"]
+    assert aligned["drssi"].tolist() == [1.0, 20.0, 30.0]
+
+
+def test_tolerance_snaps_later_frames_onto_the_first():
+    anchor = _frame(["2025-06-06 00:00:00", "2025-06-06 00:01:00"], "a", [1.0, 2.0])
+    offset = _frame(["2025-06-06 00:00:02", "2025-06-06 00:00:40"], "b", [10.0, 20.0])
+
+    aligned = align_series([anchor, offset], tolerance="5s")
+
+    assert aligned["datetime"].tolist() == list(pd.to_datetime(
+        ["2025-06-06 00:00:00", "2025-06-06 00:00:40", "2025-06-06 00:01:00"]).tz_localize("UTC"))
+    assert aligned["b"].tolist()[0] == 10.0
+
+
+def test_keeps_first_frame_timezone_and_skips_empty_frames():
+    local = _frame(["2025-06-06 00:00:00"], "a", [1.0], tz="America/Chicago")
+
+    aligned = align_series([None, local.iloc[:0], local])
+
+    assert str(aligned["datetime"].dt.tz) == "America/Chicago"
+    assert aligned["datetime"].iloc[0] == local["datetime"].iloc[0]
+    assert align_series([None, local.iloc[:0]]) is None
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from scipy.signal import firwin
+
+from Codebase.SDRAnalysis.Analysis.channelize_peaks import channelize_peaks
+from Codebase.SDRAnalysis.Analysis.iter_channel_blocks import TAPS_PER_PHASE, channel_decimation
+from Codebase.SDRAnalysis.FileIO.hackrf_iq_capture import HackRFCapture
+
+SAMPLE_RATE = 2e6
+BANDWIDTH = 200_000
+OFFSETS = np.array([-450e3, 0.0, 125e3, 610e3])
+
+
+def _reference_channels(iq, sample_rate, offsets_hz, bandwidth_hz):
+    # Mix, filter with the full-rate FIR, then keep every decimation-th sample centred on the filter
+    decimation, _ = channel_decimation(sample_rate, bandwidth_hz)
+    taps = firwin(TAPS_PER_PHASE * decimation + 1, bandwidth_hz / 2, fs=sample_rate) if decimation > 1 else np.ones(1)
+    delay = (len(taps) - 1) // 2
+    n = np.arange(len(iq))
+    channels = []
+    for offset in offsets_hz:
+        mixed = iq.astype(np.complex128) * np.exp(-2j * np.pi * offset / sample_rate * n)
+        filtered = np.convolve(mixed, taps)
+        channels.append(filtered[delay::decimation][:-(-len(iq) // decimation)])
+    return np.array(channels)
+
+
+def _tones(n):
+    t = np.arange(n) / SAMPLE_RATE
+    rng = np.random.default_rng(0)
+    iq = sum(np.exp(2j * np.pi * f * t) for f in OFFSETS) + 0.1 * (rng.normal(size=n) + 1j * rng.normal(size=n))
+    return iq.astype(np.complex64)
+
+
+@pytest.mark.parametrize("block_size", [100, 1_000, 4_096, 1 << 20])
+def test_channels_match_mix_filter_decimate_reference(block_size):
+    iq = _tones(25_003)  # Not a multiple of the decimation: the last output covers a partial step
+
+    channels, channel_rate = channelize_peaks(iq, SAMPLE_RATE, OFFSETS, BANDWIDTH, block_size=block_size)
+    expected = _reference_channels(iq, SAMPLE_RATE, OFFSETS, BANDWIDTH)
+
+    assert channel_rate == SAMPLE_RATE / 10
+    assert channels.shape == expected.shape == (len(OFFSETS), 2_501)
+    np.testing.assert_allclose(channels, expected, atol=2e-4, rtol=1e-4)
+
+
+def test_each_channel_is_the_tone_at_its_offset_shifted_to_dc():
+    iq = _tones(40_000)
+
+    channels, _ = channelize_peaks(iq, SAMPLE_RATE, OFFSETS, BANDWIDTH)
+
+    # Away from the edges every channel holds its own tone, now a constant of magnitude ~1
+    steady = np.abs(channels[:, 200:-200])
+    assert np.all(np.abs(steady.mean(axis=1) - 1.0) < 0.05)
+
+
+def test_memory_mapped_capture_matches_in_memory_array(tmp_path):
+    raw = np.random.default_rng(3).integers(-128, 128, 2 * 12_345, dtype=np.int8)
+    raw.tofile(tmp_path / "capture.iq")
+    capture = HackRFCapture(tmp_path / "capture.iq", sample_rate=SAMPLE_RATE)
+
+    from_capture, _ = channelize_peaks(capture, SAMPLE_RATE, OFFSETS, BANDWIDTH, block_size=2_000)
+    from_array, _ = channelize_peaks(capture.read(), SAMPLE_RATE, OFFSETS, BANDWIDTH, block_size=2_000)
+
+    np.testing.assert_array_equal(from_capture, from_array)
+
+
+def test_bandwidth_at_sample_rate_passes_samples_through_mixed():
+    iq = _tones(1_000)
+
+    channels, channel_rate = channelize_peaks(iq, SAMPLE_RATE, [125e3], bandwidth_hz=SAMPLE_RATE)
+
+    assert channel_rate == SAMPLE_RATE
+    np.testing.assert_allclose(channels, _reference_channels(iq, SAMPLE_RATE, [125e3], SAMPLE_RATE), atol=1e-4)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from Codebase.DataManager.compact_series_store import CompactSeries, CompactSeriesStore
+
+
+def _frame(start, values, column):
+    return pd.DataFrame({
+        "datetime": pd.date_range(start, periods=len(values), freq="5s", tz="UTC"),
+        column: values,
+    })
+
+
+def test_frames_are_concatenated_and_sorted_once():
+    late = _frame("2025-06-07", [3.0, 4.0], "drssi")
+    early = _frame("2025-06-06", [1.0, 2.0], "drssi")
+
+    series = CompactSeries.from_frames([late, early], "drssi")
+
+    assert series.values.tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert np.all(np.diff(series.times) > 0)
+
+
+def test_sensor_readings_are_float32_but_counters_and_frequencies_keep_full_precision():
+    counts = [2**24 + 1, 2**31 + 3]
+    frequency = [491_000_001, 491_000_003]
+
+    assert CompactSeries.from_frames([_frame("2025-06-06", [-80.5, -81.0], "drssi")], "drssi").values.dtype == np.float32
+    for column, values in (("txcount", counts), ("frequency", frequency), ("node id", [16_777_217, 1])):
+        series = CompactSeries.from_frames([_frame("2025-06-06", values, column)], column)
+        assert series.values.dtype == np.float64
+        assert series.values.tolist() == values
+
+
+def test_store_merge_keeps_full_precision_and_windows_inclusively():
+    store = CompactSeriesStore()
+    key = ("tvws", "tvws_instance0", "dirt", "txcount")
+    store.put(*key, CompactSeries.from_frames([_frame("2025-06-06", [2**24 + 1], "txcount")], "txcount"))
+    other = CompactSeriesStore()
+    other.put(*key, CompactSeries.from_frames([_frame("2025-06-06 00:00:05", [2**24 + 3], "txcount")], "txcount"))
+
+    store.update(other)
+    merged = store.get(*key)
+
+    assert merged.values.tolist() == [2**24 + 1, 2**24 + 3]
+    window = merged.window(pd.Timestamp("2025-06-06 00:00:05", tz="UTC"), pd.Timestamp("2025-06-06 00:00:05", tz="UTC"))
+    assert window.values.tolist() == [2**24 + 3]
@@ -0,0 +1,80 @@
+from Codebase.DataManager.file_catalog import FileCatalog
+
+SOIL_CSV = (
+    "Instance,1\n"
+    "Depth,-3\n"
+    "Date (Year-Mon-Day),Time (Hour-Min-Sec),Soil Moisture Value,Soil Temperature (°C)\n"
+    "2025-06-06,00-00-00,512,21.5\n"
+)
+
+
+def _catalog(tmp_path, make_tvws_csv, tvws_names=(), soil_names=()):
+    data_folder = tmp_path / "Data"
+    for name in tvws_names:
+        make_tvws_csv(data_folder / "Train" / "TVWS" / name)
+    for name in soil_names:
+        path = data_folder / "Train" / "Soil" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(SOIL_CSV, encoding="utf-8")
+    catalog = FileCatalog(data_folder=data_folder, catalog_path=tmp_path / "catalog.json")
+    catalog.refresh()
+    return catalog
+
+
+def test_instance_is_the_token_after_the_prefix_not_a_date_part(tmp_path, make_tvws_csv):
+    catalog = _catalog(tmp_path, make_tvws_csv, tvws_names=(
+        "TVWSData_0_2025-06-06.csv", "TVWSData_2_2025-06-06.csv", "TVWSData_6_2025-06-07.csv"))
+
+    assert [p.name for p in catalog.find("tvws", 2)] == ["TVWSData_2_2025-06-06.csv"]
+    assert [p.name for p in catalog.find("tvws", 6)] == ["TVWSData_6_2025-06-07.csv"]
+    assert catalog.find("tvws", 2025) == []
+    assert catalog.get_entry(catalog.find("tvws", 0)[0])["instance_ids"] == [0]
+
+
+def test_depth_is_only_read_for_soil_files(tmp_path, make_tvws_csv):
+    catalog = _catalog(tmp_path, make_tvws_csv,
+                       tvws_names=("TVWSData_0_2025-06-06.csv",), soil_names=("SoilData_1_2025-06-06.csv",))
+
+    tvws = catalog.get_entry(catalog.find("tvws", 0)[0])
+    soil = catalog.get_entry(catalog.find("soil", 1)[0])
+
+    assert tvws["depth"] is None
+    assert tvws["special_value"] == "dirt"
+    assert soil["depth"] == "-3"
+    assert soil["special_value"] is None
+    assert catalog.special_values("tvws") == [(0, "dirt")]
+    assert catalog.special_values("soil") == [(1, "-3")]
+
+
+def test_special_value_needs_a_specialvalue_header(tmp_path, make_tvws_csv):
+    catalog = _catalog(tmp_path, make_tvws_csv, tvws_names=("TVWSData_0_2025-06-06.csv",))
+    path = catalog.find("tvws", 0)[0]
+    text = path.read_text(encoding="utf-8").replace("SpecialValue", "Extra", 1)
+    path.write_text(text, encoding="utf-8")
+    catalog.refresh()
+
+    assert catalog.get_entry(path)["special_value"] is None
+
+
+def test_refresh_only_reindexes_changed_files_and_persists(tmp_path, make_tvws_csv):
+    catalog = _catalog(tmp_path, make_tvws_csv, tvws_names=("TVWSData_0_2025-06-06.csv",))
+    catalog.save()
+
+    assert catalog.refresh() is False
+    reloaded = FileCatalog(data_folder=catalog.data_folder, catalog_path=catalog.catalog_path)
+    reloaded.load()
+    assert [p.name for p in reloaded.find("tvws", 0)] == ["TVWSData_0_2025-06-06.csv"]
+
+
+def test_entries_record_header_columns_and_data_type(tmp_path, make_tvws_csv):
+    catalog = _catalog(tmp_path, make_tvws_csv,
+                       tvws_names=("TVWSData_0_2025-06-06.csv",), soil_names=("SoilData_1_2025-06-06.csv",))
+
+    tvws = catalog.get_entry(catalog.find("tvws", 0)[0])
+    soil = catalog.get_entry(catalog.find("soil", 1)[0])
+
+    assert tvws["columns"][:3] == ["Date (Year-Mon-Day)", "Time (Hour-Min-Sec)", "DRSSI"]
+    assert tvws["data_type"] == "tvws"
+    assert soil["data_type"] == "soil"
+    assert tvws["schema"] != soil["schema"]
+    assert sorted(catalog.changed_paths) == sorted(str(p) for p in catalog.paths())
@@ -0,0 +1,110 @@
+import os
+
+import pandas as pd
+
+from Codebase.DataManager.Cache.get_cache_key import get_cache_key, get_path_hash
+from Codebase.DataManager.Cache.read_cached_frame import read_cached_frame
+from Codebase.DataManager.Cache.write_cached_frame import write_cached_frame
+from Codebase.DataManager.Processing.FileIO import load_csv_file as load_csv_file_module
+from Codebase.DataManager.Processing.FileIO.load_csv_file import load_csv_file
+
+
+def _touch_later(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def _count_parses(monkeypatch):
+    calls = []
+    parse = load_csv_file_module.parse_csv_file
+
+    def counting_parse(*args, **kwargs):
+        calls.append(args[0])
+        return parse(*args, **kwargs)
+
+    monkeypatch.setattr(load_csv_file_module, "parse_csv_file", counting_parse)
+    return calls
+
+
+def _parsed(n=5, offset=0.0):
+    return pd.DataFrame({
+        "datetime": pd.date_range("2025-06-06", periods=n, freq="5s", tz="UTC"),
+        "drssi": [-80.0 - i + offset for i in range(n)],
+        "txcount": list(range(n)),
+    })
+
+
+def test_cache_key_changes_with_mtime_but_keeps_path_hash(tmp_path, make_tvws_csv):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    before = get_cache_key(path)
+
+    _touch_later(path)
+    after = get_cache_key(path)
+
+    assert before != after
+    assert before.split("-")[0] == after.split("-")[0] == get_path_hash(path)
+
+
+def test_cached_frame_round_trips_requested_columns(tmp_path, cache_folder, make_tvws_csv):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    write_cached_frame(path, _parsed(), {"columns": ["drssi", "txcount"], "special_value": "dirt", "depth": None})
+
+    df, metadata = read_cached_frame(path, ["drssi"])
+
+    assert list(df.columns) == ["datetime", "drssi"]
+    assert df["drssi"].tolist() == _parsed()["drssi"].tolist()
+    assert str(df["datetime"].dt.tz) == "UTC"
+    assert metadata["special_value"] == "dirt"
+
+
+def test_modified_file_misses_and_rewrite_removes_stale_entry(tmp_path, cache_folder, make_tvws_csv):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    write_cached_frame(path, _parsed(), {"columns": ["drssi", "txcount"]})
+
+    make_tvws_csv(path, drssi_offset=-5.0)
+    _touch_later(path)
+    assert read_cached_frame(path, ["drssi"]) is None
+
+    write_cached_frame(path, _parsed(offset=-5.0), {"columns": ["drssi", "txcount"]})
+    df, _ = read_cached_frame(path, ["drssi"])
+
+    assert df["drssi"].tolist() == _parsed(offset=-5.0)["drssi"].tolist()
+    assert len(list((cache_folder / "Frames").glob("*.parquet"))) == 1
+
+
+def test_second_load_is_served_from_cache(tmp_path, cache_folder, make_tvws_csv, monkeypatch):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    parses = _count_parses(monkeypatch)
+
+    first, _ = load_csv_file(path, {"drssi"})
+    second, _ = load_csv_file(path, {"drssi"})
+
+    assert len(parses) == 1
+    assert first["drssi"].tolist() == second["drssi"].tolist()
+    assert len(list((cache_folder / "Frames").glob("*.parquet"))) == 1
+
+
+def test_modified_file_is_reparsed_and_stale_entry_removed(tmp_path, cache_folder, make_tvws_csv, monkeypatch):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    parses = _count_parses(monkeypatch)
+    original, _ = load_csv_file(path, {"drssi"})
+
+    make_tvws_csv(path, drssi_offset=-5.0)
+    _touch_later(path)
+    reloaded, _ = load_csv_file(path, {"drssi"})
+
+    assert len(parses) == 2
+    assert reloaded["drssi"].tolist() == [value - 5.0 for value in original["drssi"].tolist()]
+    assert len(list((cache_folder / "Frames").glob("*.parquet"))) == 1
+
+
+def test_wider_column_request_reparses_and_keeps_earlier_columns(tmp_path, cache_folder, make_tvws_csv, monkeypatch):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    parses = _count_parses(monkeypatch)
+
+    load_csv_file(path, {"drssi"})
+    load_csv_file(path, {"txcount"})
+    both, _ = load_csv_file(path, {"drssi", "txcount"})
+
+    assert len(parses) == 2
+    assert list(both.columns) == ["datetime", "drssi", "txcount"]
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+import scipy.signal as signal
+
+from Codebase.SDRAnalysis.iq_phase_extractor import get_instantaneous_phase, get_lowpass_sos, get_phases
+
+FS = 20_000.0
+FREQS = [1_000.0, 1_050.0, 3_000.0]
+
+
+def _reference_phases(iq, freqs, fs, decimation):
+    # One frequency at a time over the whole signal, as the extractor did before batching
+    n = np.arange(len(iq))
+    rows = []
+    for freq in freqs:
+        mixed = iq * np.exp(-2j * np.pi * freq / fs * n)
+        rows.append(np.angle(signal.sosfilt(get_lowpass_sos(), mixed))[::decimation])
+    return np.array(rows)
+
+
+def _tones(n):
+    t = np.arange(n) / FS
+    rng = np.random.default_rng(0)
+    noise = 0.05 * (rng.normal(size=n) + 1j * rng.normal(size=n))
+    return sum(np.exp(2j * np.pi * (f + 2.0) * t + 1j * k) for k, f in enumerate(FREQS)) + noise
+
+
+@pytest.mark.parametrize("block_samples", [50, 333, 4_096, 1 << 20])
+@pytest.mark.parametrize("decimation", [1, 7, 50])
+def test_batched_blocks_match_whole_signal_per_frequency(block_samples, decimation):
+    iq = _tones(12_345)
+
+    phases = get_phases(iq, FREQS, FS, decimation=decimation, block_samples=block_samples)
+    expected = _reference_phases(iq, FREQS, FS, decimation)
+
+    assert phases.shape == expected.shape == (len(FREQS), -(-len(iq) // decimation))
+    # Compare on the unit circle so a ±pi wrap is not a mismatch
+    np.testing.assert_allclose(np.exp(1j * phases), np.exp(1j * expected), atol=1e-6)
+
+
+def test_single_frequency_wrapper_and_empty_input():
+    iq = _tones(1_000)
+
+    np.testing.assert_allclose(get_instantaneous_phase(iq, FREQS[0], FS), get_phases(iq, FREQS[:1], FS, 1)[0])
+    assert get_phases(np.empty(0, dtype=np.complex64), FREQS, FS).shape == (len(FREQS), 0)
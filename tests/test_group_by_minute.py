@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from Codebase.SDRAnalysis.iq_phase_extractor import circular_mean_phase, group_by_minute
+
+FS = 10.0  # 600 samples per 60 s block
+
+
+def _blocks(phases, size):
+    return [phases[i:i + size] for i in range(0, len(phases), size)]
+
+
+def test_partial_trailing_block_is_kept_and_reduced_over_its_samples():
+    phases = np.random.default_rng(0).uniform(-np.pi, np.pi, 1_450)
+
+    grouped = group_by_minute(phases, FS, 60)
+
+    assert grouped["count"].tolist() == [600, 600, 250]
+    blocks = _blocks(phases, 600)
+    np.testing.assert_allclose(grouped["mean"], [b.mean() for b in blocks])
+    np.testing.assert_allclose(grouped["std"], [b.std() for b in blocks])
+    np.testing.assert_allclose(grouped["circular_mean"], [circular_mean_phase(b) for b in blocks])
+
+
+def test_circular_mean_does_not_collapse_across_the_wrap():
+    # Phases straddling ±pi average to ~pi circularly, but to ~0 linearly
+    phases = np.tile([np.pi - 0.05, -np.pi + 0.05], 600)
+
+    grouped = group_by_minute(phases, FS, 60)
+
+    assert np.allclose(np.abs(grouped["circular_mean"]), np.pi)
+    assert np.allclose(grouped["mean"], 0.0)
+
+
+def test_exact_multiple_has_no_trailing_block():
+    grouped = group_by_minute(np.zeros(1_200), FS, 60, ("count",))
+
+    assert list(grouped) == ["count"]
+    assert grouped["count"].tolist() == [600, 600]
+
+
+@pytest.mark.parametrize("n", [0, 1, 599])
+def test_short_inputs(n):
+    grouped = group_by_minute(np.full(n, 0.5), FS, 60)
+
+    assert len(grouped["circular_mean"]) == (1 if n else 0)
+    if n:
+        assert grouped["count"].tolist() == [n]
+        np.testing.assert_allclose(grouped["circular_mean"], [0.5])
+        np.testing.assert_allclose(grouped["std"], [0.0], atol=1e-12)
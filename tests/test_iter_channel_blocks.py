@@ -0,0 +1,43 @@
+import numpy as np
+
+from Codebase.SDRAnalysis.Analysis.iter_channel_blocks import channel_decimation, iter_channel_blocks
+from Codebase.SDRAnalysis.FileIO.hackrf_iq_capture import HackRFCapture
+
+SAMPLE_RATE = 2_000_000
+
+
+def _write_tone_capture(path, offset_hz, n_samples=200_000, amplitude=100):
+    n = np.arange(n_samples)
+    tone = amplitude * np.exp(2j * np.pi * offset_hz * n / SAMPLE_RATE)
+    pairs = np.empty((n_samples, 2), dtype=np.int8)
+    pairs[:, 0] = np.round(tone.real)
+    pairs[:, 1] = np.round(tone.imag)
+    pairs.tofile(path)
+    return HackRFCapture(path, sample_rate=SAMPLE_RATE)
+
+
+def _collect(capture, offsets, block_size):
+    blocks = list(iter_channel_blocks(capture, SAMPLE_RATE, offsets, 100_000, block_size))
+    assert [first for first, _ in blocks] == sorted(first for first, _ in blocks)
+    return np.concatenate([block for _, block in blocks], axis=1)
+
+
+def test_channels_do_not_depend_on_block_size(tmp_path):
+    capture = _write_tone_capture(tmp_path / "tone.iq", 300_000)
+
+    small = _collect(capture, [300_000, -500_000], block_size=4_096)
+    large = _collect(capture, [300_000, -500_000], block_size=2**20)
+
+    decimation, _ = channel_decimation(SAMPLE_RATE, 100_000)
+    assert small.shape == large.shape == (2, -(-len(capture) // decimation))
+    np.testing.assert_allclose(small, large, rtol=1e-4, atol=1e-3)
+
+
+def test_tone_passes_its_channel_and_is_rejected_elsewhere(tmp_path):
+    capture = _write_tone_capture(tmp_path / "tone.iq", 300_000)
+
+    channels = _collect(capture, [300_000, -500_000], block_size=16_384)
+    steady = np.abs(channels[:, 100:-100])
+
+    np.testing.assert_allclose(steady[0], 100, rtol=0.02)
+    assert steady[1].max() < 1.0
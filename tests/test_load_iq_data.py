@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from Codebase.SDRAnalysis import iq_phase_extractor
+from Codebase.SDRAnalysis.iq_phase_extractor import load_iq_data
+
+
+def _write_capture(path, n_samples):
+    raw = np.random.default_rng(0).integers(-128, 128, 2 * n_samples, dtype=np.int8)
+    raw.tofile(path)
+    return raw[0::2].astype(np.float64) + 1j * raw[1::2].astype(np.float64)
+
+
+@pytest.mark.parametrize("load_block", [100, 1_000, 1 << 22])
+def test_block_averages_are_continuous_and_time_ordered(tmp_path, monkeypatch, load_block):
+    # 10_050 samples at 1 % -> 100 averages of 100 samples; the trailing 50 are dropped
+    iq = _write_capture(tmp_path / "capture.iq", 10_050)
+    monkeypatch.setattr(iq_phase_extractor, "LOAD_BLOCK_SAMPLES", load_block)
+
+    loaded = load_iq_data(tmp_path / "capture.iq", 0.01)
+
+    assert loaded.dtype == np.complex64
+    np.testing.assert_allclose(loaded, iq[:10_000].reshape(-1, 100).mean(axis=1), rtol=1e-5, atol=1e-5)
+
+
+def test_block_size_not_a_multiple_of_the_step(tmp_path, monkeypatch):
+    iq = _write_capture(tmp_path / "capture.iq", 3_000)
+    monkeypatch.setattr(iq_phase_extractor, "LOAD_BLOCK_SAMPLES", 250)
+
+    loaded = load_iq_data(tmp_path / "capture.iq", 1 / 3)
+
+    np.testing.assert_allclose(loaded, iq.reshape(-1, 3).mean(axis=1), rtol=1e-5, atol=1e-5)
@@ -0,0 +1,143 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils import restore_loader as restore_loader_module
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.restore_loader import restore_loader
+from Codebase.Dashboard.SupportMethods.loaded_data_cache import LoadedDataCache
+from Codebase.DataManager.compact_series_store import CompactSeries, CompactSeriesStore
+
+
+def _series(n):
+    return CompactSeries(np.arange(n, dtype="int64"), np.zeros(n, dtype="float32"))
+
+
+def _touch_later(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+class FakeCatalog:
+    def __init__(self, paths):
+        self.paths = paths
+        self.windowed_calls = 0
+
+    def find(self, category, instance_id=None, start=None, end=None):
+        if start is not None or end is not None:
+            # The windowed list grows as file ranges get recorded; the cache must not depend on it
+            self.windowed_calls += 1
+            return self.paths[:self.windowed_calls]
+        return list(self.paths)
+
+
+class FakeLoader:
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.series = CompactSeriesStore()
+        self.loads = 0
+
+    def load_frames(self, csv_category, instance_id, set_of_columns, start=None, end=None):
+        self.loads += 1
+        return []
+
+    def compact_frames(self, category, instance_id, frames):
+        store = CompactSeriesStore()
+        store.put(category, f"{category}_instance{instance_id}", "dirt", "drssi", _series(4))
+        return store
+
+
+def _patch_loader(monkeypatch, paths):
+    loader = FakeLoader(FakeCatalog(paths))
+    cache = LoadedDataCache()
+    monkeypatch.setattr(restore_loader_module, "loader_from_store", lambda state: loader)
+    monkeypatch.setattr(restore_loader_module, "get_loaded_data_cache", lambda: cache)
+    return loader
+
+
+def test_get_returns_value_until_a_source_file_changes(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_text("x")
+    cache = LoadedDataCache()
+    cache.put("key", [path], _series(3))
+
+    assert cache.get("key", [path]) is not None
+    _touch_later(path)
+    assert cache.get("key", [path]) is None
+    assert cache.get("key", [path]) is None  # Dropped, not just skipped
+
+
+def test_new_source_file_invalidates_entry(tmp_path):
+    first, second = tmp_path / "a.csv", tmp_path / "b.csv"
+    first.write_text("x")
+    second.write_text("y")
+    cache = LoadedDataCache()
+    cache.put("key", [first], _series(3))
+
+    assert cache.get("key", [first, second]) is None
+
+
+def test_least_recently_used_entry_is_evicted_over_budget(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_text("x")
+    cache = LoadedDataCache(memory_budget_bytes=_series(10).nbytes * 2)
+    cache.put("old", [path], _series(10))
+    cache.put("recent", [path], _series(10))
+    cache.get("old", [path])
+    cache.put("new", [path], _series(10))
+
+    assert cache.get("recent", [path]) is None
+    assert cache.get("old", [path]) is not None
+    assert cache.get("new", [path]) is not None
+
+
+def test_entry_larger_than_budget_is_not_stored(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_text("x")
+    cache = LoadedDataCache(memory_budget_bytes=10)
+    cache.put("key", [path], _series(100))
+
+    assert cache.get("key", [path]) is None
+
+
+def test_windowed_restore_is_cached_while_file_ranges_fill_in(tmp_path, monkeypatch):
+    paths = [tmp_path / f"TVWSData_0_2025-06-0{day}.csv" for day in (6, 7, 8)]
+    for path in paths:
+        path.write_text("x")
+    loader = _patch_loader(monkeypatch, paths)
+    roles = [("tvws", "DRSSI", "0|dirt")]
+    start, end = pd.Timestamp("2025-06-07", tz="UTC"), pd.Timestamp("2025-06-08", tz="UTC")
+
+    for _ in range(3):
+        restore_loader({}, roles, start, end)
+
+    assert loader.loads == 1
+    assert len(loader.series) == 1
+
+
+def test_windowed_restore_reloads_when_any_instance_file_changes(tmp_path, monkeypatch):
+    paths = [tmp_path / f"TVWSData_0_2025-06-0{day}.csv" for day in (6, 7)]
+    for path in paths:
+        path.write_text("x")
+    loader = _patch_loader(monkeypatch, paths)
+    roles = [("tvws", "DRSSI", "0|dirt")]
+    start = pd.Timestamp("2025-06-07", tz="UTC")
+
+    restore_loader({}, roles, start, None)
+    _touch_later(paths[0])
+    restore_loader({}, roles, start, None)
+
+    assert loader.loads == 2
+
+
+def test_window_is_part_of_the_key(tmp_path, monkeypatch):
+    path = tmp_path / "TVWSData_0_2025-06-06.csv"
+    path.write_text("x")
+    loader = _patch_loader(monkeypatch, [path])
+    roles = [("tvws", "DRSSI", "0|dirt")]
+
+    restore_loader({}, roles, pd.Timestamp("2025-06-06", tz="UTC"), None)
+    restore_loader({}, roles, pd.Timestamp("2025-06-07", tz="UTC"), None)
+    restore_loader({}, roles, pd.Timestamp("2025-06-06", tz="UTC"), None)
+
+    assert loader.loads == 2
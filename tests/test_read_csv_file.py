@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from Codebase.DataManager.Processing.FileIO.iter_csv_file import iter_csv_file
+from Codebase.DataManager.Processing.FileIO.read_csv_file import read_csv_file
+from Codebase.DataManager.Processing.FileIO.scan_csv_preamble import keeps_full_precision
+
+
+def test_projection_reads_only_requested_and_datetime_columns(tmp_path, make_tvws_csv):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+
+    parsed = read_csv_file(path, columns={"drssi"})
+
+    assert list(parsed["df"].columns) == ["date (year-mon-day)", "time (hour-min-sec)", "drssi"]
+    assert parsed["df"]["drssi"].dtype == np.float32
+    assert parsed["special_value"] == "dirt"
+
+
+def _write_wide_values(path):
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    # 491000001 Hz and a counter past 2**24 are not representable in float32
+    lines[3] = lines[3].replace("491000000,0,0", f"491000001,0,{2**24 + 1}")
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def test_frequency_and_counters_keep_full_precision(tmp_path, make_tvws_csv):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    _write_wide_values(path)
+
+    df = read_csv_file(path, columns={"drssi", "frequency", "txcount", "rxcount"})["df"]
+
+    assert df["drssi"].dtype == np.float32
+    assert df["frequency"].iloc[0] == 491_000_001
+    assert df["rxcount"].iloc[0] == 2**24 + 1
+    assert df["frequency"].dtype.itemsize == df["rxcount"].dtype.itemsize == 8
+
+
+def test_full_precision_names_match_words_not_substrings_of_readings():
+    assert keeps_full_precision("frequency")
+    assert keeps_full_precision("txcount")
+    assert keeps_full_precision("node id")
+    assert not keeps_full_precision("humidity")
+    assert not keeps_full_precision("soil moisture value")
+
+
+def test_streamed_chunks_keep_full_precision(tmp_path, make_tvws_csv):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    _write_wide_values(path)
+
+    df = pd.concat(chunk for chunk, _ in iter_csv_file(path, {"drssi", "frequency", "rxcount"}, chunksize=4))
+
+    assert df["drssi"].dtype == np.float32
+    assert df["frequency"].iloc[0] == 491_000_001
+    assert df["rxcount"].iloc[0] == 2**24 + 1
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from Codebase.SDRAnalysis.Analysis.compute_signal_energy import compute_signal_energy
+from Codebase.SDRAnalysis.Analysis.fast_convolve import fast_convolve
+from Codebase.SDRAnalysis.Analysis.stream_signal_energy import stream_signal_energy
+
+SAMPLE_RATE = 100_000  # 1 ms window = 100 samples
+
+
+def _iq(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.normal(size=n) + 1j * rng.normal(size=n)).astype(np.complex64)
+
+
+def test_energy_matches_boxcar_convolution():
+    iq = _iq(5_000)
+    power = np.abs(iq.astype(np.complex128)) ** 2
+
+    np.testing.assert_allclose(
+        compute_signal_energy(iq, SAMPLE_RATE), np.convolve(power, np.ones(100), mode="valid"), rtol=1e-6)
+
+
+@pytest.mark.parametrize("block_size", [1, 50, 99, 100, 101, 1234, 100_000])
+def test_streamed_energy_matches_in_memory_energy(block_size):
+    iq = _iq(20_000)
+
+    streamed = stream_signal_energy(iq, SAMPLE_RATE, block_size=block_size)
+
+    np.testing.assert_allclose(streamed, compute_signal_energy(iq, SAMPLE_RATE), rtol=1e-5)
+
+
+def test_streamed_energy_fills_a_preallocated_output():
+    iq = _iq(2_000)
+    out = np.zeros(len(iq) - 100 + 1, dtype=np.float32)
+
+    streamed = stream_signal_energy(iq, SAMPLE_RATE, block_size=300, out=out)
+
+    assert np.shares_memory(streamed, out)
+    np.testing.assert_allclose(out, compute_signal_energy(iq, SAMPLE_RATE), rtol=1e-5)
+
+
+def test_streamed_energy_shorter_than_window_is_empty():
+    assert len(stream_signal_energy(_iq(50), SAMPLE_RATE, block_size=10)) == 0
+
+
+@pytest.mark.parametrize("n_signal, n_kernel", [(1_000, 5), (200_000, 2_000), (3_000, 2_000)])
+def test_fast_convolve_matches_numpy_for_every_method(n_signal, n_kernel):
+    rng = np.random.default_rng(2)
+    signal, kernel = rng.normal(size=n_signal), rng.normal(size=n_kernel)
+
+    for mode in ("valid", "full"):
+        np.testing.assert_allclose(
+            fast_convolve(signal, kernel, mode=mode), np.convolve(signal, kernel, mode=mode), atol=1e-8)
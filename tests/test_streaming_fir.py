@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from scipy.signal import correlate
+
+from Codebase.SDRAnalysis.Analysis.stream_correlation import stream_correlation
+from Codebase.SDRAnalysis.Analysis.streaming_fir import StreamingFIR
+from Codebase.SDRAnalysis.FileIO.hackrf_iq_capture import HackRFCapture
+
+
+def _write_capture(path, n_samples, seed=0):
+    raw = np.random.default_rng(seed).integers(-128, 128, 2 * n_samples, dtype=np.int8)
+    raw.tofile(path)
+    return raw[0::2].astype(np.float32) + 1j * raw[1::2].astype(np.float32)
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 63, 64, 65, 1000, 5000])
+def test_streaming_fir_matches_valid_convolution(block_size):
+    rng = np.random.default_rng(1)
+    signal = rng.normal(size=3000)
+    taps = rng.normal(size=64)
+
+    fir = StreamingFIR(taps)
+    out = np.concatenate([fir.process(signal[i:i + block_size]) for i in range(0, len(signal), block_size)])
+
+    np.testing.assert_allclose(out, np.convolve(signal, taps, mode="valid"), rtol=1e-9, atol=1e-9)
+
+
+def test_streaming_fir_reset_forgets_history():
+    fir = StreamingFIR(np.ones(4))
+    fir.process(np.ones(10))
+    fir.reset()
+
+    assert len(fir.process(np.ones(3))) == 0
+    np.testing.assert_allclose(fir.process(np.ones(2)), [4.0, 4.0])
+
+
+def test_capture_blocks_overlap_and_cover_the_file(tmp_path):
+    expected = _write_capture(tmp_path / "capture.iq", 1000)
+    capture = HackRFCapture(tmp_path / "capture.iq", sample_rate=1e3)
+
+    blocks = list(capture.iter_blocks(300, overlap=10))
+
+    assert [start for start, _ in blocks] == [0, 290, 590, 890]
+    np.testing.assert_array_equal(np.concatenate([blocks[0][1]] + [b[10:] for _, b in blocks[1:]]), expected)
+    np.testing.assert_array_equal(capture.time_slice(0.25, 0.5), expected[250:500])
+
+
+@pytest.mark.parametrize("block_size", [100, 999, 4096, 100_000])
+def test_stream_correlation_matches_in_memory_correlation(tmp_path, block_size):
+    iq = _write_capture(tmp_path / "capture.iq", 20_000)
+    pulse = iq[5_000:5_500]
+    capture = HackRFCapture(tmp_path / "capture.iq", sample_rate=2e6)
+
+    streamed = stream_correlation(capture, pulse, block_size=block_size)
+    expected = correlate(np.abs(iq), np.abs(pulse), mode="valid")
+
+    assert len(streamed) == len(expected)
+    np.testing.assert_allclose(streamed, expected, rtol=1e-5)
@@ -0,0 +1,112 @@
+import pandas as pd
+import pytest
+
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils import compute_data_time_range as compute_data_time_range_module
+from Codebase.Dashboard.Pages.SimplePlot.Callbacks.PlotUtils.compute_data_time_range import compute_data_time_range
+from Codebase.DataManager.Processing.FileIO.load_csv_file import load_csv_file
+from Codebase.DataManager.file_catalog import FileCatalog
+
+START = pd.Timestamp("2025-06-06 00:00:10", tz="UTC")
+END = pd.Timestamp("2025-06-06 00:00:30", tz="UTC")
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_window_bounds_are_inclusive(tmp_path, cache_folder, make_tvws_csv, cached):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    if cached:
+        load_csv_file(path, {"drssi"})  # Later read goes through the Parquet row filter
+
+    df, _ = load_csv_file(path, {"drssi"}, start=START, end=END)
+
+    assert df["datetime"].min() == START
+    assert df["datetime"].max() == END
+    assert len(df) == 5
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_open_sided_windows(tmp_path, cache_folder, make_tvws_csv, cached):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    if cached:
+        load_csv_file(path, {"drssi"})
+
+    after, _ = load_csv_file(path, {"drssi"}, start=END)
+    before, _ = load_csv_file(path, {"drssi"}, end=START)
+
+    assert after["datetime"].tolist() == list(pd.date_range(END, periods=4, freq="5s"))
+    assert before["datetime"].tolist() == list(pd.date_range(pd.Timestamp("2025-06-06", tz="UTC"), START, freq="5s"))
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_empty_window_keeps_whole_file_range_in_metadata(tmp_path, cache_folder, make_tvws_csv, cached):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv")
+    if cached:
+        load_csv_file(path, {"drssi"})
+
+    df, metadata = load_csv_file(path, {"drssi"}, start=pd.Timestamp("2025-06-07", tz="UTC"))
+
+    assert df is None
+    assert pd.Timestamp(metadata["start"]) == pd.Timestamp("2025-06-06 00:00:00", tz="UTC")
+    assert pd.Timestamp(metadata["end"]) == pd.Timestamp("2025-06-06 00:00:45", tz="UTC")
+
+
+def _catalog_with_days(tmp_path, make_tvws_csv, days):
+    data_folder = tmp_path / "Data"
+    for day in days:
+        make_tvws_csv(data_folder / "Train" / "TVWS" / f"TVWSData_0_2025-06-0{day}.csv", start=f"2025-06-0{day}")
+    catalog = FileCatalog(data_folder=data_folder, catalog_path=tmp_path / "catalog.json")
+    catalog.refresh()
+    return catalog
+
+
+def test_catalog_window_drops_only_files_entirely_outside(tmp_path, make_tvws_csv):
+    catalog = _catalog_with_days(tmp_path, make_tvws_csv, (6, 7, 8))
+    for day in (6, 7, 8):
+        path = catalog.find("tvws", 0)[day - 6]
+        catalog.record_time_range(path, f"2025-06-0{day}T00:00:00+00:00", f"2025-06-0{day}T23:59:55+00:00")
+
+    # Touching a file's first or last timestamp is enough to keep it
+    names = [p.name for p in catalog.find("tvws", 0, "2025-06-06 23:59:55", "2025-06-08 00:00:00")]
+
+    assert names == ["TVWSData_0_2025-06-06.csv", "TVWSData_0_2025-06-07.csv", "TVWSData_0_2025-06-08.csv"]
+    names = [p.name for p in catalog.find("tvws", 0, "2025-06-07 00:00:00", "2025-06-07 12:00:00")]
+    assert names == ["TVWSData_0_2025-06-07.csv"]
+
+
+def test_catalog_window_keeps_files_without_a_recorded_range(tmp_path, make_tvws_csv):
+    catalog = _catalog_with_days(tmp_path, make_tvws_csv, (6, 7))
+    catalog.record_time_range(catalog.find("tvws", 0)[0], "2025-06-06T00:00:00+00:00", "2025-06-06T23:59:55+00:00")
+
+    names = [p.name for p in catalog.find("tvws", 0, "2025-06-10", None)]
+
+    assert names == ["TVWSData_0_2025-06-07.csv"]
+
+
+def test_catalog_window_treats_naive_bounds_as_utc(tmp_path, make_tvws_csv):
+    catalog = _catalog_with_days(tmp_path, make_tvws_csv, (6,))
+    path = catalog.find("tvws", 0)[0]
+    catalog.record_time_range(path, "2025-06-06T00:00:00+00:00", "2025-06-06T23:59:55+00:00")
+
+    assert catalog.find("tvws", 0, None, pd.Timestamp("2025-06-06 00:00:00")) == [path]
+    assert catalog.find("tvws", 0, None, pd.Timestamp("2025-06-06 01:00:00", tz="Etc/GMT-2")) == []
+
+
+def test_sync_range_comes_from_catalog_extent_not_loaded_window(tmp_path, make_tvws_csv, monkeypatch):
+    catalog = _catalog_with_days(tmp_path, make_tvws_csv, (6, 7, 8))
+    for day, path in zip((6, 7, 8), catalog.find("tvws", 0)):
+        catalog.record_time_range(path, f"2025-06-0{day}T00:00:00+00:00", f"2025-06-0{day}T23:59:55+00:00")
+    monkeypatch.setattr(compute_data_time_range_module, "get_file_catalog", lambda: catalog)
+    # Rows loaded for a 06-07 window padded by a day
+    windowed = pd.DataFrame({"datetime": pd.date_range("2025-06-07", "2025-06-08", freq="1h", tz="UTC")})
+
+    assert compute_data_time_range("tvws", "0|dirt", windowed) == {"min": "2025-06-06", "max": "2025-06-08"}
+    assert catalog.time_extent("tvws", 0) == (pd.Timestamp("2025-06-06", tz="UTC"),
+                                              pd.Timestamp("2025-06-08 23:59:55", tz="UTC"))
+
+
+def test_sync_range_falls_back_to_frame_without_recorded_ranges(tmp_path, make_tvws_csv, monkeypatch):
+    catalog = _catalog_with_days(tmp_path, make_tvws_csv, (6,))
+    monkeypatch.setattr(compute_data_time_range_module, "get_file_catalog", lambda: catalog)
+    df = pd.DataFrame({"datetime": pd.date_range("2025-06-06", periods=3, freq="1D", tz="UTC")})
+
+    assert catalog.time_extent("tvws", 0) is None
+    assert compute_data_time_range("tvws", "0|dirt", df) == {"min": "2025-06-06", "max": "2025-06-08"}
@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from Codebase.DataManager.Cache.read_cached_frame import read_cached_frame
+from Codebase.DataManager.Cache.write_atomically import write_atomically
+from Codebase.DataManager.Cache.write_cached_frame import write_cached_frame
+from Codebase.DataManager.Processing.FileIO.parse_csv_file import parse_csv_file
+
+
+def test_failed_write_leaves_target_untouched_and_no_temp_file(tmp_path):
+    target = tmp_path / "entry.json"
+    target.write_text("old")
+
+    def failing_write(path):
+        path.write_text("half")
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        write_atomically(target, failing_write)
+
+    assert target.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["entry.json"]
+
+
+def test_concurrent_cache_writers_never_expose_a_partial_frame(tmp_path, cache_folder, make_tvws_csv, capsys):
+    path = make_tvws_csv(tmp_path / "TVWSData_0_2025-06-06.csv", periods=20_000)
+    df, metadata = parse_csv_file(path)
+    write_cached_frame(path, df, metadata)
+    stop = threading.Event()
+
+    def writer():
+        while not stop.is_set():
+            write_cached_frame(path, df, metadata)
+
+    threads = [threading.Thread(target=writer) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(30):
+            cached = read_cached_frame(path, ["drssi"])
+            assert cached is not None and len(cached[0]) == len(df)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert "[WARN]" not in capsys.readouterr().out
+    assert sorted(p.suffix for p in (cache_folder / "Frames").iterdir()) == [".json", ".parquet"]